@@ -0,0 +1,231 @@
+import difflib
+import hashlib
+import logging
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .database import db
+from .models import Company, Diff, PageSnapshot, Signal, SignalSeverity, SignalType, VendorWatch
+
+logger = logging.getLogger(__name__)
+
+# Cap on changed lines kept per section in Diff.diff_json
+MAX_DIFF_LINES = 50
+
+HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+PRICE_RE = re.compile(r"[$€£]\s?\d|\d+(\.\d+)?\s?(/|per\s)(mo|month|year|yr|user|seat)", re.IGNORECASE)
+SECURITY_RE = re.compile(r"\b(cve-\d{4}-\d+|critical|vulnerabilit(y|ies)|exploit|breach|patch(ed)?)\b", re.IGNORECASE)
+
+SECTION_SIGNAL_TYPES = {
+    "pricing": SignalType.PRICING_CHANGE,
+    "changelog": SignalType.PRODUCT_UPDATE,
+    "security": SignalType.SECURITY_UPDATE
+}
+
+def watch_urls(company: Company, watch: VendorWatch) -> List[str]:
+    """Every page a vendor watch covers: each company domain joined with each include path"""
+    urls = []
+    for domain in company.domains:
+        host = domain.replace("https://", "").replace("http://", "").rstrip("/")
+        for path in watch.include_paths:
+            urls.append(f"https://{host}/{path.lstrip('/')}")
+    return urls
+
+def page_section(url: str) -> str:
+    """Classify a watched page as pricing, changelog, security or other from its path"""
+    path = url.lower()
+    if "pricing" in path or "plans" in path:
+        return "pricing"
+    if any(key in path for key in ("release-notes", "changelog", "releases", "updates")):
+        return "changelog"
+    if "security" in path or "trust" in path:
+        return "security"
+    return "other"
+
+def normalize_text(text: str) -> str:
+    # Whitespace-only edits (re-rendered markup, trailing spaces) are not changes
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+def split_sections(text: str) -> List[Tuple[str, List[str]]]:
+    """Split normalized markdown into (heading path, lines) pairs; leading text gets heading ''.
+
+    A heading's path includes its parent headings ("v1.2 > Bug fixes"), so
+    sections repeated under each release of a changelog stay distinct.
+    """
+    sections: List[Tuple[str, List[str]]] = [("", [])]
+    parents: List[Tuple[int, str]] = []
+    for line in normalize_text(text).split("\n"):
+        match = HEADING_RE.match(line)
+        if match:
+            level = len(match.group(1))
+            parents = [(l, title) for l, title in parents if l < level] + [(level, match.group(2))]
+            sections.append((" > ".join(title for _, title in parents), []))
+        elif line:
+            sections[-1][1].append(line)
+    return [(heading, lines) for heading, lines in sections if heading or lines]
+
+def keyed_sections(text: str) -> Dict[Tuple[str, int], List[str]]:
+    # A heading path can still repeat (two "Bug fixes" under one release), so count occurrences too
+    occurrences: Counter = Counter()
+    keyed = {}
+    for heading, lines in split_sections(text):
+        keyed[(heading, occurrences[heading])] = lines
+        occurrences[heading] += 1
+    return keyed
+
+def token_diff(old_line: str, new_line: str) -> Dict[str, List[str]]:
+    old_tokens, new_tokens = old_line.split(), new_line.split()
+    added, removed = [], []
+    for op, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False).get_opcodes():
+        if op in ("replace", "delete"):
+            removed.extend(old_tokens[i1:i2])
+        if op in ("replace", "insert"):
+            added.extend(new_tokens[j1:j2])
+    return {"added": added, "removed": removed}
+
+def diff_section(old_lines: List[str], new_lines: List[str]) -> Dict[str, Any]:
+    added, removed, token_changes = [], [], []
+    for op, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False).get_opcodes():
+        if op == "equal":
+            continue
+        removed.extend(old_lines[i1:i2])
+        added.extend(new_lines[j1:j2])
+        if op == "replace":
+            # Pair up rewritten lines so small edits (a price, a version) show at token level
+            for old_line, new_line in zip(old_lines[i1:i2], new_lines[j1:j2]):
+                token_changes.append(token_diff(old_line, new_line))
+    return {"added": added, "removed": removed, "token_changes": token_changes}
+
+def compute_diff(old_text: str, new_text: str) -> Dict[str, Any]:
+    """Section-aware line diff with token-level detail for rewritten lines"""
+    old_sections = keyed_sections(old_text)
+    new_sections = keyed_sections(new_text)
+    sections = []
+    lines_added = lines_removed = 0
+    for key in list(new_sections) + [k for k in old_sections if k not in new_sections]:
+        old_lines, new_lines = old_sections.get(key), new_sections.get(key)
+        # A bare heading (e.g. a new release's version line) has no lines of its own to report
+        if (old_lines or []) == (new_lines or []):
+            continue
+        change = diff_section(old_lines or [], new_lines or [])
+        lines_added += len(change["added"])
+        lines_removed += len(change["removed"])
+        sections.append({
+            "section": key[0],
+            "change": "added" if old_lines is None else "removed" if new_lines is None else "modified",
+            "added": change["added"][:MAX_DIFF_LINES],
+            "removed": change["removed"][:MAX_DIFF_LINES],
+            "token_changes": change["token_changes"][:MAX_DIFF_LINES]
+        })
+    total_lines = max(1, sum(len(lines) for lines in old_sections.values()))
+    return {
+        "sections": sections,
+        "lines_added": lines_added,
+        "lines_removed": lines_removed,
+        "change_ratio": round((lines_added + lines_removed) / total_lines, 4)
+    }
+
+def diff_severity(section: str, diff_json: Dict[str, Any]) -> SignalSeverity:
+    changed_text = " ".join(
+        line for s in diff_json["sections"] for line in s["added"] + s["removed"]
+    )
+    if section == "pricing" and PRICE_RE.search(changed_text):
+        return SignalSeverity.HIGH
+    if section == "security" and SECURITY_RE.search(changed_text):
+        return SignalSeverity.HIGH
+    if diff_json["change_ratio"] >= 0.3:
+        return SignalSeverity.HIGH
+    if diff_json["change_ratio"] >= 0.05 or section in ("pricing", "security"):
+        return SignalSeverity.MEDIUM
+    return SignalSeverity.LOW
+
+def record_page(company: Company, url: str, text: str, title: Optional[str] = None) -> Dict[str, Any]:
+    """Snapshot a fetched page and diff it against the previous snapshot.
+
+    Unchanged pages are detected by comparing content hashes with the
+    latest snapshot (an O(1) lookup) and are not stored again.
+    """
+    new_hash = content_hash(text)
+    previous = db.get_latest_snapshot(company.id, url)
+    if previous is not None and previous.content_hash == new_hash:
+        return {"url": url, "status": "unchanged"}
+
+    snapshot = db.create_page_snapshot(PageSnapshot(
+        company_id=company.id,
+        url=url,
+        content_hash=new_hash,
+        fetched_at=datetime.utcnow(),
+        text_md=text,
+        summary_json={"title": title or "", "length": len(text)}
+    ))
+    section = page_section(url)
+    if previous is None:
+        return {"url": url, "status": "new", "section": section, "snapshot_id": snapshot.id}
+
+    diff_json = compute_diff(previous.text_md, text)
+    diff_json["url"] = url
+    severity = diff_severity(section, diff_json)
+    diff = db.create_diff(Diff(
+        snapshot_id_old=previous.id,
+        snapshot_id_new=snapshot.id,
+        diff_json=diff_json,
+        severity=severity,
+        section=section
+    ))
+    return {
+        "url": url,
+        "status": "changed",
+        "section": section,
+        "severity": severity,
+        "snapshot_id": snapshot.id,
+        "diff_id": diff.id,
+        "diff": diff_json
+    }
+
+async def detect_page_changes(exa, company: Company, watch: VendorWatch) -> List[Dict[str, Any]]:
+    """Fetch every watched page in one /contents call and snapshot/diff each one.
+
+    Pages are always fetched live, past both our response cache and Exa's
+    own crawl cache, so a cached copy can never hide a change or be
+    snapshotted as current during an outage.
+    """
+    urls = watch_urls(company, watch)
+    if not urls:
+        return []
+    contents = await exa.get_contents(ids=urls, text=True, livecrawl="always", fresh=True)
+    pages = []
+    for result in contents.get("results", []):
+        url = result.get("url") or result.get("id")
+        text = result.get("text") or ""
+        if not url or not text:
+            continue
+        pages.append(record_page(company, url, text, result.get("title")))
+    logger.debug(
+        "Page changes for %s: %s",
+        company.name, {page["url"]: page["status"] for page in pages}
+    )
+    return pages
+
+def signal_from_change(company: Company, change: Dict[str, Any]) -> Signal:
+    """Build a Signal describing a diffed page"""
+    diff_json = change["diff"]
+    headings = [s["section"] for s in diff_json["sections"] if s["section"]]
+    where = f" in {', '.join(headings[:3])}" if headings else ""
+    return Signal(
+        company_id=company.id,
+        type=SECTION_SIGNAL_TYPES.get(change["section"], SignalType.PRODUCT_UPDATE),
+        title=f"{company.name} {change['section']} page changed",
+        summary=(
+            f"{diff_json['lines_added']} lines added and {diff_json['lines_removed']} removed{where} "
+            f"on {change['url']}"
+        ),
+        severity=change["severity"],
+        confidence=0.9,
+        urls=[change["url"]],
+        citations=[line for s in diff_json["sections"] for line in s["added"]][:5]
+    )
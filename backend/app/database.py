@@ -1,8 +1,78 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+import bisect
 import hashlib
 import json
-from .models import Company, VendorWatch, PageSnapshot, Diff, Signal, Report, TearSheet, SourcesConfiguration, SettingsConfiguration, CompetitivePositioningCache
+from .models import Company, VendorWatch, PageSnapshot, Diff, Signal, SignalType, SignalSeverity, Report, TearSheet, SourcesConfiguration, SettingsConfiguration, CompetitivePositioningCache, WatchlistJob
+
+# (created_at, id): the sort key of every keyset-paginated table
+PageKey = Tuple[datetime, int]
+
+class KeysetIndex:
+    """Sorted (created_at, id) keys for one table, overall and per value of each filter field.
+
+    Pages are read newest first by bisecting one key list, so a page costs
+    O(log n + page size) when at most one equality filter is given; further
+    filters are checked while walking the most selective list. Keys whose
+    record has been removed from the table are skipped.
+    """
+
+    def __init__(self, fields: Tuple[str, ...] = ()):
+        self.fields = fields
+        self._all: List[PageKey] = []
+        self._by_field: Dict[str, Dict[Any, List[PageKey]]] = {field: {} for field in fields}
+
+    def add(self, record: Any) -> None:
+        key = (record.created_at, record.id)
+        bisect.insort(self._all, key)
+        for field in self.fields:
+            bisect.insort(self._by_field[field].setdefault(getattr(record, field), []), key)
+
+    def page(
+        self,
+        table: Dict[int, Any],
+        filters: Optional[Dict[str, Any]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        after_key: Optional[PageKey] = None
+    ) -> Tuple[List[Any], Optional[PageKey], int]:
+        """(records newest first, key to continue after or None, total matches ignoring the cursor).
+
+        ``created_after`` is inclusive and ``created_before`` exclusive.
+        """
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+        keys = min(
+            (self._by_field[field].get(value, []) for field, value in filters.items()),
+            key=len,
+            default=self._all
+        )
+        lo = bisect.bisect_left(keys, (created_after, 0)) if created_after else 0
+        hi = bisect.bisect_left(keys, (created_before, 0)) if created_before else len(keys)
+
+        def matches(record: Any) -> bool:
+            return all(getattr(record, field) == value for field, value in filters.items())
+
+        # A bisection counts the range unless several filters apply or records were dropped from the table
+        if len(filters) <= 1 and len(table) >= len(self._all):
+            total = hi - lo
+        else:
+            total = sum(1 for _, record_id in keys[lo:hi] if record_id in table and matches(table[record_id]))
+
+        end = min(hi, bisect.bisect_left(keys, after_key)) if after_key else hi
+        records = []
+        index = end - 1
+        while index >= lo and (limit is None or len(records) < limit):
+            record = table.get(keys[index][1])
+            if record is not None and matches(record):
+                records.append(record)
+            index -= 1
+        # Only hand out a cursor if another match actually follows
+        more = any(
+            keys[i][1] in table and matches(table[keys[i][1]]) for i in range(index, lo - 1, -1)
+        ) if limit is not None and len(records) == limit else False
+        next_key = (records[-1].created_at, records[-1].id) if more else None
+        return records, next_key, total
 
 class InMemoryDatabase:
     def __init__(self):
@@ -16,6 +86,8 @@ class InMemoryDatabase:
         self.sources_configurations: Dict[int, SourcesConfiguration] = {}
         self.settings_configurations: Dict[int, SettingsConfiguration] = {}
         self.competitive_positioning_cache: Dict[int, CompetitivePositioningCache] = {}
+        self.watchlist_jobs: Dict[str, WatchlistJob] = {}
+        self.watchlist_job_results: Dict[str, List[Dict[str, Any]]] = {}
         
         self._company_counter = 1
         self._vendor_watch_counter = 1
@@ -28,11 +100,31 @@ class InMemoryDatabase:
         self._settings_config_counter = 1
         self._competitive_positioning_cache_counter = 1
 
+        # Bumped on every settings write so readers can tell when to rebuild
+        # anything derived from settings (e.g. the memoized Exa client)
+        self.settings_version = 0
+        # Bumped on every company write, for indexes derived from the watchlist
+        self.companies_version = 0
+        self._latest_settings_id: Optional[int] = None
+
+        # (company_id, url) -> id of the newest snapshot, so change detection
+        # can compare content hashes without scanning every snapshot
+        self._latest_snapshot_ids: Dict[Tuple[int, str], int] = {}
+        # company_id -> id of the newest tear-sheet
+        self._latest_tearsheet_ids: Dict[int, int] = {}
+        # (company_id, cache_key) -> competitive positioning cache id
+        self._competitive_positioning_ids: Dict[Tuple[int, str], int] = {}
+        # Newest-first keyset pages for the list endpoints
+        self._signal_index = KeysetIndex(("company_id", "type", "severity"))
+        self._report_index = KeysetIndex()
+        self._tearsheet_index = KeysetIndex(("company_id",))
+
     def create_company(self, company: Company) -> Company:
         company.id = self._company_counter
         company.created_at = datetime.utcnow()
         self.companies[self._company_counter] = company
         self._company_counter += 1
+        self.companies_version += 1
         return company
 
     def get_company(self, company_id: int) -> Optional[Company]:
@@ -44,6 +136,7 @@ class InMemoryDatabase:
     def update_company(self, company: Company) -> Company:
         if company.id and company.id in self.companies:
             self.companies[company.id] = company
+            self.companies_version += 1
             return company
         else:
             raise ValueError(f"Company with id {company.id} not found")
@@ -65,35 +158,74 @@ class InMemoryDatabase:
         snapshot.id = self._page_snapshot_counter
         self.page_snapshots[self._page_snapshot_counter] = snapshot
         self._page_snapshot_counter += 1
+        key = (snapshot.company_id, snapshot.url)
+        latest_id = self._latest_snapshot_ids.get(key)
+        if latest_id is None or self.page_snapshots[latest_id].fetched_at <= snapshot.fetched_at:
+            self._latest_snapshot_ids[key] = snapshot.id
         return snapshot
 
+    def get_page_snapshot(self, snapshot_id: int) -> Optional[PageSnapshot]:
+        return self.page_snapshots.get(snapshot_id)
+
     def get_latest_snapshot(self, company_id: int, url: str) -> Optional[PageSnapshot]:
-        snapshots = [s for s in self.page_snapshots.values() 
-                    if s.company_id == company_id and s.url == url]
-        return max(snapshots, key=lambda x: x.fetched_at) if snapshots else None
+        latest_id = self._latest_snapshot_ids.get((company_id, url))
+        return self.page_snapshots.get(latest_id) if latest_id is not None else None
+
+    def create_diff(self, diff: Diff) -> Diff:
+        diff.id = self._diff_counter
+        self.diffs[self._diff_counter] = diff
+        self._diff_counter += 1
+        return diff
+
+    def list_diffs(self, company_id: Optional[int] = None) -> List[Diff]:
+        diffs = sorted(self.diffs.values(), key=lambda x: x.id, reverse=True)
+        if company_id:
+            diffs = [d for d in diffs if self.page_snapshots[d.snapshot_id_new].company_id == company_id]
+        return diffs
 
     def create_signal(self, signal: Signal) -> Signal:
         signal.id = self._signal_counter
         signal.created_at = datetime.utcnow()
         self.signals[self._signal_counter] = signal
         self._signal_counter += 1
+        self._signal_index.add(signal)
         return signal
 
-    def list_signals(self, company_id: Optional[int] = None) -> List[Signal]:
-        signals = list(self.signals.values())
-        if company_id:
-            signals = [s for s in signals if s.company_id == company_id]
-        return sorted(signals, key=lambda x: x.created_at or datetime.min, reverse=True)
+    def list_signals(self, company_id: Optional[int] = None, created_after: Optional[datetime] = None) -> List[Signal]:
+        return self.page_signals(company_id=company_id, created_after=created_after)[0]
+
+    def page_signals(
+        self,
+        company_id: Optional[int] = None,
+        type: Optional[SignalType] = None,
+        severity: Optional[SignalSeverity] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        after_key: Optional[PageKey] = None
+    ) -> Tuple[List[Signal], Optional[PageKey], int]:
+        filters = {"company_id": company_id, "type": type, "severity": severity}
+        return self._signal_index.page(self.signals, filters, created_after, created_before, limit, after_key)
 
     def create_report(self, report: Report) -> Report:
         report.id = self._report_counter
         report.created_at = datetime.utcnow()
         self.reports[self._report_counter] = report
         self._report_counter += 1
+        self._report_index.add(report)
         return report
 
     def list_reports(self) -> List[Report]:
-        return sorted(self.reports.values(), key=lambda x: x.created_at or datetime.min, reverse=True)
+        return self.page_reports()[0]
+
+    def page_reports(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        after_key: Optional[PageKey] = None
+    ) -> Tuple[List[Report], Optional[PageKey], int]:
+        return self._report_index.page(self.reports, None, created_after, created_before, limit, after_key)
 
     def get_signals(self) -> List[Signal]:
         return sorted(self.signals.values(), key=lambda x: x.created_at or datetime.min, reverse=True)
@@ -103,8 +235,16 @@ class InMemoryDatabase:
         tearsheet.created_at = datetime.utcnow()
         self.tearsheets[self._tearsheet_counter] = tearsheet
         self._tearsheet_counter += 1
+        self._tearsheet_index.add(tearsheet)
+        latest = self.get_latest_tearsheet(tearsheet.company_id)
+        if latest is None or latest.generated_at <= tearsheet.generated_at:
+            self._latest_tearsheet_ids[tearsheet.company_id] = tearsheet.id
         return tearsheet
 
+    def get_latest_tearsheet(self, company_id: int) -> Optional[TearSheet]:
+        latest_id = self._latest_tearsheet_ids.get(company_id)
+        return self.tearsheets.get(latest_id) if latest_id is not None else None
+
     def get_tearsheet(self, tearsheet_id: int) -> Optional[TearSheet]:
         return self.tearsheets.get(tearsheet_id)
 
@@ -112,7 +252,18 @@ class InMemoryDatabase:
         return [t for t in self.tearsheets.values() if t.company_id == company_id]
 
     def list_tearsheets(self) -> List[TearSheet]:
-        return sorted(self.tearsheets.values(), key=lambda x: x.created_at or datetime.min, reverse=True)
+        return self.page_tearsheets()[0]
+
+    def page_tearsheets(
+        self,
+        company_id: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        after_key: Optional[PageKey] = None
+    ) -> Tuple[List[TearSheet], Optional[PageKey], int]:
+        filters = {"company_id": company_id}
+        return self._tearsheet_index.page(self.tearsheets, filters, created_after, created_before, limit, after_key)
 
     def create_sources_configuration(self, config: SourcesConfiguration) -> SourcesConfiguration:
         config.id = self._sources_config_counter
@@ -141,22 +292,26 @@ class InMemoryDatabase:
         config.created_at = datetime.utcnow()
         config.updated_at = datetime.utcnow()
         self.settings_configurations[self._settings_config_counter] = config
+        self._latest_settings_id = self._settings_config_counter
         self._settings_config_counter += 1
+        self.settings_version += 1
         return config
 
     def update_settings_configuration(self, config: SettingsConfiguration) -> SettingsConfiguration:
         if config.id in self.settings_configurations:
             config.updated_at = datetime.utcnow()
             self.settings_configurations[config.id] = config
+            self.settings_version += 1
         return config
 
     def get_settings_configuration(self, config_id: int = 1) -> Optional[SettingsConfiguration]:
         return self.settings_configurations.get(config_id)
 
     def get_latest_settings_configuration(self) -> Optional[SettingsConfiguration]:
-        if not self.settings_configurations:
+        # Configurations are only ever appended, so the newest one is the last created
+        if self._latest_settings_id is None:
             return None
-        return max(self.settings_configurations.values(), key=lambda x: x.created_at or datetime.min)
+        return self.settings_configurations.get(self._latest_settings_id)
 
     # Competitive Positioning Cache methods
     def create_competitive_positioning_cache(self, cache: CompetitivePositioningCache) -> CompetitivePositioningCache:
@@ -164,15 +319,17 @@ class InMemoryDatabase:
         cache.created_at = datetime.utcnow()
         cache.updated_at = datetime.utcnow()
         self.competitive_positioning_cache[self._competitive_positioning_cache_counter] = cache
+        self._competitive_positioning_ids[(cache.company_id, cache.cache_key)] = cache.id
         self._competitive_positioning_cache_counter += 1
         return cache
 
-    def get_competitive_positioning_cache(self, company_id: int, cache_key: str) -> Optional[CompetitivePositioningCache]:
+    def get_competitive_positioning_cache(self, company_id: int, cache_key: str, include_expired: bool = False) -> Optional[CompetitivePositioningCache]:
         """Get cached data for a company with a specific cache key"""
-        for cache in self.competitive_positioning_cache.values():
-            if cache.company_id == company_id and cache.cache_key == cache_key and cache.expires_at > datetime.utcnow():
-                return cache
-        return None
+        cache_id = self._competitive_positioning_ids.get((company_id, cache_key))
+        cache = self.competitive_positioning_cache.get(cache_id) if cache_id is not None else None
+        if cache is None or (not include_expired and cache.expires_at <= datetime.utcnow()):
+            return None
+        return cache
 
     def get_valid_competitive_positioning_cache(self, company_id: int) -> Optional[CompetitivePositioningCache]:
         """Get any valid cached data for a company (regardless of cache key)"""
@@ -198,7 +355,9 @@ class InMemoryDatabase:
             if cache.expires_at <= now
         ]
         for cache_id in expired_ids:
-            del self.competitive_positioning_cache[cache_id]
+            cache = self.competitive_positioning_cache.pop(cache_id)
+            if self._competitive_positioning_ids.get((cache.company_id, cache.cache_key)) == cache_id:
+                del self._competitive_positioning_ids[(cache.company_id, cache.cache_key)]
         return len(expired_ids)
 
     def list_competitive_positioning_cache(self, company_id: Optional[int] = None) -> List[CompetitivePositioningCache]:
@@ -207,4 +366,34 @@ class InMemoryDatabase:
             return list(self.competitive_positioning_cache.values())
         return [cache for cache in self.competitive_positioning_cache.values() if cache.company_id == company_id]
 
+    # Watchlist job methods
+    def create_watchlist_job(self, job: WatchlistJob) -> WatchlistJob:
+        job.created_at = datetime.utcnow()
+        self.watchlist_jobs[job.id] = job
+        return job
+
+    def get_watchlist_job(self, job_id: str) -> Optional[WatchlistJob]:
+        return self.watchlist_jobs.get(job_id)
+
+    def list_watchlist_jobs(self) -> List[WatchlistJob]:
+        return sorted(self.watchlist_jobs.values(), key=lambda x: x.created_at or datetime.min, reverse=True)
+
+    def save_watchlist_job_results(self, job_id: str, results: List[Dict[str, Any]]) -> None:
+        self.watchlist_job_results[job_id] = results
+
+    def get_watchlist_job_results(self, job_id: str) -> Optional[List[Dict[str, Any]]]:
+        return self.watchlist_job_results.get(job_id)
+
+    def prune_watchlist_jobs(self, keep: int) -> int:
+        """Delete finished jobs and their results beyond the ``keep`` most recently finished; returns count deleted"""
+        finished = sorted(
+            (job for job in self.watchlist_jobs.values() if job.finished_at is not None),
+            key=lambda x: x.finished_at,
+            reverse=True
+        )
+        for job in finished[keep:]:
+            del self.watchlist_jobs[job.id]
+            self.watchlist_job_results.pop(job.id, None)
+        return len(finished[keep:])
+
 db = InMemoryDatabase()
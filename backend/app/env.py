@@ -0,0 +1,23 @@
+import os
+from typing import Dict
+
+def env_flag(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+def env_per_endpoint(prefix: str, suffix: str, defaults: Dict[str, float]) -> Dict[str, float]:
+    """Read ``{prefix}_{ENDPOINT}_{suffix}`` overrides for each endpoint default"""
+    return {
+        endpoint: env_float(f"{prefix}_{endpoint.upper()}_{suffix}", default)
+        for endpoint, default in defaults.items()
+    }
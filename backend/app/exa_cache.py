@@ -0,0 +1,218 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .env import env_flag, env_int, env_per_endpoint
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live per Exa endpoint, in seconds
+DEFAULT_TTLS = {
+    "search": 6 * 3600,
+    "contents": 3600,
+    "answer": 6 * 3600
+}
+
+# Payload fields that callers build from datetime.utcnow(); only the day is
+# significant for Exa, so the key ignores the time-of-day part.
+DATE_FIELDS = ("startPublishedDate", "endPublishedDate")
+
+class ExaResponseCache:
+    """Content-addressed cache for Exa responses.
+
+    Entries are keyed by a SHA-256 of the canonical JSON request payload and
+    kept in an in-memory LRU tier, with an optional on-disk tier (one JSON
+    file per key) that survives restarts. The disk tier holds the same keys
+    as the memory tier: evicted entries lose their file too, and on startup
+    the newest ``max_entries`` files are loaded and the rest deleted. Values
+    are stored serialized so callers can mutate what they get back without
+    corrupting the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttls: Optional[Dict[str, float]] = None,
+        disk_dir: Optional[str] = None,
+        enabled: bool = True
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.disk_dir = disk_dir
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.endpoint_stats: Dict[str, Dict[str, int]] = {
+            endpoint: {"hits": 0, "misses": 0} for endpoint in self.ttls
+        }
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._load_disk_tier()
+
+    @classmethod
+    def from_env(cls) -> "ExaResponseCache":
+        return cls(
+            max_entries=env_int("EXA_CACHE_MAX_ENTRIES", 2048),
+            ttls=env_per_endpoint("EXA_CACHE", "TTL", DEFAULT_TTLS),
+            disk_dir=os.getenv("EXA_CACHE_DIR") or None,
+            enabled=env_flag("EXA_CACHE_ENABLED", True)
+        )
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict[str, Any]) -> str:
+        canonical = dict(payload)
+        for field in DATE_FIELDS:
+            if isinstance(canonical.get(field), str):
+                canonical[field] = canonical[field][:10]
+        blob = json.dumps({"endpoint": endpoint, "payload": canonical}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _record(self, endpoint: str, outcome: str) -> None:
+        self.endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})[outcome] += 1
+
+    def _store(self, key: str, expires_at: float, body: str) -> None:
+        self._entries[key] = (expires_at, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._remove_file(evicted)
+            self.evictions += 1
+
+    def _remove_file(self, key: str) -> None:
+        if not self.disk_dir:
+            return
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+    def _load_disk_tier(self) -> None:
+        files = []
+        for name in os.listdir(self.disk_dir):
+            path = os.path.join(self.disk_dir, name)
+            try:
+                if name.endswith(".json"):
+                    files.append((os.path.getmtime(path), name[:-len(".json")]))
+                elif name.endswith(".json.tmp"):
+                    os.remove(path)
+            except OSError:
+                pass
+        loaded = []
+        for _, key in sorted(files, reverse=True):
+            entry = self._load_from_disk(key) if len(loaded) < self.max_entries else None
+            if entry is None:
+                self._remove_file(key)
+            else:
+                loaded.append((key, entry))
+        # Oldest first, so the LRU order matches when the files were written
+        for key, entry in reversed(loaded):
+            self._entries[key] = entry
+
+    def _load_from_disk(self, key: str) -> Optional[Tuple[float, str]]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key)) as f:
+                record = json.load(f)
+            return record["expires_at"], record["body"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _lookup(self, key: str) -> Optional[Tuple[float, str]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        entry = self._load_from_disk(key)
+        if entry is not None:
+            self.disk_hits += 1
+            self._store(key, *entry)
+        return entry
+
+    def get(self, endpoint: str, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        entry = self._lookup(key)
+        # Expired entries stay put until evicted or overwritten so get_stale()
+        # can still serve them while Exa is unavailable
+        if entry is None or entry[0] <= time.time():
+            self.misses += 1
+            self._record(endpoint, "misses")
+            return None
+        self.hits += 1
+        self._record(endpoint, "hits")
+        return json.loads(entry[1])
+
+    def get_stale(self, endpoint: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry even if its TTL has passed, for degraded operation"""
+        if not self.enabled:
+            return None
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        self.stale_hits += 1
+        return json.loads(entry[1])
+
+    def set(self, endpoint: str, key: str, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.time() + self.ttls.get(endpoint, DEFAULT_TTLS["search"])
+        body = json.dumps(value)
+        self._store(key, expires_at, body)
+        if self.disk_dir:
+            tmp_path = self._disk_path(key) + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump({"endpoint": endpoint, "expires_at": expires_at, "body": body}, f)
+                os.replace(tmp_path, self._disk_path(key))
+            except OSError as e:
+                logger.warning("Could not write Exa cache entry to disk: %s", e)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._remove_file(key)
+
+    def clear(self) -> int:
+        """Drop every entry from both tiers and return how many were in memory"""
+        count = len(self._entries)
+        self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.disk_dir, name))
+                    except OSError:
+                        pass
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "ttls": self.ttls,
+            "disk_dir": self.disk_dir,
+            "endpoints": self.endpoint_stats
+        }
+
+response_cache = ExaResponseCache.from_env()
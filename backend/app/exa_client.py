@@ -1,19 +1,215 @@
+import asyncio
 import httpx
+import importlib.util
 import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
+import logging
+
+from .env import env_flag, env_float, env_int, env_per_endpoint
+from .exa_cache import ExaResponseCache, response_cache
+from .fixtures import FixtureStore, fixture_recorder
+from .log import preview
+from .rate_limiter import ExaRateLimiter, rate_limiter
+from .resilience import (
+    RETRYABLE_STATUS_CODES, CircuitBreaker, CircuitOpenError, RetryPolicy,
+    circuit_breaker, parse_retry_after, retry_policy
+)
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.exa.ai"
+
+# Per-endpoint read timeouts in seconds; /contents and /answer do crawling and
+# LLM work upstream so they get more headroom than /search.
+DEFAULT_TIMEOUTS = {
+    "search": 30.0,
+    "contents": 60.0,
+    "answer": 60.0
+}
+
+class ExaHTTPPool:
+    """App-lifetime httpx connection pool shared by every ExaClient.
+
+    Keeps TCP/TLS connections alive between Exa calls instead of paying the
+    handshake on every request. HTTP/2 is used when enabled and the optional
+    ``h2`` package is installed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 10.0,
+        http2: bool = False
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.connect_timeout = connect_timeout
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.warning("EXA_HTTP2 is enabled but the 'h2' package is not installed, using HTTP/1.1")
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_env(cls) -> "ExaHTTPPool":
+        return cls(
+            max_connections=env_int("EXA_MAX_CONNECTIONS", 100),
+            max_keepalive_connections=env_int("EXA_MAX_KEEPALIVE_CONNECTIONS", 20),
+            keepalive_expiry=env_float("EXA_KEEPALIVE_EXPIRY", 30.0),
+            connect_timeout=env_float("EXA_CONNECT_TIMEOUT", 10.0),
+            http2=env_flag("EXA_HTTP2")
+        )
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed
+
+    def open(self) -> httpx.AsyncClient:
+        """Create the underlying client if it is not already open"""
+        if not self.is_open:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=httpx.Timeout(DEFAULT_TIMEOUTS["search"], connect=self.connect_timeout)
+            )
+        return self._client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Opened lazily so scripts that never run the FastAPI lifecycle still work
+        return self.open()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+http_pool = ExaHTTPPool.from_env()
+
+# Identical Exa requests issued concurrently share a single upstream call
+exa_flight = SingleFlight("exa")
 
 class ExaClient:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        pool: Optional[ExaHTTPPool] = None,
+        cache: Optional[ExaResponseCache] = None,
+        limiter: Optional[ExaRateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        recorder: Optional[FixtureStore] = None
+    ):
         self.api_key = api_key
-        self.base_url = "https://api.exa.ai"
+        self.base_url = (base_url or os.getenv("EXA_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        self.timeouts = env_per_endpoint("EXA", "TIMEOUT", DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.pool = pool or http_pool
+        self.cache = cache or response_cache
+        self.limiter = limiter or rate_limiter
+        self.retry = retry or retry_policy
+        self.breaker = breaker or circuit_breaker
+        self.recorder = recorder or fixture_recorder
         self.headers = {
             "accept": "application/json",
             "content-type": "application/json",
             "x-api-key": api_key
         }
 
+    def _timeout(self, endpoint: str) -> httpx.Timeout:
+        return httpx.Timeout(self.timeouts[endpoint], connect=self.pool.connect_timeout)
+
+    async def _post(self, endpoint: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST a payload to an Exa endpoint over the shared connection pool"""
+        return await self.pool.client.post(
+            f"{self.base_url}/{endpoint}",
+            headers=self.headers,
+            json=payload,
+            timeout=self._timeout(endpoint)
+        )
+
+    async def _send(self, endpoint: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST with jittered retries on transient errors, guarded by the circuit breaker"""
+        for attempt in range(self.retry.max_attempts):
+            last_attempt = attempt == self.retry.max_attempts - 1
+            self.breaker.before_call()
+            try:
+                async with self.limiter.slot(endpoint):
+                    response = await self._post(endpoint, payload)
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if last_attempt:
+                    raise
+                delay = self.retry.backoff(attempt)
+                logger.info("Exa %s transport error (%r), retrying in %.2fs", endpoint, e, delay)
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.breaker.record_success()
+                    return response
+                # 429 means Exa is up but throttling us, so it does not count against the breaker
+                if response.status_code == 429:
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+                if last_attempt:
+                    return response
+                delay = self.retry.backoff(attempt, parse_retry_after(response.headers.get("retry-after")))
+                logger.info("Exa %s returned %s, retrying in %.2fs", endpoint, response.status_code, delay)
+            await asyncio.sleep(delay)
+
+    async def _fetch(self, endpoint: str, key: str, payload: Dict[str, Any], fresh: bool = False) -> str:
+        try:
+            response = await self._send(endpoint, payload)
+            logger.debug("Exa %s response status: %s", endpoint, response.status_code)
+            if response.status_code != 200:
+                logger.warning("Exa %s returned %s: %s", endpoint, response.status_code, preview(response.text))
+            response.raise_for_status()
+        except (CircuitOpenError, httpx.HTTPError) as e:
+            if fresh:
+                raise
+            # Degrade to an expired cached copy rather than failing the caller
+            stale = self.cache.get_stale(endpoint, key)
+            if stale is None:
+                raise
+            logger.warning("Serving stale Exa %s response after error: %s", endpoint, e)
+            return json.dumps(stale)
+        data = response.json()
+        self.cache.set(endpoint, key, data)
+        if self.recorder is not None:
+            try:
+                self.recorder.save(endpoint, key, payload, data)
+            except OSError as e:
+                logger.warning("Could not record Exa %s fixture: %s", endpoint, e)
+        return response.text
+
+    async def _request(self, endpoint: str, payload: Dict[str, Any], fresh: bool = False) -> Dict[str, Any]:
+        """Serve an Exa call from the response cache, falling back to the API.
+
+        ``fresh`` always calls the API and fails instead of serving an
+        expired copy; the response still refreshes the cache.
+        """
+        key = self.cache.make_key(endpoint, payload)
+        if not fresh:
+            cached = self.cache.get(endpoint, key)
+            if cached is not None:
+                return cached
+
+        # Each caller parses its own copy of the shared body so results can be mutated safely.
+        # Fresh calls coalesce separately so they never share a fetch that may serve stale data.
+        flight_key = f"{key}:fresh" if fresh else key
+        body = await exa_flight.do(flight_key, lambda: self._fetch(endpoint, key, payload, fresh))
+        return json.loads(body)
+
     async def search(
         self,
         query: str,
@@ -49,21 +245,9 @@ class ExaClient:
         if category:
             payload["category"] = category
 
-        print(f"DEBUG: Exa search payload: {json.dumps(payload, indent=2)}")
-        print(f"DEBUG: Exa search headers: {self.headers}")
+        logger.debug("Exa search payload: %s", preview(payload))
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/search",
-                headers=self.headers,
-                json=payload,
-                timeout=30.0
-            )
-            print(f"DEBUG: Exa search response status: {response.status_code}")
-            if response.status_code != 200:
-                print(f"DEBUG: Exa search response text: {response.text}")
-            response.raise_for_status()
-            return response.json()
+        return await self._request("search", payload)
 
     async def get_contents(
         self,
@@ -73,9 +257,10 @@ class ExaClient:
         summary: Optional[Dict[str, Any]] = None,
         livecrawl: str = "fallback",
         subpages: Optional[int] = None,
-        subpage_target: Optional[List[str]] = None
+        subpage_target: Optional[List[str]] = None,
+        fresh: bool = False
     ) -> Dict[str, Any]:
-        """Get contents for URLs using Exa API"""
+        """Get contents for URLs using Exa API; ``fresh`` bypasses the response cache"""
         payload = {
             "ids": ids,
             "text": text,
@@ -91,15 +276,7 @@ class ExaClient:
         if subpage_target:
             payload["subpageTarget"] = subpage_target
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/contents",
-                headers=self.headers,
-                json=payload,
-                timeout=60.0
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request("contents", payload, fresh=fresh)
 
     async def answer(
         self,
@@ -114,42 +291,50 @@ class ExaClient:
             "text": text
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/answer",
-                headers=self.headers,
-                json=payload,
-                timeout=60.0
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request("answer", payload)
 
-exa_client = None
+exa_client: Optional[ExaClient] = None
+_clients_by_key: Dict[str, ExaClient] = {}
+_client_settings_version: Optional[int] = None
 
-def get_exa_client() -> ExaClient:
-    global exa_client
-    
+def _resolve_api_key() -> Optional[str]:
     # Import here to avoid circular imports
     from .database import db
-    
+
     # Try to get API key from settings first
-    api_key = None
     try:
         settings_config = db.get_latest_settings_configuration()
         if settings_config and settings_config.api_keys and settings_config.api_keys.get("exa_api_key"):
-            api_key = settings_config.api_keys["exa_api_key"]
-            print(f"DEBUG: Using API key from settings")
+            return settings_config.api_keys["exa_api_key"]
     except Exception as e:
-        print(f"DEBUG: Error getting API key from settings: {e}")
-    
+        logger.warning("Error getting API key from settings: %s", e)
+
     # Fall back to environment variable if no settings API key
-    if not api_key:
-        api_key = os.getenv("EXA_API_KEY")
-        print(f"DEBUG: Using API key from environment variable")
-    
+    return os.getenv("EXA_API_KEY")
+
+def get_exa_client() -> ExaClient:
+    """Return the ExaClient for the current API key.
+
+    The key is only re-resolved when the settings version changes, and
+    clients are memoized per key so switching keys swaps the module-level
+    reference in one assignment.
+    """
+    global exa_client, _client_settings_version
+
+    from .database import db
+
+    version = db.settings_version
+    if exa_client is not None and version == _client_settings_version:
+        return exa_client
+
+    api_key = _resolve_api_key()
     if not api_key:
         raise ValueError("EXA_API_KEY not found in settings or environment variable")
-    
-    # Create new client instance (don't cache since settings might change)
-    exa_client = ExaClient(api_key)
+
+    client = _clients_by_key.get(api_key)
+    if client is None:
+        client = ExaClient(api_key)
+        _clients_by_key[api_key] = client
+    exa_client = client
+    _client_settings_version = version
     return exa_client
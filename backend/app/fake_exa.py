@@ -0,0 +1,178 @@
+"""
+Local stand-in for the Exa API, for deterministic offline benchmarking.
+
+Replays fixtures captured with EXA_RECORD_DIR and synthesizes stable
+responses for requests that were never recorded. Latency, error rate and
+throughput are shaped by a profile:
+
+    FAKE_EXA_FIXTURES=fixtures/exa FAKE_EXA_PROFILE=realistic \\
+        uvicorn app.fake_exa:app --port 8001
+    EXA_BASE_URL=http://localhost:8001 uvicorn app.main:app
+"""
+
+import asyncio
+import hashlib
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .env import env_float, env_flag
+from .exa_cache import ExaResponseCache
+from .fixtures import FixtureStore
+
+# latency_ms / jitter_ms: per-request delay; error_rate: share of 503s;
+# max_rps: above this the server answers 429 with Retry-After
+PROFILES: Dict[str, Dict[str, float]] = {
+    "instant": {"latency_ms": 0, "jitter_ms": 0, "error_rate": 0.0, "max_rps": 0},
+    "fast": {"latency_ms": 20, "jitter_ms": 5, "error_rate": 0.0, "max_rps": 0},
+    "realistic": {"latency_ms": 600, "jitter_ms": 300, "error_rate": 0.0, "max_rps": 0},
+    "flaky": {"latency_ms": 600, "jitter_ms": 300, "error_rate": 0.1, "max_rps": 0},
+    "throttled": {"latency_ms": 300, "jitter_ms": 100, "error_rate": 0.0, "max_rps": 5}
+}
+
+class FakeExaProfile:
+    def __init__(self, latency_ms: float, jitter_ms: float, error_rate: float, max_rps: float, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.max_rps = max_rps
+        self.random = random.Random(seed)
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    @classmethod
+    def from_env(cls) -> "FakeExaProfile":
+        base = PROFILES[os.getenv("FAKE_EXA_PROFILE", "fast")]
+        seed = os.getenv("FAKE_EXA_SEED")
+        return cls(
+            latency_ms=env_float("FAKE_EXA_LATENCY_MS", base["latency_ms"]),
+            jitter_ms=env_float("FAKE_EXA_JITTER_MS", base["jitter_ms"]),
+            error_rate=env_float("FAKE_EXA_ERROR_RATE", base["error_rate"]),
+            max_rps=env_float("FAKE_EXA_MAX_RPS", base["max_rps"]),
+            seed=int(seed) if seed else None
+        )
+
+    def delay(self) -> float:
+        jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def throttled(self) -> bool:
+        if self.max_rps <= 0:
+            return False
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        return self._window_count > self.max_rps
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and self.random.random() < self.error_rate
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()[:12]
+
+def synthesize(endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a stable, plausible response for a request with no recording"""
+    if endpoint == "search":
+        query = payload.get("query", "")
+        domains = payload.get("includeDomains") or ["example.com"]
+        published = payload.get("startPublishedDate") or (datetime.utcnow() - timedelta(days=14)).isoformat()
+        results = []
+        for i in range(int(payload.get("numResults", 10))):
+            token = _digest(query, i)
+            results.append({
+                "id": f"https://{domains[i % len(domains)]}/fake/{token}",
+                "url": f"https://{domains[i % len(domains)]}/fake/{token}",
+                "title": f"{query} ({token})",
+                "publishedDate": published[:10] + "T00:00:00.000Z",
+                "author": None,
+                "snippet": f"Synthetic result {i + 1} for '{query}'",
+                "score": round(1.0 - i * 0.05, 2)
+            })
+        return {"requestId": _digest("search", query), "results": results}
+
+    if endpoint == "contents":
+        return {
+            "requestId": _digest("contents", *payload.get("ids", [])),
+            "results": [
+                {"id": url, "url": url, "title": f"Page {url}", "text": f"# {url}\n\nSynthetic content for {url}."}
+                for url in payload.get("ids", [])
+            ]
+        }
+
+    urls = payload.get("urls") or []
+    return {
+        "requestId": _digest("answer", payload.get("query", "")),
+        "answer": f"Synthetic answer drawn from {len(urls)} sources.",
+        "citations": [{"id": url, "url": url, "title": f"Source {url}", "snippet": "Synthetic citation"} for url in urls[:5]],
+        "costDollars": {"total": 0}
+    }
+
+def create_app(fixtures: Optional[FixtureStore] = None, profile: Optional[FakeExaProfile] = None) -> FastAPI:
+    fake = FastAPI(title="Fake Exa API", description="Record/replay stand-in for api.exa.ai")
+    fake.state.fixtures = fixtures
+    fake.state.profile = profile or FakeExaProfile.from_env()
+    fake.state.synthesize_missing = env_flag("FAKE_EXA_SYNTHESIZE", True)
+    fake.state.stats = {}
+
+    def count(endpoint: str, outcome: str) -> None:
+        endpoint_stats = fake.state.stats.setdefault(endpoint, {"requests": 0, "replayed": 0, "synthesized": 0, "missing": 0, "errors": 0, "throttled": 0})
+        endpoint_stats[outcome] += 1
+
+    async def handle(endpoint: str, request: Request) -> JSONResponse:
+        payload = await request.json()
+        profile: FakeExaProfile = fake.state.profile
+        count(endpoint, "requests")
+
+        if profile.throttled():
+            count(endpoint, "throttled")
+            return JSONResponse({"error": "rate limit exceeded"}, status_code=429, headers={"retry-after": "1"})
+
+        await asyncio.sleep(profile.delay())
+
+        if profile.should_fail():
+            count(endpoint, "errors")
+            return JSONResponse({"error": "injected failure"}, status_code=503, headers={"retry-after": "0"})
+
+        key = ExaResponseCache.make_key(endpoint, payload)
+        recorded = fake.state.fixtures.load(endpoint, key) if fake.state.fixtures else None
+        if recorded is not None:
+            count(endpoint, "replayed")
+            return JSONResponse(recorded)
+        if not fake.state.synthesize_missing:
+            count(endpoint, "missing")
+            return JSONResponse({"error": f"no fixture for {endpoint} request {key}"}, status_code=404)
+        count(endpoint, "synthesized")
+        return JSONResponse(synthesize(endpoint, payload))
+
+    @fake.post("/search")
+    async def search(request: Request):
+        return await handle("search", request)
+
+    @fake.post("/contents")
+    async def contents(request: Request):
+        return await handle("contents", request)
+
+    @fake.post("/answer")
+    async def answer(request: Request):
+        return await handle("answer", request)
+
+    @fake.get("/_stats")
+    async def stats():
+        """Requests served per endpoint, for benchmarks to count upstream calls"""
+        return fake.state.stats
+
+    @fake.post("/_reset")
+    async def reset():
+        fake.state.stats = {}
+        return {"status": "ok"}
+
+    return fake
+
+app = create_app(FixtureStore(os.environ["FAKE_EXA_FIXTURES"]) if os.getenv("FAKE_EXA_FIXTURES") else None)
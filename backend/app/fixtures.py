@@ -0,0 +1,52 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+class FixtureStore:
+    """Directory of recorded Exa exchanges, one JSON file per request.
+
+    Files live at ``<root>/<endpoint>/<key>.json`` where ``key`` is the same
+    canonical payload hash the response cache uses, so a replay server can
+    find the recording for any request the backend sends.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, endpoint: str, key: str) -> str:
+        return os.path.join(self.root, endpoint, f"{key}.json")
+
+    def save(self, endpoint: str, key: str, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
+        path = self.path(endpoint, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        record = {
+            "endpoint": endpoint,
+            "request": payload,
+            "response": response,
+            "recorded_at": datetime.utcnow().isoformat()
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def load(self, endpoint: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path(endpoint, key)) as f:
+                return json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def count(self) -> Dict[str, int]:
+        counts = {}
+        if not os.path.isdir(self.root):
+            return counts
+        for endpoint in os.listdir(self.root):
+            endpoint_dir = os.path.join(self.root, endpoint)
+            if os.path.isdir(endpoint_dir):
+                counts[endpoint] = len([n for n in os.listdir(endpoint_dir) if n.endswith(".json")])
+        return counts
+
+# Set EXA_RECORD_DIR to capture every real Exa exchange for offline replay
+fixture_recorder = FixtureStore(os.environ["EXA_RECORD_DIR"]) if os.getenv("EXA_RECORD_DIR") else None
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+class HedgedExecutor:
+    """Run prioritized fallback attempts speculatively with staggered starts.
+
+    Attempt ``i`` starts ``i * stagger`` seconds after the first, or as soon
+    as every attempt started before it has finished without success. The
+    result is the highest-priority successful attempt, exactly as if they
+    had been tried one after another; a lower-priority success only wins
+    once every attempt ahead of it has failed. Anything still running when
+    the winner is known is cancelled.
+    """
+
+    def __init__(self, name: str, stagger: float):
+        self.name = name
+        self.stagger = stagger
+        self.runs = 0
+        self.launched = 0
+        self.cancelled = 0
+        self.wins: Dict[int, int] = {}
+
+    async def first_success(
+        self,
+        attempts: Sequence[Callable[[], Awaitable[Any]]],
+        is_success: Callable[[Any], bool] = bool
+    ) -> Tuple[Optional[int], Any]:
+        """(index, result) of the highest-priority successful attempt, or (None, None)"""
+        loop = asyncio.get_running_loop()
+        tasks: List[asyncio.Task] = []
+        results: Dict[int, Any] = {}
+        self.runs += 1
+
+        def launch() -> None:
+            tasks.append(asyncio.ensure_future(attempts[len(tasks)]()))
+            self.launched += 1
+
+        launch()
+        next_launch_at = loop.time() + self.stagger
+        try:
+            while True:
+                for index, task in enumerate(tasks):
+                    if task.done() and index not in results:
+                        if task.exception() is not None:
+                            logger.warning("%s attempt %s failed: %s", self.name, index + 1, task.exception())
+                            results[index] = None
+                        else:
+                            results[index] = task.result()
+
+                # The winner is the first success with every attempt ahead of it decided
+                for index in range(len(attempts)):
+                    if index not in results:
+                        break
+                    if is_success(results[index]):
+                        self.wins[index] = self.wins.get(index, 0) + 1
+                        return index, results[index]
+                else:
+                    return None, None
+
+                # Attempts behind a success can never win, so stop launching once one succeeded
+                can_launch = len(tasks) < len(attempts) and not any(is_success(r) for r in results.values())
+                pending = [task for task in tasks if not task.done()]
+                if can_launch and (not pending or loop.time() >= next_launch_at):
+                    launch()
+                    next_launch_at = loop.time() + self.stagger
+                    continue
+                timeout = max(0.0, next_launch_at - loop.time()) if can_launch else None
+                await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    self.cancelled += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "launched": self.launched,
+            "cancelled": self.cancelled,
+            "wins_by_priority": {index + 1: count for index, count in sorted(self.wins.items())}
+        }
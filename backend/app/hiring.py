@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .env import env_int
+from .log import preview
+from .models import Company
+
+logger = logging.getLogger(__name__)
+
+# Checked in order; the first department whose pattern matches a title wins
+DEPARTMENT_PATTERNS = [
+    ("Engineering", re.compile(
+        r"\b(engineer(ing)?|developer|devops|sre|site reliability|architect|programmer|"
+        r"machine learning|ml|data scientist|qa|sdet)\b", re.IGNORECASE)),
+    ("Product", re.compile(
+        r"\b(product|ux|ui|designer|design|user research(er)?)\b", re.IGNORECASE)),
+    ("Finance", re.compile(
+        r"\b(financ(e|ial)|accounting|accountant|controller|fp&a|tax|treasury|payroll|audit(or)?)\b",
+        re.IGNORECASE)),
+    ("Strategy", re.compile(
+        r"\b(strategy|strategic|business development|corporate development|business analyst|"
+        r"partnerships?|m&a|bizdev)\b", re.IGNORECASE)),
+    ("Operations", re.compile(
+        r"\b(operations|program manager|project manager|supply chain|logistics|procurement|"
+        r"chief of staff)\b", re.IGNORECASE))
+]
+# Output order of hiring_signals["departments"]
+DEPARTMENTS = ["Product", "Engineering", "Finance", "Strategy", "Operations"]
+
+def classify_title(title: str) -> Optional[str]:
+    """Department bucket for a job title, or None if it fits none of them"""
+    for department, pattern in DEPARTMENT_PATTERNS:
+        if pattern.search(title):
+            return department
+    return None
+
+def clean_title(company: Company, title: str) -> str:
+    title = title.replace(f"{company.name} - ", "").replace(f"{company.name} ", "")
+    return re.sub(r"\s*\|\s*LinkedIn\s*$", "", title).strip()
+
+def broad_queries(company: Company) -> List[str]:
+    return [
+        f"{company.name} jobs site:linkedin.com",
+        f"{company.name} hiring job openings careers site:linkedin.com"
+    ]
+
+class HiringEngine:
+    """Counts a company's LinkedIn job postings per department and year.
+
+    Each period is covered by a couple of broad searches with large
+    ``num_results`` and the returned titles are bucketed locally, instead
+    of one narrow search per role and year.
+    """
+
+    def __init__(self, num_results: int = 50):
+        self.num_results = num_results
+
+    @classmethod
+    def from_env(cls) -> "HiringEngine":
+        return cls(num_results=env_int("HIRING_NUM_RESULTS", 50))
+
+    async def search_period(self, exa, company: Company, year: int) -> List[str]:
+        """Deduplicated titles mentioning the company posted during ``year``"""
+
+        async def run(query: str) -> List[Dict[str, Any]]:
+            try:
+                search_result = await exa.search(
+                    query=query,
+                    include_domains=["linkedin.com"],
+                    num_results=self.num_results,
+                    start_published_date=f"{year}-01-01",
+                    end_published_date=f"{year}-12-31"
+                )
+            except Exception as e:
+                logger.warning("Error searching %s jobs for %s: %s", company.name, year, e)
+                return []
+            results = search_result.get("results", []) if isinstance(search_result, dict) else []
+            logger.debug("Found %s results for %s (%s)", len(results), query, year)
+            return results
+
+        titles = []
+        seen_urls = set()
+        for results in await asyncio.gather(*[run(query) for query in broad_queries(company)]):
+            for result in results:
+                title = result.get("title") or ""
+                # Broad queries overlap, so the same posting can come back twice
+                if result.get("url") in seen_urls or company.name.lower() not in title.lower():
+                    continue
+                seen_urls.add(result.get("url"))
+                titles.append(title)
+        return titles
+
+    def bucket(self, company: Company, titles: List[str]) -> Dict[str, List[str]]:
+        departments: Dict[str, List[str]] = {name: [] for name in DEPARTMENTS}
+        for title in titles:
+            cleaned = clean_title(company, title)
+            department = classify_title(cleaned)
+            if cleaned and department and cleaned not in departments[department]:
+                departments[department].append(cleaned)
+        return departments
+
+    async def analyze(self, exa, company: Company) -> Dict[str, Any]:
+        """Hiring signals for a tear-sheet"""
+        current_year = datetime.now().year
+        last_year = current_year - 1
+        hiring_data = {
+            "current_year_jobs": 0,
+            "last_year_jobs": 0,
+            "departments": {name: [] for name in DEPARTMENTS},
+            "hiring_trends": "No data available"
+        }
+
+        try:
+            current_titles, last_titles = await asyncio.gather(
+                self.search_period(exa, company, current_year),
+                self.search_period(exa, company, last_year)
+            )
+            departments = self.bucket(company, current_titles)
+            total_jobs_found = sum(len(jobs) for jobs in departments.values())
+            last_year_jobs = sum(len(jobs) for jobs in self.bucket(company, last_titles).values())
+
+            hiring_trends = f"""
+            **Hiring Analysis for {company.name}:**
+
+            **Current Year Job Count:** {total_jobs_found}
+            **Last Year Job Count:** {last_year_jobs}
+
+            **Department Breakdown:**
+            - Product: {len(departments['Product'])} roles
+            - Engineering: {len(departments['Engineering'])} roles
+            - Finance: {len(departments['Finance'])} roles
+            - Strategy: {len(departments['Strategy'])} roles
+            - Operations: {len(departments['Operations'])} roles
+
+            **Key Insights:**
+            - Most active department: {max(departments.items(), key=lambda x: len(x[1]))[0]} with {max(len(jobs) for jobs in departments.values())} roles
+            - Total active job postings: {total_jobs_found}
+            - Year-over-year change: {'+' if total_jobs_found > last_year_jobs else ''}{total_jobs_found - last_year_jobs} jobs
+            """
+
+            hiring_data = {
+                "current_year_jobs": total_jobs_found,
+                "last_year_jobs": last_year_jobs,
+                "departments": departments,
+                "hiring_trends": hiring_trends,
+                "analysis_details": {
+                    "method": "broad_linkedin_search",
+                    "searches": 2 * len(broad_queries(company)),
+                    "titles_seen": len(current_titles),
+                    "unclassified": sum(1 for title in current_titles if classify_title(clean_title(company, title)) is None)
+                }
+            }
+            logger.debug("Final hiring data: %s", preview(hiring_data))
+        except Exception as e:
+            logger.warning("Error in hiring analysis: %s", e, exc_info=True)
+
+        return hiring_data
+
+hiring_engine = HiringEngine.from_env()
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+from .database import db
+from .env import env_int
+from .models import JobStatus, WatchlistJob
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED}
+
+class JobManager:
+    """Runs watchlist crawls as background tasks and fans out progress events.
+
+    Job state lives in the database so it can be polled; every change is
+    also pushed to the queues of connected Server-Sent Events subscribers.
+    Only the ``max_finished_jobs`` most recently finished jobs and their
+    results are kept.
+    """
+
+    def __init__(self, max_finished_jobs: int = 100):
+        self.max_finished_jobs = max(1, max_finished_jobs)
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # Strong references so running tasks are not garbage collected
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def create(self, company_ids: List[int]) -> WatchlistJob:
+        return db.create_watchlist_job(WatchlistJob(id=uuid.uuid4().hex, company_ids=company_ids))
+
+    def start(self, job: WatchlistJob, run: Callable[[WatchlistJob], Awaitable[List[Dict[str, Any]]]]) -> None:
+        task = asyncio.create_task(self._run(job, run))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+
+    async def wait(self, job_id: str) -> None:
+        """Wait until a job has finished; returns at once if it is not running"""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            # Shielded so a cancelled waiter leaves the job running
+            await asyncio.shield(task)
+
+    async def _run(self, job: WatchlistJob, run: Callable[[WatchlistJob], Awaitable[List[Dict[str, Any]]]]) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        self.publish(job, "started")
+        try:
+            results = await run(job)
+            db.save_watchlist_job_results(job.id, results)
+            job.status = JobStatus.COMPLETED
+        except Exception as e:
+            logger.exception("Watchlist job %s failed", job.id)
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+        job.finished_at = datetime.utcnow()
+        self.publish(job, job.status.value)
+        pruned = db.prune_watchlist_jobs(self.max_finished_jobs)
+        if pruned:
+            logger.debug("Dropped %s old watchlist jobs", pruned)
+
+    def publish(self, job: WatchlistJob, event: str, data: Any = None) -> None:
+        """Push an event to every subscriber of a job"""
+        payload = {"event": event, "job": job.model_dump(mode="json"), "data": data}
+        for queue in self._subscribers.get(job.id, []):
+            queue.put_nowait(payload)
+
+    async def events(self, job: WatchlistJob) -> AsyncIterator[str]:
+        """Yield Server-Sent Events for a job until it finishes"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job.id, []).append(queue)
+        try:
+            # Late subscribers get the current state first
+            yield format_sse("snapshot", {"job": job.model_dump(mode="json")})
+            if job.status in TERMINAL_STATUSES:
+                return
+            while True:
+                payload = await queue.get()
+                yield format_sse(payload["event"], payload)
+                if payload["job"]["status"] in {s.value for s in TERMINAL_STATUSES}:
+                    return
+        finally:
+            self._subscribers[job.id].remove(queue)
+            if not self._subscribers[job.id]:
+                del self._subscribers[job.id]
+
+def format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+job_manager = JobManager(max_finished_jobs=env_int("WATCHLIST_JOB_RETENTION", 100))
@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import random
+import reprlib
+import sys
+from typing import Any, Dict, Optional
+
+from .env import env_int
+
+# Attributes every LogRecord has; anything else on a record came from ``extra=``
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_preview_repr = reprlib.Repr()
+_preview_repr.maxlevel = 4
+_preview_repr.maxdict = 10
+_preview_repr.maxlist = 10
+_preview_repr.maxstring = 120
+_preview_repr.maxother = 120
+
+_preview_chars = env_int("LOG_PREVIEW_CHARS", 500)
+
+class Preview:
+    """Size-capped view of a payload that is only rendered if the record is emitted.
+
+    Rendering goes through reprlib, so even an enabled preview of a
+    multi-megabyte Exa response costs roughly its output size, not its input.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: Optional[int] = None):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        limit = self.limit or _preview_chars
+        text = _preview_repr.repr(self.value)
+        if len(text) > limit:
+            return f"{text[:limit]}...[truncated]"
+        return text
+
+    __repr__ = __str__
+
+def preview(value: Any, limit: Optional[int] = None) -> Preview:
+    return Preview(value, limit)
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of DEBUG/INFO records per logger name prefix.
+
+    Warnings and errors are never sampled out.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # Longest prefix wins, so "app.main=0.1,app=1" samples only app.main
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return rate >= 1 or random.random() < rate
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra=`` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """Parse ``"app.main=0.1,app.exa_client=0.5"`` into a prefix -> rate map"""
+    rates = {}
+    for part in spec.split(","):
+        name, _, rate = part.partition("=")
+        if name.strip() and rate.strip():
+            rates[name.strip()] = float(rate)
+    return rates
+
+def configure_logging() -> logging.Logger:
+    """Set up the ``app`` logger hierarchy from LOG_* environment variables"""
+    root = logging.getLogger("app")
+    if getattr(root, "_signals_configured", False):
+        return root
+
+    handler = logging.StreamHandler(sys.stderr)
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    rates = parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", ""))
+    if rates:
+        handler.addFilter(SamplingFilter(rates))
+
+    root.addHandler(handler)
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.propagate = False
+    root._signals_configured = True
+    return root
@@ -1,25 +1,74 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Set, Tuple
 import os
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
+import asyncio
+import copy
 import hashlib
 import json
+import logging
+from contextlib import asynccontextmanager
 
 from .models import (
     Company, VendorWatch, Signal, Report, TearSheet, SourcesConfiguration, SettingsConfiguration,
     AddVendorRequest, RunWatchlistRequest, TearSheetResponse, WeeklyReportRequest,
     SignalType, SignalSeverity, SignalResponse, SignalDetectionRequest,
-    CompanySearchRequest, CompanySearchResult, CompanySearchResponse
+    CompanySearchRequest, CompanySearchResult, CompanySearchResponse,
+    CompetitivePositioningCache, CompetitivePositioningRequest, ScoringConfiguration,
+    JobStatus, CompanyJobProgress, WatchlistJob, WatchlistJobResults, Diff, ScheduledCrawl
 )
 from .database import db
-from .exa_client import get_exa_client
+from .exa_client import get_exa_client, http_pool, exa_flight
+from .exa_cache import response_cache
+from .rate_limiter import rate_limiter
+from .resilience import circuit_breaker, retry_policy
+from .singleflight import SingleFlight
+from .log import configure_logging, preview
+from .env import env_float, env_int
+from .jobs import job_manager
+from .change_detection import detect_page_changes, signal_from_change
+from .scheduler import scheduler
+from .hiring import hiring_engine
+from .ttl_cache import TTLCache
+from .hedging import HedgedExecutor
+from .typeahead import CompanyNameIndex, TypeaheadCache
+from .streaming import Emit, stream_events, stream_mode, streaming_response
+from .pagination import MAX_PAGE_SIZE, decode_cursor, naive_utc, set_page_headers
+from .scoring_engine import AdvancedScoringEngine
 
 load_dotenv()
+configure_logging()
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Signals API", description="Competitive Intelligence Radar")
 
+# Concurrent identical page loads share one generation instead of repeating the Exa fan-out
+tearsheet_flight = SingleFlight("tearsheet")
+activity_flight = SingleFlight("companies_activity")
+executives_flight = SingleFlight("executives")
+
+signals_flight = SingleFlight("signal_detection")
+
+# Detection results per request shape; the TTL is read from settings on every lookup
+signals_cache = TTLCache("signal_detection", ttl=3600)
+
+# Fallback search strategies for /signals/detect, hedged instead of tried one by one
+strategy_executor = HedgedExecutor("signal_strategies", stagger=env_float("SIGNALS_STRATEGY_STAGGER_SECONDS", 1.0))
+
+# Merged executive search results per company; tear-sheet generation reuses them
+executives_cache = TTLCache("executives", ttl=env_float("EXECUTIVES_CACHE_TTL", 24 * 3600))
+
+# Company search hits per query; a shorter prefix is served from a longer cached query
+typeahead_cache = TypeaheadCache("company_search", ttl=env_float("COMPANY_SEARCH_CACHE_TTL", 600))
+
+# Local name/domain index over the watchlist and earlier search results
+company_index = CompanyNameIndex(max_entries=env_int("COMPANY_INDEX_MAX_ENTRIES", 10000))
+indexed_companies_version = -1
+
 # Disable CORS. Do not remove this for full-stack development.
 app.add_middleware(
     CORSMiddleware,
@@ -27,18 +76,62 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["Age", "X-Cache", "X-Next-Cursor", "X-Total-Count"],  # Cache and paging metadata the frontend reads
 )
 
+@app.on_event("startup")
+async def open_exa_pool():
+    """Open the shared Exa connection pool for the lifetime of the app"""
+    http_pool.open()
+
+@app.on_event("startup")
+async def start_scheduler():
+    scheduler.start(dispatch_scheduled_watches)
+
+@app.on_event("shutdown")
+async def close_exa_pool():
+    await http_pool.close()
+
+@app.on_event("shutdown")
+async def stop_scheduler():
+    await scheduler.stop()
+
 @app.get("/healthz")
 async def healthz():
     return {"status": "ok"}
 
+@app.get("/exa/stats")
+async def get_exa_stats():
+    """Report Exa cache, request coalescing, rate limiter and breaker counters"""
+    return {
+        "cache": response_cache.stats(),
+        "rate_limits": rate_limiter.stats(),
+        "circuit_breaker": circuit_breaker.stats(),
+        "retries": retry_policy.retries,
+        "singleflight": {
+            flight.name: flight.stats()
+            for flight in (exa_flight, tearsheet_flight, activity_flight, executives_flight, signals_flight)
+        },
+        "executives_cache": executives_cache.stats(),
+        "signals_cache": signals_cache.stats(),
+        "company_search_cache": typeahead_cache.stats(),
+        "company_index": company_index.stats(),
+        "radar_scores": radar_raw_cache.stats(),
+        "signal_strategies": strategy_executor.stats()
+    }
+
+@app.delete("/exa/cache")
+async def clear_exa_cache():
+    """Drop every cached Exa response"""
+    return {"cleared": response_cache.clear()}
+
+# Tried in this priority order; results from earlier variants come first
+COMPANY_SEARCH_VARIANTS = ["{query} company", "{query} site:*.com", "{query}"]
+
 @app.post("/companies/search", response_model=CompanySearchResponse)
 async def search_companies(request: CompanySearchRequest):
     """Search for companies using EXA API"""
     try:
-        exa = get_exa_client()
-        
         query_clean = request.query.strip()
         if len(query_clean) < 3:
             return CompanySearchResponse(
@@ -46,59 +139,37 @@ async def search_companies(request: CompanySearchRequest):
                 query=request.query,
                 total_results=0
             )
-        
-        search_queries = [
-            f"{request.query} company",
-            f"{request.query} site:*.com",
-            f"{request.query}"
-        ]
-        
-        all_results = []
-        seen_domains = set()
-        
-        for query in search_queries:
-            try:
-                search_result = await exa.search(
-                    query=query,
-                    num_results=min(5, request.max_results),
-                    type="auto"
+
+        # Watchlist companies and earlier results answer first; Exa only fills the rest
+        sync_company_index()
+        all_results = company_index.search(request.query, request.max_results)
+        if len(all_results) < request.max_results:
+            hits = typeahead_cache.get(request.query, request.max_results)
+            if hits is None:
+                hits, failed = await search_company_hits(get_exa_client(), request.query, request.max_results)
+                # A failed variant leaves the hits incomplete (empty during an outage), so they must not be cached
+                if not failed:
+                    typeahead_cache.set(request.query, hits, request.max_results)
+
+            local_keys = {company_index.entry_key(result) for result in all_results}
+            for hit in hits:
+                company_name = extract_company_name(request.query, hit["domain"], hit["title"])
+                if not company_name:
+                    continue
+                result = CompanySearchResult(
+                    name=company_name.strip(),
+                    domains=[hit["domain"]],
+                    description=hit["snippet"][:200] if hit["snippet"] else f"Technology company at {hit['domain']}",
+                    suggested_paths=["/pricing", "/release-notes", "/security"],
+                    tags=["search-result"]
                 )
-                
-                if search_result and search_result.get("results"):
-                    for result in search_result["results"]:
-                        # Extract domain from URL
-                        url = result.get("url", "")
-                        if not url:
-                            continue
-                            
-                        domain = url.replace("https://", "").replace("http://", "").split("/")[0]
-                        
-                        if domain in seen_domains or domain == "":
-                            continue
-                        seen_domains.add(domain)
-                        
-                        company_name = extract_company_name(request.query, domain, result.get("title", ""))
-                        
-                        if company_name and domain:
-                            search_result_item = CompanySearchResult(
-                                name=company_name.strip(),
-                                domains=[domain],
-                                description=result.get("snippet", "")[:200] if result.get("snippet") else f"Technology company at {domain}",
-                                suggested_paths=["/pricing", "/release-notes", "/security"],
-                                tags=["search-result"]
-                            )
-                            all_results.append(search_result_item)
-                            
-                            if len(all_results) >= request.max_results:
-                                break
-                                
-            except Exception as e:
-                print(f"Search query '{query}' failed: {e}")
-                continue
-                
-            if len(all_results) >= request.max_results:
-                break
-        
+                # The response name may echo the query; index under the name the hit itself supports
+                domain_name = domain_company_name(hit["domain"])
+                if domain_name:
+                    company_index.add(result.model_copy(update={"name": domain_name}))
+                if company_index.entry_key(result) not in local_keys:
+                    all_results.append(result)
+
         return CompanySearchResponse(
             results=all_results[:request.max_results],
             query=request.query,
@@ -108,6 +179,62 @@ async def search_companies(request: CompanySearchRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching companies: {str(e)}")
 
+def sync_company_index() -> None:
+    """Index watchlist companies added or edited since the last search"""
+    global indexed_companies_version
+    if db.companies_version == indexed_companies_version:
+        return
+    for company in db.list_companies():
+        company_index.index_company(company.id, CompanySearchResult(
+            name=company.name,
+            domains=company.domains,
+            description="Already on your watchlist",
+            linkedin_url=company.linkedin_url,
+            tags=["watchlist", *company.tags]
+        ))
+    indexed_companies_version = db.companies_version
+
+async def search_company_hits(exa, query: str, max_results: int) -> Tuple[List[dict], bool]:
+    """(unique-domain hits across the search variants in variant priority order, whether any variant failed).
+
+    All variants start at once and are merged as soon as every variant
+    ahead of them has answered; once ``max_results`` domains are in, the
+    variants still running are cancelled.
+    """
+
+    async def run(variant: str) -> List[dict]:
+        search_result = await exa.search(query=variant, num_results=min(5, max_results), type="auto")
+        return (search_result or {}).get("results") or []
+
+    variants = [template.format(query=query) for template in COMPANY_SEARCH_VARIANTS]
+    tasks = [asyncio.ensure_future(run(variant)) for variant in variants]
+    hits = []
+    seen_domains = set()
+    failed = False
+    try:
+        for variant, task in zip(variants, tasks):
+            try:
+                results = await task
+            except Exception as e:
+                logger.warning("Search query '%s' failed: %s", variant, e)
+                failed = True
+                continue
+
+            for result in results:
+                # Extract domain from URL
+                url = result.get("url", "")
+                domain = url.replace("https://", "").replace("http://", "").split("/")[0]
+                if not domain or domain in seen_domains:
+                    continue
+                seen_domains.add(domain)
+                hits.append({"domain": domain, "title": result.get("title", ""), "snippet": result.get("snippet")})
+                if len(hits) >= max_results:
+                    return hits, failed
+        return hits, failed
+    finally:
+        for task in tasks:
+            task.cancel()
+
 def extract_company_name(query: str, domain: str, title: str) -> str:
     """Extract the best company name from query, domain, and title"""
     query_clean = query.strip()
@@ -130,14 +257,20 @@ def extract_company_name(query: str, domain: str, title: str) -> str:
         
         return query_clean.title()
     
-    domain_parts = domain.split(".")
-    if len(domain_parts) >= 2:
-        main_domain = domain_parts[-2]
-        return main_domain.capitalize()
+    domain_name = domain_company_name(domain)
+    if domain_name:
+        return domain_name
     
     # Final fallback
     return query_clean.title()
 
+def domain_company_name(domain: str) -> Optional[str]:
+    """Company name implied by a domain's registrable label, e.g. "Stripe" for docs.stripe.com"""
+    domain_parts = domain.split(".")
+    if len(domain_parts) >= 2 and domain_parts[-2]:
+        return domain_parts[-2].capitalize()
+    return None
+
 @app.post("/vendors/watch", response_model=Company)
 async def add_vendor(request: AddVendorRequest):
     """Add a vendor to the watchlist"""
@@ -155,6 +288,7 @@ async def add_vendor(request: AddVendorRequest):
         include_paths=request.include_paths
     )
     db.create_vendor_watch(vendor_watch)
+    scheduler.wake()
     
     return company
 
@@ -189,506 +323,573 @@ async def update_vendor(company_id: int, request: AddVendorRequest):
     updated_company = db.update_company(company)
     return updated_company
 
-@app.post("/run/watchlist")
+# Per-watch memory of URLs already sent to the answer step in incremental mode
+MAX_PROCESSED_URLS = 5000
+
+# Exa calls in flight across every watchlist run that does not set its own max_concurrency
+watchlist_slots = asyncio.Semaphore(env_int("WATCHLIST_MAX_CONCURRENCY", 10))
+
+class WatchlistLimits:
+    """Caps Exa calls in flight for a watchlist run, per company and overall"""
+
+    def __init__(self, overall: asyncio.Semaphore, per_company: int):
+        self.overall = overall
+        self.company = asyncio.Semaphore(per_company)
+
+    @asynccontextmanager
+    async def slot(self):
+        # Take the company slot first so a busy company never holds a global slot while it waits
+        async with self.company:
+            async with self.overall:
+                yield
+
+@app.post("/run/watchlist", response_model=WatchlistJob, status_code=202)
 async def run_watchlist(request: RunWatchlistRequest = None):
-    """Run the watchlist crawl for specified companies or all companies"""
+    """Start a background watchlist crawl for specified companies or all companies"""
     try:
         exa = get_exa_client()
-        
-        if request and request.company_ids:
-            companies = [db.get_company(cid) for cid in request.company_ids]
-            companies = [c for c in companies if c is not None]
-        else:
-            companies = db.list_companies()
-        
-        results = []
-        
-        for company in companies:
-            vendor_watches = db.get_vendor_watches_by_company(company.id)
-            
-            for watch in vendor_watches:
-                # Use base domains for better search results
-                include_domains = company.domains.copy()
-                
-                # Create specific queries for each path type
-                queries = []
-                if '/pricing' in watch.include_paths:
-                    queries.append(f"{company.name} pricing")
-                if '/release-notes' in watch.include_paths or '/changelog' in watch.include_paths:
-                    queries.append(f"{company.name} changelog release notes")
-                if '/security' in watch.include_paths:
-                    queries.append(f"{company.name} security updates")
-                if '/blog' in watch.include_paths: 
-                    queries.append(f"{company.name} blogs")
-                
-                # Search for recent updates and developments
-                print(f"DEBUG: Searching for {company.name} updates and developments")
-                
-                # Search for recent updates
-                search_queries = [
-                    f"{company.name} new features product updates announcements",
-                    f"{company.name} pricing changes updates plans",
-                    f"{company.name} executive leadership team appointments",
-                    f"{company.name} technology updates platform improvements",
-                    f"{company.name} blogs articles news"
-                ]
-                
-                all_urls = []
-                answer_result = None
-                
-                for query in search_queries:
-                    try:
-                        search_result = await exa.search(
-                            query=query,
-                            include_domains=include_domains,
-                            num_results=10
-                        )
-                        print(f"DEBUG: Search result for query '{query}': {search_result}")
-                        
-                        if isinstance(search_result, dict) and search_result.get("results"):
-                            urls = [result["url"] for result in search_result["results"]]
-                            all_urls.extend(urls)
-                            print(f"DEBUG: Found {len(urls)} URLs for query '{query}'")
-                    except Exception as e:
-                        print(f"DEBUG: Error in search for query '{query}': {str(e)}")
-                        continue
-                
-                # Remove duplicates
-                all_urls = list(set(all_urls))
-                print(f"DEBUG: Total unique URLs found: {len(all_urls)}")
-                
-                if all_urls:
-                    try:
-                        # Use Exa answer API to extract specific information
-                        answer_query = f"""
-                        Analyze the following {company.name} content and extract recent updates and developments:
-                        1. New product features, launches, or announcements
-                        2. Pricing changes, updates, or new plans
-                        3. Executive appointments, leadership changes, or business developments
-                        4. Technology updates or platform improvements
-                        
-                        For each finding, provide:
-                        - Clear description of what changed or was announced
-                        - Date or timeframe if mentioned
-                        - Impact or significance for users/customers
-                        - Source URL
-                        
-                        Focus on developments in the last 10 days
-                        """
-                        
-                        print(f"DEBUG: Getting answer for {len(all_urls)} URLs")
-                        answer_result = await exa.answer(
-                            query=answer_query,
-                            urls=all_urls,
-                            text=True
-                        )
-                        
-                        print(f"DEBUG: Answer result: {answer_result}")
-                        answer = answer_result.get("answer", "")
-                        
-                        # Ensure answer is a string before parsing
-                        if not isinstance(answer, str):
-                            print(f"DEBUG: Answer is not a string, type: {type(answer)}, value: {answer}")
-                            answer = str(answer) if answer is not None else ""
-                        
-                        # Process the answer_result directly - it's already a dict, not streaming JSON
-                        result = {
-                            'content': answer,
-                            'choices': [],
-                            'citations': answer_result.get('citations', []),
-                            'metadata': {
-                                'cost_dollars': answer_result.get('costDollars', {}),
-                                'request_id': answer_result.get('requestId', '')
-                            },
-                            'summary': {
-                                'total_choices': 0,
-                                'total_citations': len(answer_result.get('citations', [])),
-                                'content_length': len(answer),
-                                'has_finish_reason': True
-                            }
-                        }
-                        
-                        # Write result to file for debugging
-                        # Extract URLs from citations for the signal
-                        citation_urls = []
-                        citation_snippets = []
-                        if result.get('citations'):
-                            citation_urls = [citation.get('url', '') for citation in result['citations'] if citation.get('url')]
-                            citation_snippets = [citation.get('snippet', '') for citation in result['citations'] if citation.get('snippet')]
-                        
-                        # Use all_urls as fallback if no citation URLs
-                        if not citation_urls:
-                            citation_urls = all_urls[:5]
-                        
-                        signal = Signal(
-                            company_id=company.id,
-                            type=SignalType.PRODUCT_UPDATE,
-                            title=f"Recent Updates for {company.name}",
-                            summary=result.get('content', ''),
-                            severity=SignalSeverity.MEDIUM,
-                            confidence=0.8,
-                            urls=citation_urls[:5],  # Limit to top 5 URLs for the signal
-                            citations=citation_snippets[:5]  # Include snippets as citations
-                        )
-                        db.create_signal(signal)
-                        print(f"DEBUG: Created signal for {company.name} with {len(citation_urls)} URLs")
-                        
-                    except Exception as e:
-                        print(f"DEBUG: Error getting answer: {str(e)}")
-                        import traceback
-                        print(f"DEBUG: Answer traceback: {traceback.format_exc()}")
-                else:
-                    print(f"DEBUG: No URLs found for {company.name}")
-                
-                watch.last_run_at = datetime.utcnow()
-                
-                # Store comprehensive data for frontend display
-                answer_content = answer_result.get("answer", "") if answer_result else ""
-                
-                # Create comprehensive citations with all extracted data
-                comprehensive_citations = []
-                if answer_result and answer_result.get("citations"):
-                    for citation in answer_result["citations"][:5]:  # Top 5 sources
-                        if isinstance(citation, dict):
-                            # Extract all available fields
-                            citation_info = {
-                                'title': citation.get('title', 'No title'),
-                                'url': citation.get('url', citation.get('id', '')),
-                                'publishedDate': citation.get('publishedDate', ''),
-                                'author': citation.get('author', ''),
-                                'snippet': citation.get('snippet', ''),
-                                'text': citation.get('text', '')[:500] if citation.get('text') else '',  # Limit text length
-                                'image': citation.get('image', ''),
-                                'favicon': citation.get('favicon', ''),
-                                'score': citation.get('score', 0)
-                            }
-                            comprehensive_citations.append(citation_info)
-                
-                results.append({
-                    "company_id": company.id,
-                    "company": company.name,
-                    "paths_checked": watch.include_paths,
-                    "urls_found": len(all_urls),
-                    "signals_created": 1 if all_urls else 0,
-                    "answer_content": answer_content,
-                    "citations": comprehensive_citations
-                })
-        
-        return {"message": "Watchlist run completed", "results": results}
-    
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error running watchlist: {str(e)}")
 
-@app.get("/tearsheet/{company_id}", response_model=TearSheetResponse)
-async def get_tearsheet(company_id: int):
-    """Generate a company tear-sheet with 7-day caching"""
-    print(f"DEBUG: Starting tear-sheet generation for company_id: {company_id}")
-    
-    company = db.get_company(company_id)
-    if not company:
-        print(f"DEBUG: Company not found for id: {company_id}")
-        raise HTTPException(status_code=404, detail="Company not found")
-    
-    print(f"DEBUG: Found company: {company.name}")
-    
-    # Check for existing tearsheets for this company
-    existing_tearsheets = db.get_tearsheets_by_company(company_id)
-    
-    if existing_tearsheets:
-        # Get the most recent tearsheet
-        latest_tearsheet = max(existing_tearsheets, key=lambda t: t.generated_at)
-        days_old = (datetime.utcnow() - latest_tearsheet.generated_at).days
-        
-        # Get cache duration from settings, default to 7 days
-        cache_duration_days = 7
+    if request and request.company_ids:
+        companies = [db.get_company(cid) for cid in request.company_ids]
+        companies = [c for c in companies if c is not None]
+    else:
+        companies = db.list_companies()
+
+    # An explicit max_concurrency gets its own cap; otherwise the run shares the process-wide one
+    overall = asyncio.Semaphore(request.max_concurrency) if request and request.max_concurrency else watchlist_slots
+    return start_watchlist_job(
+        exa,
+        companies,
+        overall=overall,
+        per_company_concurrency=(request and request.per_company_concurrency) or env_int("WATCHLIST_COMPANY_CONCURRENCY", 5),
+        incremental=request.incremental if request else True
+    )
+
+def start_watchlist_job(
+    exa,
+    companies: List[Company],
+    overall: asyncio.Semaphore,
+    per_company_concurrency: int,
+    incremental: bool = True,
+    watch_ids: Optional[Set[int]] = None
+) -> WatchlistJob:
+    """Create a watchlist job for the given companies and run it in the background.
+
+    ``overall`` caps Exa calls in flight for the run and may be shared with
+    other runs. ``watch_ids`` restricts the crawl to those vendor watches
+    (used by the scheduler).
+    """
+    job = job_manager.create([company.id for company in companies])
+    job.companies_total = len(companies)
+    job.progress = [CompanyJobProgress(company_id=company.id, company=company.name) for company in companies]
+
+    async def run(job: WatchlistJob) -> List[dict]:
+        async def run_company(company: Company, progress: CompanyJobProgress) -> List[dict]:
+            limits = WatchlistLimits(overall, per_company_concurrency)
+            progress.status = JobStatus.RUNNING
+            job_manager.publish(job, "company_started", {"company_id": company.id})
+            try:
+                vendor_watches = db.get_vendor_watches_by_company(company.id)
+                if watch_ids is not None:
+                    vendor_watches = [watch for watch in vendor_watches if watch.id in watch_ids]
+                company_results = await asyncio.gather(*[
+                    crawl_vendor_watch(exa, company, watch, limits, incremental) for watch in vendor_watches
+                ])
+            except Exception as e:
+                # One company failing must not sink the rest of the run
+                logger.warning("Error crawling %s: %s", company.name, e, exc_info=True)
+                progress.status = JobStatus.FAILED
+                progress.error = str(e)
+                company_results = []
+            else:
+                # A watch whose searches failed kept its watermark, so the company did not fully complete
+                errors = [r["error"] for r in company_results if r["error"]]
+                progress.status = JobStatus.FAILED if errors else JobStatus.COMPLETED
+                progress.error = "; ".join(errors) or None
+                progress.urls_found = sum(r["urls_found"] for r in company_results)
+                progress.signals_created = sum(r["signals_created"] for r in company_results)
+
+            job.companies_done += 1
+            job.urls_found += progress.urls_found
+            job.signals_created += progress.signals_created
+            job_manager.publish(job, "company_finished", progress.model_dump(mode="json"))
+            return company_results
+
+        # Companies are crawled concurrently but results keep company, then watch, order
+        per_company = await asyncio.gather(*[run_company(c, p) for c, p in zip(companies, job.progress)])
+        return [result for company_results in per_company for result in company_results]
+
+    job_manager.start(job, run)
+    return job
+
+async def dispatch_scheduled_watches(watches: List[VendorWatch]) -> None:
+    """Run one watchlist job covering the watches the scheduler found due, returning once it finished"""
+    exa = get_exa_client()
+    company_ids = list(dict.fromkeys(watch.company_id for watch in watches))
+    companies = [c for c in (db.get_company(cid) for cid in company_ids) if c is not None]
+    job = start_watchlist_job(
+        exa,
+        companies,
+        overall=watchlist_slots,
+        per_company_concurrency=env_int("WATCHLIST_COMPANY_CONCURRENCY", 5),
+        watch_ids={watch.id for watch in watches}
+    )
+    logger.info("Scheduled watchlist job %s started for %s watches", job.id, len(watches))
+    await job_manager.wait(job.id)
+
+@app.get("/run/watchlist/schedule", response_model=List[ScheduledCrawl])
+async def get_watchlist_schedule(limit: int = 50):
+    """Upcoming scheduled crawls, soonest first"""
+    return scheduler.upcoming(limit)
+
+@app.get("/run/watchlist/jobs", response_model=List[WatchlistJob])
+async def list_watchlist_jobs():
+    """List watchlist jobs, newest first"""
+    return db.list_watchlist_jobs()
+
+@app.get("/run/watchlist/jobs/{job_id}", response_model=WatchlistJob)
+async def get_watchlist_job(job_id: str):
+    """Get the status and per-company progress of a watchlist job"""
+    job = db.get_watchlist_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/run/watchlist/jobs/{job_id}/results", response_model=WatchlistJobResults)
+async def get_watchlist_job_results(job_id: str):
+    """Get the stored per-watch results of a finished watchlist job"""
+    job = db.get_watchlist_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return WatchlistJobResults(job_id=job.id, status=job.status, results=db.get_watchlist_job_results(job_id) or [])
+
+@app.get("/run/watchlist/jobs/{job_id}/events")
+async def stream_watchlist_job(job_id: str):
+    """Stream watchlist job progress as Server-Sent Events"""
+    job = db.get_watchlist_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        job_manager.events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def crawl_vendor_watch(exa, company: Company, watch: VendorWatch, limits: WatchlistLimits, incremental: bool = True) -> dict:
+    """Search a company's updates for one vendor watch and record a signal from the answer.
+
+    In incremental mode the searches only cover content published since the
+    watch's last successful run, and the answer step only sees URLs the
+    watch has not processed before; it is skipped when there are none.
+    Watched pages are fetched once, hashed and diffed against their last
+    snapshot: unchanged pages never reach the answer step and changed
+    pages become section-typed signals directly.
+    """
+    run_started_at = datetime.utcnow()
+    # Use base domains for better search results
+    include_domains = company.domains.copy()
+    watermark = watch.last_run_at.isoformat() if incremental and watch.last_run_at else None
+
+    # Create specific queries for each path type
+    queries = []
+    if '/pricing' in watch.include_paths:
+        queries.append(f"{company.name} pricing")
+    if '/release-notes' in watch.include_paths or '/changelog' in watch.include_paths:
+        queries.append(f"{company.name} changelog release notes")
+    if '/security' in watch.include_paths:
+        queries.append(f"{company.name} security updates")
+    if '/blog' in watch.include_paths: 
+        queries.append(f"{company.name} blogs")
+
+    # Search for recent updates and developments
+    logger.debug("Searching for %s updates and developments", company.name)
+
+    # Search for recent updates
+    search_queries = [
+        f"{company.name} new features product updates announcements",
+        f"{company.name} pricing changes updates plans",
+        f"{company.name} executive leadership team appointments",
+        f"{company.name} technology updates platform improvements",
+        f"{company.name} blogs articles news"
+    ]
+
+    # Searches that raised; their window must be searched again, so the watermark holds
+    failed: List[str] = []
+    pages_ok = True
+
+    async def run_query(query: str) -> List[str]:
+        try:
+            async with limits.slot():
+                search_result = await exa.search(
+                    query=query,
+                    include_domains=include_domains,
+                    start_published_date=watermark,
+                    num_results=10
+                )
+            logger.debug("Search result for query '%s': %s", query, preview(search_result))
+
+            if isinstance(search_result, dict) and search_result.get("results"):
+                urls = [result["url"] for result in search_result["results"]]
+                logger.debug("Found %s URLs for query '%s'", len(urls), query)
+                return urls
+        except Exception as e:
+            logger.warning("Error in search for query '%s': %s", query, e)
+            failed.append(query)
+        return []
+
+    async def check_pages() -> List[dict]:
+        nonlocal pages_ok
         try:
-            settings_config = db.get_latest_settings_configuration()
-            if settings_config and settings_config.retention:
-                cache_duration_days = settings_config.retention.get("tearsheets_days", 7)
+            async with limits.slot():
+                return await detect_page_changes(exa, company, watch)
         except Exception as e:
-            print(f"DEBUG: Error getting settings config, using default 7 days: {e}")
-        
-        print(f"DEBUG: Found existing tearsheet from {latest_tearsheet.generated_at} ({days_old} days old)")
-        print(f"DEBUG: Cache duration from settings: {cache_duration_days} days")
-        
-        # If tearsheet is less than cache_duration_days old, return cached version
-        if days_old < cache_duration_days:
-            print(f"DEBUG: Returning cached tearsheet (less than {cache_duration_days} days old)")
-            return TearSheetResponse(
-                company=company,
-                overview=latest_tearsheet.overview,
-                executives=latest_tearsheet.executives,
-                hiring_signals=latest_tearsheet.hiring_signals,
-                citations=latest_tearsheet.citations
+            logger.warning("Error checking watched pages for %s: %s", company.name, e)
+            pages_ok = False
+            return []
+
+    # Queries run concurrently; gather keeps results in query order
+    *query_urls, page_changes = await asyncio.gather(*[run_query(q) for q in search_queries], check_pages())
+    all_urls = [url for urls in query_urls for url in urls]
+    unchanged_pages = {page["url"] for page in page_changes if page["status"] == "unchanged"}
+    changed_pages = [page for page in page_changes if page["status"] == "changed"]
+    for change in changed_pages:
+        db.create_signal(signal_from_change(company, change))
+    answer_result = None
+
+    # Remove duplicates
+    all_urls = list(set(all_urls))
+    logger.debug("Total unique URLs found: %s", len(all_urls))
+
+    if incremental:
+        already_processed = set(watch.processed_urls)
+        answer_urls = [url for url in all_urls if url not in already_processed]
+        logger.debug("%s of %s URLs are new for watch %s", len(answer_urls), len(all_urls), watch.id)
+    else:
+        answer_urls = all_urls
+    # Pages whose content hash matches the last snapshot have nothing new to analyze,
+    # while new or changed watched pages are analyzed even if seen before
+    answer_urls = [url for url in answer_urls if url not in unchanged_pages]
+    answer_urls += [page["url"] for page in page_changes
+                    if page["status"] != "unchanged" and page["url"] not in answer_urls]
+    answer_ok = True
+    signals_created = len(changed_pages)
+
+    if answer_urls:
+        try:
+            # Use Exa answer API to extract specific information
+            answer_query = f"""
+            Analyze the following {company.name} content and extract recent updates and developments:
+            1. New product features, launches, or announcements
+            2. Pricing changes, updates, or new plans
+            3. Executive appointments, leadership changes, or business developments
+            4. Technology updates or platform improvements
+
+            For each finding, provide:
+            - Clear description of what changed or was announced
+            - Date or timeframe if mentioned
+            - Impact or significance for users/customers
+            - Source URL
+
+            Focus on developments in the last 10 days
+            """
+
+            logger.debug("Getting answer for %s URLs", len(answer_urls))
+            async with limits.slot():
+                answer_result = await exa.answer(
+                    query=answer_query,
+                    urls=answer_urls,
+                    text=True
+                )
+
+            logger.debug("Answer result: %s", preview(answer_result))
+            answer = answer_result.get("answer", "")
+
+            # Ensure answer is a string before parsing
+            if not isinstance(answer, str):
+                logger.debug("Answer is not a string, type: %s, value: %s", type(answer), preview(answer))
+                answer = str(answer) if answer is not None else ""
+
+            # Process the answer_result directly - it's already a dict, not streaming JSON
+            result = {
+                'content': answer,
+                'choices': [],
+                'citations': answer_result.get('citations', []),
+                'metadata': {
+                    'cost_dollars': answer_result.get('costDollars', {}),
+                    'request_id': answer_result.get('requestId', '')
+                },
+                'summary': {
+                    'total_choices': 0,
+                    'total_citations': len(answer_result.get('citations', [])),
+                    'content_length': len(answer),
+                    'has_finish_reason': True
+                }
+            }
+
+            # Write result to file for debugging
+            # Extract URLs from citations for the signal
+            citation_urls = []
+            citation_snippets = []
+            if result.get('citations'):
+                citation_urls = [citation.get('url', '') for citation in result['citations'] if citation.get('url')]
+                citation_snippets = [citation.get('snippet', '') for citation in result['citations'] if citation.get('snippet')]
+
+            # Use all_urls as fallback if no citation URLs
+            if not citation_urls:
+                citation_urls = answer_urls[:5]
+
+            signal = Signal(
+                company_id=company.id,
+                type=SignalType.PRODUCT_UPDATE,
+                title=f"Recent Updates for {company.name}",
+                summary=result.get('content', ''),
+                severity=SignalSeverity.MEDIUM,
+                confidence=0.8,
+                urls=citation_urls[:5],  # Limit to top 5 URLs for the signal
+                citations=citation_snippets[:5]  # Include snippets as citations
             )
-        else:
-            print(f"DEBUG: Tearsheet is {days_old} days old (cache duration: {cache_duration_days} days), refreshing from Exa API")
+            db.create_signal(signal)
+            signals_created += 1
+            logger.debug("Created signal for %s with %s URLs", company.name, len(citation_urls))
+
+        except Exception as e:
+            answer_ok = False
+            logger.warning("Error getting answer: %s", e, exc_info=True)
+    elif all_urls:
+        logger.debug("No new URLs for %s since %s, skipping answer", company.name, watermark)
     else:
-        print(f"DEBUG: No existing tearsheets found, generating new one")
+        logger.debug("No URLs found for %s", company.name)
+
+    # Only advance the watermark once every search succeeded and the new URLs
+    # have been analyzed, so anything published during an outage and a
+    # failed answer call are both retried on the next run
+    errors = []
+    if failed:
+        errors.append(f"{len(failed)} of {len(search_queries)} searches failed")
+    if not pages_ok:
+        errors.append("Watched page check failed")
+    if not answer_ok:
+        errors.append("Answer step failed")
+    if not failed and pages_ok and (answer_ok or not incremental):
+        watch.last_run_at = run_started_at
+        seen = set(watch.processed_urls)
+        watch.processed_urls = (watch.processed_urls + [url for url in answer_urls if url not in seen])[-MAX_PROCESSED_URLS:]
+
+    # Store comprehensive data for frontend display
+    answer_content = answer_result.get("answer", "") if answer_result else ""
+
+    # Create comprehensive citations with all extracted data
+    comprehensive_citations = []
+    if answer_result and answer_result.get("citations"):
+        for citation in answer_result["citations"][:5]:  # Top 5 sources
+            if isinstance(citation, dict):
+                # Extract all available fields
+                citation_info = {
+                    'title': citation.get('title', 'No title'),
+                    'url': citation.get('url', citation.get('id', '')),
+                    'publishedDate': citation.get('publishedDate', ''),
+                    'author': citation.get('author', ''),
+                    'snippet': citation.get('snippet', ''),
+                    'text': citation.get('text', '')[:500] if citation.get('text') else '',  # Limit text length
+                    'image': citation.get('image', ''),
+                    'favicon': citation.get('favicon', ''),
+                    'score': citation.get('score', 0)
+                }
+                comprehensive_citations.append(citation_info)
+
+    return {
+        "company_id": company.id,
+        "company": company.name,
+        "paths_checked": watch.include_paths,
+        "urls_found": len(all_urls),
+        "new_urls": len(answer_urls),
+        "answer_skipped": bool(all_urls or page_changes) and not answer_urls,
+        "pages_checked": len(page_changes),
+        "pages_changed": len(changed_pages),
+        "pages_unchanged": len(unchanged_pages),
+        "signals_created": signals_created,
+        "error": "; ".join(errors) or None,
+        "answer_content": answer_content,
+        "citations": comprehensive_citations
+    }
+
+@app.get("/tearsheet/{company_id}", response_model=TearSheetResponse)
+async def get_tearsheet(company_id: int, http_request: Request):
+    """Company tear-sheet with stale-while-revalidate caching.
+
+    Tear-sheets younger than retention.tearsheets_days are served as is.
+    Older ones are served immediately marked stale while one background
+    refresh per company regenerates them for the next request. With
+    ``Accept: application/x-ndjson`` or ``text/event-stream`` the overview,
+    hiring and executives sections are streamed as each one is ready,
+    followed by the full tear-sheet.
+    """
+    mode = stream_mode(http_request)
+    company = db.get_company(company_id)
+    if not company:
+        logger.debug("Company not found for id: %s", company_id)
+        raise HTTPException(status_code=404, detail="Company not found")
+
+    latest_tearsheet = db.get_latest_tearsheet(company_id)
+    if latest_tearsheet is None:
+        logger.debug("No existing tearsheets found, generating new one")
+        if mode is not None:
+            return streaming_response(stream_events(lambda emit: generate_tearsheet_sections(company, emit), "tearsheet"), mode)
+        return await tearsheet_flight.do(company_id, lambda: build_tearsheet(company))
+
+    age = datetime.utcnow() - latest_tearsheet.generated_at
+    cache_duration_days = tearsheet_cache_days()
+    stale = age.days >= cache_duration_days
+    logger.debug("Found existing tearsheet from %s (%s days old, cache duration %s days)",
+                 latest_tearsheet.generated_at, age.days, cache_duration_days)
+    if stale:
+        refresh_tearsheet_in_background(company)
+
+    tearsheet_response = TearSheetResponse(
+        company=company,
+        overview=latest_tearsheet.overview,
+        executives=latest_tearsheet.executives,
+        hiring_signals=latest_tearsheet.hiring_signals,
+        citations=latest_tearsheet.citations,
+        generated_at=latest_tearsheet.generated_at,
+        age_seconds=int(age.total_seconds()),
+        stale=stale
+    )
+    if mode is not None:
+        return streaming_response(stored_tearsheet_events(tearsheet_response), mode)
+    return tearsheet_response
+
+def tearsheet_sections(tearsheet: TearSheetResponse) -> List[Tuple[str, dict]]:
+    """The streamed sections of a tear-sheet, in display order"""
+    return [
+        ("overview", {"overview": tearsheet.overview, "citations": tearsheet.citations}),
+        ("hiring", {"hiring_signals": tearsheet.hiring_signals}),
+        ("executives", {"executives": tearsheet.executives})
+    ]
+
+def overview_section(urls: List[str], answer_result: Optional[dict]) -> dict:
+    if not urls:
+        return {"overview": "No information available - no search results found", "citations": []}
+    return {"overview": answer_result.get("answer", "No overview available"), "citations": urls}
+
+async def stored_tearsheet_events(tearsheet: TearSheetResponse):
+    for section in tearsheet_sections(tearsheet):
+        yield section
+    yield "tearsheet", tearsheet
+
+async def generate_tearsheet_sections(company: Company, emit: Emit) -> TearSheetResponse:
+    """Generate a tear-sheet, emitting each section as soon as it is ready.
+
+    A request that joins a generation already in flight cannot observe its
+    sections, so whatever was not emitted is sent once the result is in.
+    """
+    sent = set()
+
+    def emit_section(name: str, data: dict) -> None:
+        sent.add(name)
+        emit(name, data)
+
+    tearsheet = await tearsheet_flight.do(company.id, lambda: build_tearsheet(company, emit_section))
+    for name, data in tearsheet_sections(tearsheet):
+        if name not in sent:
+            emit(name, data)
+    return tearsheet
+
+def tearsheet_cache_days() -> int:
+    """Tear-sheet freshness window from settings, default 7 days"""
+    try:
+        settings_config = db.get_latest_settings_configuration()
+        if settings_config and settings_config.retention:
+            return settings_config.retention.get("tearsheets_days", 7)
+    except Exception as e:
+        logger.warning("Error getting settings config, using default 7 days: %s", e)
+    return 7
+
+# Strong references to background refreshes so they are not garbage collected
+_tearsheet_refreshes: Set[asyncio.Task] = set()
+
+def refresh_tearsheet_in_background(company: Company) -> None:
+    """Regenerate a stale tear-sheet unless a generation for the company is already running"""
+    if tearsheet_flight.in_flight(company.id):
+        return
+    logger.debug("Scheduling background refresh of tearsheet for %s", company.name)
+    task = asyncio.create_task(tearsheet_flight.do(company.id, lambda: build_tearsheet(company)))
+    _tearsheet_refreshes.add(task)
+
+    def _done(done: asyncio.Task) -> None:
+        _tearsheet_refreshes.discard(done)
+        if not done.cancelled() and done.exception() is not None:
+            logger.warning("Background tearsheet refresh for %s failed: %s", company.name, done.exception())
+
+    task.add_done_callback(_done)
+
+async def build_tearsheet(company: Company, emit: Optional[Emit] = None) -> TearSheetResponse:
+    """Generate a fresh tear-sheet from Exa and save it; ``emit`` receives each section when ready"""
+    company_id = company.id
+    logger.debug("Starting tear-sheet generation for %s", company.name)
     
     try:
         exa = get_exa_client()
-        print(f"DEBUG: Got Exa client successfully")
-        
-        search_domains = company.domains.copy()
-        if company.linkedin_url:
-            search_domains.append("linkedin.com/company")
-        
-        print(f"DEBUG: Search domains: {search_domains}")
-        
-        # Search for company overview
-        search_result = await exa.search(
-            query=f"{company.name} company overview funding customers",
-            num_results=15
+        logger.debug("Got Exa client successfully")
+
+        async def overview_and_answer():
+            # Search for company overview, then summarize the hits
+            search_result = await exa.search(
+                query=f"{company.name} company overview funding customers",
+                num_results=15
+            )
+            logger.debug("Search result: %s", preview(search_result))
+            urls = [result["url"] for result in search_result.get("results", [])]
+            logger.debug("URLs found: %s", len(urls))
+            if not urls:
+                return urls, None
+            answer_result = await exa.answer(
+                query=f"Summarize what {company.name} does, their leadership team, recent releases, and notable customers. Include citations.",
+                urls=urls,
+                text=True
+            )
+            logger.debug("Answer result: %s", preview(answer_result))
+            return urls, answer_result
+
+        async def section(name: str, part, render):
+            value = await part
+            if emit is not None:
+                emit(name, render(value))
+            return value
+
+        # The overview chain, hiring analysis and executives are independent, so they overlap
+        (urls, answer_result), hiring_data, executives_data = await asyncio.gather(
+            section("overview", overview_and_answer(), lambda value: overview_section(*value)),
+            section("hiring", hiring_engine.analyze(exa, company), lambda value: {"hiring_signals": value}),
+            section("executives", get_executives_data(company_id), lambda value: {"executives": value})
         )
-        
-        print(f"DEBUG: Search result: {search_result}")
-        
-        urls = [result["url"] for result in search_result.get("results", [])]
-        print(f"DEBUG: URLs found: {len(urls)}")
-        
-        # Search for hiring activity on LinkedIn - specific to company jobs page
-        print(f"DEBUG: Starting LinkedIn job search for {company.name}")
-        current_year = datetime.now().year
-        last_year = current_year - 1
-        
-        hiring_data = {
-            "current_year_jobs": 0,
-            "last_year_jobs": 0,
-            "departments": {
-                "Product": [],
-                "Engineering": [],
-                "Finance": [],
-                "Strategy": [],
-                "Operations": []
-            },
-            "hiring_trends": "No data available"
-        }
-        
-        try:
-            # Search for specific job types on LinkedIn using multiple targeted searches
-            departments = {
-                "Product": [],
-                "Engineering": [],
-                "Finance": [],
-                "Strategy": [],
-                "Operations": []
-            }
-            
-            # Define job search queries for each department
-            job_queries = {
-                "Product": [
-                    f"{company.name} product manager jobs site:linkedin.com",
-                    f"{company.name} product designer jobs site:linkedin.com",
-                    f"{company.name} product marketing jobs site:linkedin.com",
-                    f"{company.name} UX designer jobs site:linkedin.com"
-                ],
-                "Engineering": [
-                    f"{company.name} software engineer jobs site:linkedin.com",
-                    f"{company.name} backend engineer jobs site:linkedin.com",
-                    f"{company.name} frontend engineer jobs site:linkedin.com",
-                    f"{company.name} data engineer jobs site:linkedin.com",
-                    f"{company.name} devops engineer jobs site:linkedin.com"
-                ],
-                "Finance": [
-                    f"{company.name} financial analyst jobs site:linkedin.com",
-                    f"{company.name} finance manager jobs site:linkedin.com",
-                    f"{company.name} accounting jobs site:linkedin.com",
-                    f"{company.name} controller jobs site:linkedin.com"
-                ],
-                "Strategy": [
-                    f"{company.name} strategy manager jobs site:linkedin.com",
-                    f"{company.name} business development jobs site:linkedin.com",
-                    f"{company.name} corporate development jobs site:linkedin.com",
-                    f"{company.name} business analyst jobs site:linkedin.com"
-                ],
-                "Operations": [
-                    f"{company.name} operations manager jobs site:linkedin.com",
-                    f"{company.name} program manager jobs site:linkedin.com",
-                    f"{company.name} project manager jobs site:linkedin.com",
-                    f"{company.name} operations analyst jobs site:linkedin.com"
-                ]
-            }
-            
-            total_jobs_found = 0
-            
-            # Search for each department's job types
-            for dept, queries in job_queries.items():
-                print(f"DEBUG: Searching for {dept} jobs...")
-                dept_jobs = []
-                
-                for query in queries:
-                    print(f"DEBUG: Query: {query}")
-                    try:
-                        search_result = await exa.search(
-                            query=query,
-                            include_domains=["linkedin.com"],
-                            num_results=10,
-                            start_published_date=f"{current_year}-01-01",
-                            end_published_date=f"{current_year}-12-31"
-                        )
-                        
-                        if search_result and isinstance(search_result, dict):
-                            results = search_result.get("results", [])
-                            print(f"DEBUG: Found {len(results)} results for {query}")
-                            
-                            # Extract job titles from search results
-                            for result in results:
-                                title = result.get("title", "")
-                                if title and company.name.lower() in title.lower():
-                                    # Clean up the title
-                                    clean_title = title.replace(f"{company.name} - ", "").replace(f"{company.name} ", "")
-                                    if clean_title and clean_title not in dept_jobs:
-                                        dept_jobs.append(clean_title)
-                                        total_jobs_found += 1
-                        
-                    except Exception as e:
-                        print(f"DEBUG: Error searching for {dept} jobs: {str(e)}")
-                        continue
-                
-                departments[dept] = dept_jobs
-                print(f"DEBUG: {dept} jobs found: {dept_jobs}")
-            
-            # Also search for last year's jobs for comparison using same department approach
-            last_year_jobs = 0
-            try:
-                print(f"DEBUG: Searching for {last_year} jobs using department approach...")
-                
-                # Use the same department-specific approach for last year
-                for dept, queries in job_queries.items():
-                    for query in queries:
-                        # Modify query for last year
-                        last_year_query = query.replace(f"{current_year}", f"{last_year}")
-                        print(f"DEBUG: Last year query: {last_year_query}")
-                        
-                        try:
-                            search_result = await exa.search(
-                                query=last_year_query,
-                                include_domains=["linkedin.com"],
-                                num_results=10,
-                                start_published_date=f"{last_year}-01-01",
-                                end_published_date=f"{last_year}-12-31"
-                            )
-                            
-                            if search_result and isinstance(search_result, dict):
-                                results = search_result.get("results", [])
-                                print(f"DEBUG: Found {len(results)} results for {last_year_query}")
-                                
-                                # Count jobs that match the company name
-                                for result in results:
-                                    title = result.get("title", "")
-                                    if title and company.name.lower() in title.lower():
-                                        last_year_jobs += 1
-                        
-                        except Exception as e:
-                            print(f"DEBUG: Error searching {dept} jobs for {last_year}: {str(e)}")
-                            continue
-                
-                print(f"DEBUG: Total last year jobs found: {last_year_jobs}")
-                    
-            except Exception as e:
-                print(f"DEBUG: Error searching last year jobs: {str(e)}")
-            
-            # Generate hiring trends analysis
-            hiring_trends = f"""
-            **Hiring Analysis for {company.name}:**
-            
-            **Current Year Job Count:** {total_jobs_found}
-            **Last Year Job Count:** {last_year_jobs}
-            
-            **Department Breakdown:**
-            - Product: {len(departments['Product'])} roles
-            - Engineering: {len(departments['Engineering'])} roles  
-            - Finance: {len(departments['Finance'])} roles
-            - Strategy: {len(departments['Strategy'])} roles
-            - Operations: {len(departments['Operations'])} roles
-            
-            **Key Insights:**
-            - Most active department: {max(departments.items(), key=lambda x: len(x[1]))[0]} with {max(len(jobs) for jobs in departments.values())} roles
-            - Total active job postings: {total_jobs_found}
-            - Year-over-year change: {'+' if total_jobs_found > last_year_jobs else ''}{total_jobs_found - last_year_jobs} jobs
-            """
-            
-            hiring_data = {
-                "current_year_jobs": total_jobs_found,
-                "last_year_jobs": last_year_jobs,
-                "departments": departments,
-                "hiring_trends": hiring_trends,
-                "analysis_details": {"method": "direct_linkedin_search"}
-            }
-            
-            print(f"DEBUG: Final hiring data: {hiring_data}")
-                
-        except Exception as e:
-            print(f"DEBUG: Error in hiring analysis: {str(e)}")
-            import traceback
-            print(f"DEBUG: Hiring analysis traceback: {traceback.format_exc()}")
-        
+
         if not urls:
-            print("DEBUG: No URLs found, returning basic response")
-            # Get executives data even if no URLs found
-            try:
-                exec_response = await get_company_executives(company_id)
-                executives_data = {
-                    "executives": exec_response.get("executives", []),
-                    "recent_hires": exec_response.get("recent_hires", []),
-                    "total_executives": exec_response.get("total_executives", 0),
-                    "total_recent_hires": exec_response.get("total_recent_hires", 0)
-                }
-            except Exception as e:
-                print(f"DEBUG: Error getting executives data: {e}")
-                executives_data = {
-                    "executives": [],
-                    "recent_hires": [],
-                    "total_executives": 0,
-                    "total_recent_hires": 0,
-                    "error": str(e)
-                }
-            
+            logger.debug("No URLs found, returning basic response")
             return TearSheetResponse(
                 company=company,
-                overview="No information available - no search results found",
                 executives=executives_data,
                 hiring_signals=hiring_data,
-                citations=[]
+                **overview_section(urls, answer_result)
             )
         
-        answer_result = await exa.answer(
-            query=f"Summarize what {company.name} does, their leadership team, recent releases, and notable customers. Include citations.",
-            urls=urls,
-            text=True
-        )
-        
-        print(f"DEBUG: Answer result: {answer_result}")
-        
-        # Get executives data
-        try:
-            exec_response = await get_company_executives(company_id)
-            executives_data = {
-                "executives": exec_response.get("executives", []),
-                "recent_hires": exec_response.get("recent_hires", []),
-                "total_executives": exec_response.get("total_executives", 0),
-                "total_recent_hires": exec_response.get("total_recent_hires", 0)
-            }
-        except Exception as e:
-            print(f"DEBUG: Error getting executives data: {e}")
-            executives_data = {
-                "executives": [],
-                "recent_hires": [],
-                "total_executives": 0,
-                "total_recent_hires": 0,
-                "error": str(e)
-            }
-        
         # Create tearsheet response
         tearsheet_response = TearSheetResponse(
             company=company,
-            overview=answer_result.get("answer", "No overview available"),
             executives=executives_data,
             hiring_signals=hiring_data,
-            citations=urls
+            **overview_section(urls, answer_result),
+            generated_at=datetime.utcnow(),
+            age_seconds=0
         )
         
+        if "error" in executives_data:
+            # Serve it, but do not store a tear-sheet that would show no executives until it goes stale
+            logger.warning("Not saving tear-sheet for %s: %s", company.name, executives_data["error"])
+            return tearsheet_response
+
         # Save tearsheet to database
         tearsheet = TearSheet(
             company_id=company.id,
@@ -696,32 +897,83 @@ async def get_tearsheet(company_id: int):
             executives=tearsheet_response.executives,
             hiring_signals=tearsheet_response.hiring_signals,
             citations=tearsheet_response.citations,
-            generated_at=datetime.utcnow()
+            generated_at=tearsheet_response.generated_at
         )
         
         saved_tearsheet = db.create_tearsheet(tearsheet)
-        print(f"DEBUG: Saved fresh tearsheet with ID: {saved_tearsheet.id}")
+        logger.debug("Saved fresh tearsheet with ID: %s", saved_tearsheet.id)
         
         return tearsheet_response
     
     except Exception as e:
-        print(f"DEBUG: Exception occurred: {str(e)}")
-        print(f"DEBUG: Exception type: {type(e)}")
-        import traceback
-        print(f"DEBUG: Traceback: {traceback.format_exc()}")
+        logger.exception("Error generating tear-sheet for company %s", company_id)
         raise HTTPException(status_code=500, detail=f"Error generating tear-sheet: {str(e)}")
 
+async def get_executives_data(company_id: int) -> dict:
+    """Executives section of a tear-sheet; errors are reported inline rather than raised"""
+    try:
+        exec_response = await get_company_executives(company_id)
+        executives_data = {
+            "executives": exec_response.get("executives", []),
+            "recent_hires": exec_response.get("recent_hires", []),
+            "total_executives": exec_response.get("total_executives", 0),
+            "total_recent_hires": exec_response.get("total_recent_hires", 0)
+        }
+        if exec_response.get("error"):
+            executives_data["error"] = exec_response["error"]
+        return executives_data
+    except Exception as e:
+        logger.warning("Error getting executives data: %s", e)
+        return {
+            "executives": [],
+            "recent_hires": [],
+            "total_executives": 0,
+            "total_recent_hires": 0,
+            "error": str(e)
+        }
+
 @app.get("/signals", response_model=List[Signal])
-async def list_signals(company_id: Optional[int] = None):
-    """List signals/alerts"""
-    return db.list_signals(company_id=company_id)
+async def list_signals(
+    response: Response,
+    company_id: Optional[int] = None,
+    type: Optional[SignalType] = None,
+    severity: Optional[SignalSeverity] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """List signals/alerts newest first.
+
+    With ``limit`` one page is returned and ``X-Next-Cursor`` carries the
+    cursor for the next one; ``X-Total-Count`` counts every match.
+    """
+    signals, next_key, total = db.page_signals(
+        company_id, type, severity, naive_utc(created_after), naive_utc(created_before), limit, decode_cursor(cursor)
+    )
+    set_page_headers(response, next_key, total)
+    return signals
+
+@app.get("/diffs", response_model=List[Diff])
+async def list_diffs(company_id: Optional[int] = None):
+    """List page diffs recorded by watchlist change detection"""
+    return db.list_diffs(company_id=company_id)
 
 @app.get("/tearsheets", response_model=List[TearSheet])
-async def list_tearsheets(company_id: Optional[int] = None):
-    """List all saved tearsheets"""
-    if company_id:
-        return db.get_tearsheets_by_company(company_id)
-    return db.list_tearsheets()
+async def list_tearsheets(
+    response: Response,
+    company_id: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """List saved tearsheets newest first, paginated like /signals"""
+    tearsheets, next_key, total = db.page_tearsheets(
+        company_id, naive_utc(created_after), naive_utc(created_before), limit, decode_cursor(cursor)
+    )
+    set_page_headers(response, next_key, total)
+    return tearsheets
 
 @app.post("/tearsheets/{tearsheet_id}/make_old")
 async def make_tearsheet_old(tearsheet_id: int):
@@ -734,25 +986,96 @@ async def make_tearsheet_old(tearsheet_id: int):
     old_date = datetime.utcnow() - timedelta(days=8)
     tearsheet.generated_at = old_date
     
-    print(f"DEBUG: Made tearsheet {tearsheet_id} appear old (from {old_date})")
+    logger.debug("Made tearsheet %s appear old (from %s)", tearsheet_id, old_date)
     return {"message": f"Tearsheet {tearsheet_id} timestamp set to 8 days ago", "new_date": old_date}
 
 @app.post("/signals/detect", response_model=List[SignalResponse])
-async def detect_signals(request: SignalDetectionRequest):
-    """Detect signals using Exa API with advanced discovery and analysis"""
+async def detect_signals(request: SignalDetectionRequest, response: Response, http_request: Request):
+    """Detect signals using Exa API, cached server-side for signals_cache_duration_seconds.
+
+    With ``Accept: application/x-ndjson`` or ``text/event-stream`` a
+    ``meta`` event is sent right away, then one ``signal`` event per
+    signal and a closing ``done`` event.
+    """
     company = db.get_company(request.company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    
+
+    key = signal_cache_key(request)
+    ttl = signals_cache_ttl()
+    cached = signals_cache.get(key, ttl=ttl)
+    mode = stream_mode(http_request)
+    if mode is not None:
+        events = signal_events(company, request, key, cached)
+        # A miss streams before we know whether it is cacheable, so only hits carry freshness headers
+        headers = {"X-Cache": "MISS"} if cached is None else {"X-Cache": "HIT", **signal_cache_headers(ttl, cached[1])}
+        return streaming_response(events, mode, headers=headers)
+    if cached is not None:
+        signals, age = cached
+        response.headers["X-Cache"] = "HIT"
+    else:
+        signals, cacheable = await signals_flight.do(key, lambda: run_signal_detection(company, request))
+        if cacheable:
+            signals_cache.set(key, signals)
+        age = 0
+        response.headers["X-Cache"] = "MISS"
+        if not cacheable:
+            response.headers["Cache-Control"] = "no-store"
+            return signals
+    response.headers.update(signal_cache_headers(ttl, age))
+    return signals
+
+def signal_cache_headers(ttl: int, age: float) -> dict:
+    return {"Cache-Control": f"private, max-age={max(0, int(ttl - age))}", "Age": str(int(age))}
+
+@app.delete("/signals/detect/cache")
+async def invalidate_signal_cache(company_id: Optional[int] = None):
+    """Drop cached detection results, for one company or all of them"""
+    if company_id is None:
+        return {"invalidated": signals_cache.invalidate()}
+    return {"invalidated": signals_cache.invalidate(lambda key: key[0] == company_id)}
+
+async def signal_events(company: Company, request: SignalDetectionRequest, key: tuple, cached: Optional[tuple]):
+    yield "meta", {"company_id": company.id, "vendor": company.name, "cache": "MISS" if cached is None else "HIT"}
+    if cached is not None:
+        signals = cached[0]
+    else:
+        signals, cacheable = await signals_flight.do(key, lambda: run_signal_detection(company, request))
+        if cacheable:
+            signals_cache.set(key, signals)
+    for signal in signals:
+        yield "signal", signal
+    yield "done", {"count": len(signals)}
+
+def signal_cache_key(request: SignalDetectionRequest) -> tuple:
+    return (
+        request.company_id,
+        tuple(sorted(t.value for t in request.signal_types)),
+        tuple(sorted(request.include_paths)),
+        request.start_date.isoformat() if request.start_date else None,
+        request.end_date.isoformat() if request.end_date else None,
+        request.use_livecrawl
+    )
+
+def signals_cache_ttl() -> int:
+    settings_config = db.get_latest_settings_configuration()
+    return settings_config.signals_cache_duration_seconds if settings_config else 3600
+
+async def run_signal_detection(company: Company, request: SignalDetectionRequest) -> Tuple[List[SignalResponse], bool]:
+    """Search for a company's recent updates; returns (signals, cacheable).
+
+    The mock and no-results fallbacks are not cacheable, so an Exa outage
+    is not served back for the whole cache window.
+    """
     signals = []
     
     # Check if Exa API key is available
     try:
         exa = get_exa_client()
-        print(f"DEBUG: Exa client created successfully")
+        logger.debug("Exa client created successfully")
     except ValueError as e:
         # If no API key, return mock signals for demonstration
-        print(f"DEBUG: Exa API key not available: {e}")
+        logger.warning("Exa API key not available: %s", e)
         mock_signal = SignalResponse(
             id=999,
             type=SignalType.PRODUCT_UPDATE,
@@ -773,11 +1096,11 @@ async def detect_signals(request: SignalDetectionRequest):
             citations=[f"https://{company.domains[0].replace('https://', '').replace('http://', '')}"]
         )
         signals.append(mock_signal)
-        return signals
+        return signals, False
     
     # Use Exa API with retry mechanism to get recent pricing and product updates
     try:
-        print(f"DEBUG: Using Exa API with retry for {company.name}")
+        logger.debug("Using Exa API with retry for %s", company.name)
         
         # Create search query for recent updates - prioritize last 7 days but allow up to 30 days
         from datetime import datetime, timedelta
@@ -835,63 +1158,60 @@ async def detect_signals(request: SignalDetectionRequest):
             }
         ]
         
-        all_urls = []
-        all_results = []
-        
-        # Try each strategy until we get results
-        for strategy_idx, strategy in enumerate(search_strategies):
-            print(f"DEBUG: Trying search strategy {strategy_idx + 1}: {strategy['description']}")
-            
-            strategy_results = []
-            for query in strategy["queries"]:
-                try:
-                    # Use include_domains to focus on the company's website
-                    domain = company.domains[0].replace('https://', '').replace('http://', '')
-                    
-                    # Build search parameters
-                    search_params = {
-                        "query": query,
-                        "num_results": 5,
-                        "type": "auto"
-                    }
-                    
-                    # Add domain filter if specified
-                    if strategy["include_domains"]:
-                        search_params["include_domains"] = [domain]
-                    
-                    # Add date filter if specified
-                    if strategy["date_filter"]:
-                        date_range_start = start_date_7d if "last week" in query or "this week" in query else start_date_30d
-                        search_params["start_published_date"] = date_range_start
-                        search_params["end_published_date"] = current_date
-                    
-                    search_result = await exa.search(**search_params)
-                    
-                    if search_result and search_result.get("results"):
-                        results = search_result["results"]
-                        strategy_results.extend(results)
-                        print(f"DEBUG: Found {len(results)} URLs for query: {query}")
-                        print(f"DEBUG: URLs: {[r['url'] for r in results]}")
-                    
-                except Exception as e:
-                    print(f"DEBUG: Error searching for {query}: {e}")
-                    continue
-            
-            # If this strategy found results, use them and break
-            if strategy_results:
-                print(f"DEBUG: Strategy {strategy_idx + 1} successful! Found {len(strategy_results)} results")
-                all_results.extend(strategy_results)
-                all_urls.extend([r["url"] for r in strategy_results])
-                break
-            else:
-                print(f"DEBUG: Strategy {strategy_idx + 1} found no results, trying next strategy...")
+        domain = company.domains[0].replace('https://', '').replace('http://', '')
+
+        async def run_query(strategy: dict, query: str) -> List[dict]:
+            try:
+                # Build search parameters
+                search_params = {
+                    "query": query,
+                    "num_results": 5,
+                    "type": "auto"
+                }
+                
+                # Add domain filter if specified
+                if strategy["include_domains"]:
+                    search_params["include_domains"] = [domain]
+                
+                # Add date filter if specified
+                if strategy["date_filter"]:
+                    date_range_start = start_date_7d if "last week" in query or "this week" in query else start_date_30d
+                    search_params["start_published_date"] = date_range_start
+                    search_params["end_published_date"] = current_date
+                
+                search_result = await exa.search(**search_params)
+                
+                if search_result and search_result.get("results"):
+                    logger.debug("Found %s URLs for query: %s", len(search_result["results"]), query)
+                    return search_result["results"]
+            except Exception as e:
+                logger.warning("Error searching for %s: %s", query, e)
+            return []
+
+        def strategy_attempt(strategy_idx: int, strategy: dict):
+            async def attempt() -> List[dict]:
+                logger.debug("Trying search strategy %s: %s", strategy_idx + 1, strategy['description'])
+                # A strategy's queries run together; gather keeps them in query order
+                per_query = await asyncio.gather(*[run_query(strategy, query) for query in strategy["queries"]])
+                return [result for results in per_query for result in results]
+            return attempt
+
+        # Lower-priority strategies start speculatively after a stagger; the
+        # highest-priority strategy with results wins and the rest are cancelled
+        winner, strategy_results = await strategy_executor.first_success(
+            [strategy_attempt(idx, strategy) for idx, strategy in enumerate(search_strategies)]
+        )
+        all_results = strategy_results or []
+        all_urls = [r["url"] for r in all_results]
+        if winner is not None:
+            logger.debug("Strategy %s successful! Found %s results", winner + 1, len(all_results))
         
         # Remove duplicates
         all_urls = list(set(all_urls))
-        print(f"DEBUG: Total unique URLs found: {len(all_urls)}")
+        logger.debug("Total unique URLs found: %s", len(all_urls))
         
         if all_results:
-            print(f"DEBUG: Found {len(all_results)} search results for {company.name}, creating signals from search metadata")
+            logger.debug("Found %s search results for %s, creating signals from search metadata", len(all_results), company.name)
             
             # Create signals from search result metadata (titles, descriptions)
             for i, result in enumerate(all_results[:3]):  # Limit to first 3 results
@@ -900,7 +1220,7 @@ async def detect_signals(request: SignalDetectionRequest):
                     title = result.get("title", "")
                     description = result.get("snippet", "") or result.get("text", "") or ""
                     
-                    print(f"DEBUG: Creating signal {i+1} from result: {title}")
+                    logger.debug("Creating signal %s from result: %s", i+1, title)
                     
                     # Create meaningful content from title and description
                     if title and description:
@@ -931,22 +1251,21 @@ async def detect_signals(request: SignalDetectionRequest):
                         citations=[url]
                     )
                     signals.append(signal)
-                    print(f"DEBUG: Created signal {i+1} with content: {content[:100]}...")
+                    logger.debug("Created signal %s with content: %s", i+1, preview(content, 100))
                     
                 except Exception as e:
-                    print(f"DEBUG: Error creating signal from result {i+1}: {e}")
+                    logger.warning("Error creating signal from result %s: %s", i+1, e)
                     continue
         else:
-            print(f"DEBUG: All search strategies failed - no results found for {company.name}")
+            logger.info("All search strategies failed - no results found for %s", company.name)
                 
     except Exception as e:
-        print(f"DEBUG: Error using Exa API with retry for {company.name}: {e}")
-        import traceback
-        print(f"DEBUG: Traceback: {traceback.format_exc()}")
+        logger.warning("Error using Exa API with retry for %s: %s", company.name, e, exc_info=True)
     
     # If no signals were found, return a fallback signal
+    cacheable = bool(signals)
     if not signals:
-        print(f"DEBUG: No signals found for {company.name}, creating fallback signal")
+        logger.debug("No signals found for %s, creating fallback signal", company.name)
         fallback_signal = SignalResponse(
             id=999,
             type=SignalType.PRODUCT_UPDATE,
@@ -968,12 +1287,12 @@ async def detect_signals(request: SignalDetectionRequest):
         )
         signals.append(fallback_signal)
     
-    return signals
+    return signals, cacheable
 
 @app.post("/reports/weekly", response_model=Report)
 async def generate_weekly_report(request: WeeklyReportRequest):
     """Generate a weekly report"""
-    signals = db.list_signals()
+    signals = db.list_signals(created_after=naive_utc(request.period_start))
     
     filtered_signals = [
         s for s in signals 
@@ -1007,9 +1326,19 @@ async def generate_weekly_report(request: WeeklyReportRequest):
     return db.create_report(report)
 
 @app.get("/reports", response_model=List[Report])
-async def list_reports():
-    """List all reports"""
-    return db.list_reports()
+async def list_reports(
+    response: Response,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """List reports newest first, paginated like /signals"""
+    reports, next_key, total = db.page_reports(
+        naive_utc(created_after), naive_utc(created_before), limit, decode_cursor(cursor)
+    )
+    set_page_headers(response, next_key, total)
+    return reports
 
 @app.get("/sources/configuration", response_model=SourcesConfiguration)
 async def get_sources_configuration():
@@ -1072,149 +1401,161 @@ async def get_settings_configuration():
 async def save_settings_configuration(config: SettingsConfiguration):
     """Save or update settings configuration"""
     if config.id and config.id in db.settings_configurations:
-        return db.update_settings_configuration(config)
+        config = db.update_settings_configuration(config)
     else:
-        return db.create_settings_configuration(config)
+        config = db.create_settings_configuration(config)
+    scheduler.wake()
+    return config
 
 @app.get("/companies/activity")
-async def get_company_activity():
-    """Get company activity scores for radar chart visualization"""
-    from datetime import datetime, timedelta
-    import asyncio
-    import random
-    
-    companies = db.list_companies()
+async def get_company_activity(
+    force_refresh: bool = False,
+    cache_duration_hours: int = 24,
+    company_ids: Optional[List[int]] = Query(None)
+):
+    """Get company activity scores for radar chart visualization.
+
+    Each company's radar searches are cached in the competitive positioning
+    cache for ``cache_duration_hours``; only companies whose entry has
+    expired (or all of them with ``force_refresh``) are searched again.
+    """
+    request = CompetitivePositioningRequest(
+        company_ids=company_ids, force_refresh=force_refresh, cache_duration_hours=cache_duration_hours
+    )
+    key = (tuple(company_ids) if company_ids else None, force_refresh, cache_duration_hours)
+    return await activity_flight.do(key, lambda: build_company_activity(request))
+
+radar_scoring = AdvancedScoringEngine(ScoringConfiguration())
+radar_raw_cache = TTLCache("radar_scores", ttl=24 * 3600, max_entries=10000)
+
+# Bump when the radar queries change so old cached searches are not reused
+RADAR_CACHE_KEY = "radar_searches:v1:90d"
+
+# dimension -> (query suffix, num_results, restrict to the company's domains)
+RADAR_SEARCHES = {
+    "product": ("product updates new features releases innovation", 10, True),
+    "growth": ("growth revenue market expansion", 8, False),
+    "brand": ("brand recognition awards press coverage", 8, False),
+    "pricing": ("pricing strategy cost competitive pricing", 6, True),
+    "customer": ("customer satisfaction reviews testimonials", 6, False),
+    "market": ("market share competitive position industry", 6, False)
+}
+
+async def fetch_radar_searches(exa, company: Company) -> dict:
+    """Run a company's six radar searches concurrently, keeping only what scoring needs"""
+    # Use 3 months for all calculations
+    three_months_ago = datetime.utcnow() - timedelta(days=90)
+
+    async def run(query_suffix: str, num_results: int, own_domains: bool) -> List[dict]:
+        search_result = await exa.search(
+            query=f"{company.name} {query_suffix}",
+            include_domains=company.domains if own_domains and company.domains else None,
+            start_published_date=three_months_ago.isoformat(),
+            num_results=num_results
+        )
+        return [
+            {
+                "url": result.get("url", ""),
+                "title": result.get("title", ""),
+                "publishedDate": result.get("publishedDate"),
+                "score": result.get("score")
+            }
+            for result in search_result.get("results", [])
+        ]
+
+    results = await asyncio.gather(*[run(*spec) for spec in RADAR_SEARCHES.values()])
+    return dict(zip(RADAR_SEARCHES, results))
+
+async def build_company_activity(request: CompetitivePositioningRequest):
+    """Score every watched company across the radar dimensions"""
+    if request.company_ids:
+        companies = [c for c in (db.get_company(cid) for cid in request.company_ids) if c is not None]
+    else:
+        companies = db.list_companies()
     if not companies:
         return []
-    
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    
-    try:
-        exa = get_exa_client()
-    except Exception as e:
-        print(f"Warning: Could not initialize Exa client: {e}")
-        return await get_fallback_activity_scores(companies)
-    
-    async def get_company_radar_data(company):
-        """Get radar chart data for a company"""
+
+    entries = {
+        company.id: None if request.force_refresh else db.get_competitive_positioning_cache(company.id, RADAR_CACHE_KEY)
+        for company in companies
+    }
+    to_refresh = [company for company in companies if entries[company.id] is None]
+    logger.debug("Activity: %s cached, %s to refresh", len(companies) - len(to_refresh), len(to_refresh))
+
+    refreshed = set()
+    if to_refresh:
         try:
-            # Use 3 months for all calculations
-            three_months_ago = datetime.utcnow() - timedelta(days=90)
-            
-            # Get existing signals for this company
-            signals = db.list_signals(company.id)
-            recent_signals = [s for s in signals if s.created_at and s.created_at > three_months_ago]
-            
-            # Search for product updates (last 3 months)
-            product_search = await exa.search(
-                query=f"{company.name} product updates new features releases innovation",
-                include_domains=company.domains if company.domains else None,
-                start_published_date=three_months_ago.isoformat(),
-                num_results=10
-            )
-            
-            # Search for growth/market data (last 3 months)
-            growth_search = await exa.search(
-                query=f"{company.name} growth revenue market expansion",
-                start_published_date=three_months_ago.isoformat(),
-                num_results=8
-            )
-            
-            # Search for brand/press coverage (last 3 months)
-            brand_search = await exa.search(
-                query=f"{company.name} brand recognition awards press coverage",
-                start_published_date=three_months_ago.isoformat(),
-                num_results=8
-            )
-            
-            # Search for pricing strategy (last 3 months)
-            pricing_search = await exa.search(
-                query=f"{company.name} pricing strategy cost competitive pricing",
-                include_domains=company.domains if company.domains else None,
-                start_published_date=three_months_ago.isoformat(),
-                num_results=6
-            )
-            
-            # Search for customer satisfaction (last 3 months)
-            customer_search = await exa.search(
-                query=f"{company.name} customer satisfaction reviews testimonials",
-                start_published_date=three_months_ago.isoformat(),
-                num_results=6
-            )
-            
-            # Search for market share (last 3 months)
-            market_search = await exa.search(
-                query=f"{company.name} market share competitive position industry",
-                start_published_date=three_months_ago.isoformat(),
-                num_results=6
-            )
-            
-            base_activity = len(recent_signals)
-            market_activity = len(recent_signals)  # Use same 3-month signals for all metrics
-            
-            product_innovation = min(100, (len(product_search.get("results", [])) * 8) + 
-                                   (len([s for s in recent_signals if s.type == "product_update"]) * 10) + 
-                                   random.randint(10, 30))
-            
-            growth_rate = min(100, (len(growth_search.get("results", [])) * 10) + 
-                            (base_activity * 5) + random.randint(15, 35))
-            
-            brand_recognition = min(100, (len(brand_search.get("results", [])) * 8) + 
-                                  (base_activity * 6) + random.randint(20, 40))
-            
-            pricing_strategy = min(100, (len(pricing_search.get("results", [])) * 12) + 
-                                 (len([s for s in recent_signals if s.type == "pricing_change"]) * 15) + 
-                                 random.randint(25, 45))
-            
-            customer_satisfaction = min(100, (len(customer_search.get("results", [])) * 10) + 
-                                      (base_activity * 4) + random.randint(30, 50))
-            
-            market_share = min(100, (len(market_search.get("results", [])) * 12) + 
-                             (market_activity * 7) + random.randint(20, 40))
-            
-            # Debug logging for market share calculation
-            print(f"\n=== MARKET SHARE DEBUG for {company.name} ===")
-            print(f"Market search results: {len(market_search.get('results', []))}")
-            print(f"Market activity (3-month signals): {market_activity}")
-            print(f"Base activity: {base_activity}")
-            print(f"Recent signals count: {len(recent_signals)}")
-            print(f"Market share calculation: ({len(market_search.get('results', []))} * 12) + ({market_activity} * 7) + random(20-40)")
-            print(f"Final market share: {market_share}")
-            print("=" * 50)
-            
-            return {
-                "company_id": company.id,
-                "company_name": company.name,
-                "product_innovation": product_innovation,
-                "growth_rate": growth_rate,
-                "brand_recognition": brand_recognition,
-                "pricing_strategy": pricing_strategy,
-                "customer_satisfaction": customer_satisfaction,
-                "market_share": market_share,
-                "domains": company.domains
-            }
-            
+            exa = get_exa_client()
         except Exception as e:
-            print(f"Error processing company {company.name}: {e}")
-            signals = db.list_signals(company.id)
-            three_months_ago = datetime.utcnow() - timedelta(days=90)
-            recent_signals = [s for s in signals if s.created_at and s.created_at > three_months_ago]
-            base_score = len(recent_signals) * 10
-            
-            return {
-                "company_id": company.id,
-                "company_name": company.name,
-                "product_innovation": min(100, base_score + random.randint(20, 40)),
-                "growth_rate": min(100, base_score + random.randint(15, 35)),
-                "brand_recognition": min(100, base_score + random.randint(25, 45)),
-                "pricing_strategy": min(100, base_score + random.randint(20, 40)),
-                "customer_satisfaction": min(100, base_score + random.randint(30, 50)),
-                "market_share": min(100, base_score + random.randint(15, 35)),
-                "domains": company.domains
+            logger.warning("Could not initialize Exa client: %s", e)
+            exa = None
+
+        async def refresh(company: Company) -> None:
+            try:
+                searches = await fetch_radar_searches(exa, company)
+            except Exception as e:
+                logger.warning("Error processing company %s: %s", company.name, e)
+                return
+            expires_at = datetime.utcnow() + timedelta(hours=request.cache_duration_hours)
+            entry = db.get_competitive_positioning_cache(company.id, RADAR_CACHE_KEY, include_expired=True)
+            if entry is None:
+                entry = db.create_competitive_positioning_cache(CompetitivePositioningCache(
+                    company_id=company.id, data={"searches": searches}, cache_key=RADAR_CACHE_KEY, expires_at=expires_at
+                ))
+            else:
+                entry.data = {"searches": searches}
+                entry.expires_at = expires_at
+                db.update_competitive_positioning_cache(entry)
+            entries[company.id] = entry
+            refreshed.add(company.id)
+
+        if exa is not None:
+            # Process all companies concurrently
+            await asyncio.gather(*[refresh(company) for company in to_refresh])
+
+    # Day-truncated so identical inputs score identically for the whole day
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    three_months_ago = today - timedelta(days=90)
+    raw_scores = []
+    for company in companies:
+        entry = entries[company.id]
+        # Get existing signals for this company; companies without Exa results score from these alone
+        recent_signals = [
+            (s.type.value, s.created_at) for s in db.list_signals(company.id, created_after=three_months_ago)
+            if s.created_at and s.created_at > three_months_ago
+        ]
+        # Raw scores only change with the cached searches, the signals or the day
+        key = (
+            company.id,
+            entry.updated_at if entry else None,
+            len(recent_signals),
+            max((created_at for _, created_at in recent_signals), default=None),
+            today
+        )
+        cached = radar_raw_cache.get(key)
+        if cached is None:
+            raw = radar_scoring.radar_raw_scores(
+                {"searches": entry.data["searches"] if entry else {}, "signals": recent_signals}, today
+            )
+            radar_raw_cache.set(key, raw)
+        else:
+            raw = cached[0]
+        raw_scores.append(raw)
+
+    results = []
+    for company, scores in zip(companies, radar_scoring.radar_rows(raw_scores)):
+        entry = entries[company.id]
+        results.append({
+            "company_id": company.id,
+            "company_name": company.name,
+            **scores,
+            "domains": company.domains,
+            "cache": {
+                "hit": entry is not None and company.id not in refreshed,
+                "updated_at": entry.updated_at if entry else None,
+                "expires_at": entry.expires_at if entry else None
             }
-    
-    # Process all companies concurrently
-    results = await asyncio.gather(*[get_company_radar_data(company) for company in companies])
+        })
     
     results.sort(key=lambda x: x["product_innovation"], reverse=True)
     
@@ -1222,18 +1563,27 @@ async def get_company_activity():
 
 @app.get("/companies/{company_id}/executives")
 async def get_company_executives(company_id: int):
-    """Get key executives and recent hires for a company"""
-    from datetime import datetime, timedelta
-    
+    """Get key executives and recent hires for a company, cached per company"""
     # Get company from database
     company = db.get_company(company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    
+
+    cached = executives_cache.get(company_id)
+    if cached is not None:
+        logger.debug("Executives cache hit for %s (%.0fs old)", company.name, cached[1])
+        return copy.deepcopy(cached[0])
+
+    result = await executives_flight.do(company_id, lambda: discover_executives(company))
+    return copy.deepcopy(result)
+
+async def discover_executives(company: Company) -> dict:
+    """Run the executive and recent-hire searches concurrently; the merged result is cached only if every search succeeded"""
+    company_id = company.id
     try:
         exa = get_exa_client()
     except Exception as e:
-        print(f"Warning: Could not initialize Exa client: {e}")
+        logger.warning("Could not initialize Exa client: %s", e)
         return {
             "company_id": company_id,
             "company_name": company.name,
@@ -1251,27 +1601,6 @@ async def get_company_executives(company_id: int):
             f"{company.name} leadership team management executives"
         ]
         
-        executives = []
-        for query in exec_queries:
-            try:
-                exec_search = await exa.search(
-                    query=query,
-                    include_domains=company.domains if company.domains else None,
-                    num_results=5
-                )
-                if exec_search.get("results"):
-                    for result in exec_search["results"]:
-                        executives.append({
-                            "name": result.get("title", "Unknown"),
-                            "snippet": result.get("snippet", ""),
-                            "url": result.get("url", ""),
-                            "published_date": result.get("publishedDate", ""),
-                            "query_type": query.split()[-1]  # Last word indicates what we searched for
-                        })
-            except Exception as e:
-                print(f"Error in executive search for query '{query}': {e}")
-                continue
-        
         # Search for recent executive hires
         hires_queries = [
             f"{company.name} new CEO hire appointment",
@@ -1280,31 +1609,40 @@ async def get_company_executives(company_id: int):
             f"{company.name} executive hire leadership appointment",
             f"{company.name} new leadership team member"
         ]
-        
-        recent_hires = []
-        for query in hires_queries:
+        hires_since = (datetime.utcnow() - timedelta(days=180)).isoformat()
+
+        failed = []
+
+        async def run(query: str, kind: str, **search_args) -> List[dict]:
             try:
-                hires_search = await exa.search(
+                search_result = await exa.search(
                     query=query,
                     include_domains=company.domains if company.domains else None,
-                    start_published_date=(datetime.utcnow() - timedelta(days=180)).isoformat(),
-                    num_results=3
+                    **search_args
                 )
-                if hires_search.get("results"):
-                    for result in hires_search["results"]:
-                        recent_hires.append({
-                            "name": result.get("title", "Unknown"),
-                            "snippet": result.get("snippet", ""),
-                            "url": result.get("url", ""),
-                            "published_date": result.get("publishedDate", ""),
-                            "query_type": query.split()[-1]
-                        })
             except Exception as e:
-                print(f"Error in hires search for query '{query}': {e}")
-                continue
-        
+                logger.warning("Error in %s search for query '%s': %s", kind, query, e)
+                failed.append(query)
+                return []
+            return [
+                {
+                    "name": result.get("title", "Unknown"),
+                    "snippet": result.get("snippet", ""),
+                    "url": result.get("url", ""),
+                    "published_date": result.get("publishedDate", ""),
+                    "query_type": query.split()[-1]  # Last word indicates what we searched for
+                }
+                for result in search_result.get("results") or []
+            ]
+
+        found = await asyncio.gather(
+            *[run(query, "executive", num_results=5) for query in exec_queries],
+            *[run(query, "hires", start_published_date=hires_since, num_results=3) for query in hires_queries]
+        )
+        executives = dedupe_by_url(found[:len(exec_queries)])
+        recent_hires = dedupe_by_url(found[len(exec_queries):])
         
-        return {
+        result = {
             "company_id": company_id,
             "company_name": company.name,
             "executives": executives,
@@ -1312,9 +1650,15 @@ async def get_company_executives(company_id: int):
             "total_executives": len(executives),
             "total_recent_hires": len(recent_hires)
         }
+        # A failed search would pin an incomplete (or, during an outage, empty) result for the whole TTL
+        if not failed:
+            executives_cache.set(company_id, result)
+        elif len(failed) == len(exec_queries) + len(hires_queries):
+            result["error"] = "All executive searches failed"
+        return result
         
     except Exception as e:
-        print(f"Error getting executives for {company.name}: {e}")
+        logger.warning("Error getting executives for %s: %s", company.name, e)
         return {
             "company_id": company_id,
             "company_name": company.name,
@@ -1323,28 +1667,14 @@ async def get_company_executives(company_id: int):
             "error": str(e)
         }
 
-async def get_fallback_activity_scores(companies):
-    """Fallback scoring when Exa API is unavailable"""
-    import random
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    fallback_results = []
-    
-    for company in companies:
-        recent_signals = [s for s in db.list_signals(company.id) 
-                        if s.created_at and s.created_at > seven_days_ago]
-        
-        base_score = len(recent_signals) * 10
-        
-        fallback_results.append({
-            "company_id": company.id,
-            "company_name": company.name,
-            "product_innovation": min(100, base_score + random.randint(20, 40)),
-            "growth_rate": min(100, base_score + random.randint(15, 35)),
-            "brand_recognition": min(100, base_score + random.randint(25, 45)),
-            "pricing_strategy": min(100, base_score + random.randint(20, 40)),
-            "customer_satisfaction": min(100, base_score + random.randint(30, 50)),
-            "market_share": min(100, base_score + random.randint(15, 35)),
-            "domains": company.domains
-        })
-    
-    return fallback_results
+def dedupe_by_url(result_lists: List[List[dict]]) -> List[dict]:
+    """Merge per-query results in query order, keeping the first hit for each URL"""
+    merged = []
+    seen = set()
+    for results in result_lists:
+        for item in results:
+            if item["url"] and item["url"] in seen:
+                continue
+            seen.add(item["url"])
+            merged.append(item)
+    return merged
@@ -30,8 +30,10 @@ class VendorWatch(BaseModel):
     id: Optional[int] = None
     company_id: int
     include_paths: List[str]  # e.g., ["/pricing", "/release-notes", "/security"]
-    last_run_at: Optional[datetime] = None
-    schedule: str = "weekly"
+    last_run_at: Optional[datetime] = None  # Watermark for incremental crawls
+    processed_urls: List[str] = []  # URLs already analyzed by incremental crawls
+    schedule: str = "weekly"  # "daily", "weekly" or "monthly"
+    next_run_at: Optional[datetime] = None  # Set by the crawl scheduler
     created_at: Optional[datetime] = None
 
 class PageSnapshot(BaseModel):
@@ -81,6 +83,50 @@ class AddVendorRequest(BaseModel):
 
 class RunWatchlistRequest(BaseModel):
     company_ids: Optional[List[int]] = None  # If None, run for all companies
+    max_concurrency: Optional[int] = None  # Exa calls in flight across the run (default WATCHLIST_MAX_CONCURRENCY)
+    per_company_concurrency: Optional[int] = None  # Exa calls in flight per company (default WATCHLIST_COMPANY_CONCURRENCY)
+    incremental: bool = True  # Only search since last_run_at and only analyze URLs not seen before
+
+class ScheduledCrawl(BaseModel):
+    watch_id: int
+    company_id: int
+    company: str
+    schedule: str
+    next_run_at: datetime
+    last_run_at: Optional[datetime] = None
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class CompanyJobProgress(BaseModel):
+    company_id: int
+    company: str
+    status: JobStatus = JobStatus.PENDING
+    urls_found: int = 0
+    signals_created: int = 0
+    error: Optional[str] = None
+
+class WatchlistJob(BaseModel):
+    id: str
+    status: JobStatus = JobStatus.PENDING
+    company_ids: List[int]
+    progress: List[CompanyJobProgress] = []
+    companies_total: int = 0
+    companies_done: int = 0
+    urls_found: int = 0
+    signals_created: int = 0
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class WatchlistJobResults(BaseModel):
+    job_id: str
+    status: JobStatus
+    results: List[Dict[str, Any]]
 
 class TearSheet(BaseModel):
     id: Optional[int] = None
@@ -114,6 +160,9 @@ class TearSheetResponse(BaseModel):
     executives: Dict[str, Any]
     hiring_signals: Dict[str, Any]
     citations: List[str]
+    generated_at: Optional[datetime] = None
+    age_seconds: Optional[int] = None
+    stale: bool = False  # Older than retention.tearsheets_days; a refresh is running in the background
 
 class WeeklyReportRequest(BaseModel):
     period_start: datetime
@@ -0,0 +1,35 @@
+import base64
+import binascii
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException, Response
+
+from .database import PageKey
+
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(key: PageKey) -> str:
+    created_at, record_id = key
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{record_id}".encode()).decode()
+
+def decode_cursor(cursor: Optional[str]) -> Optional[PageKey]:
+    """Key to continue after, from an X-Next-Cursor value; 400 if it is malformed"""
+    if not cursor:
+        return None
+    try:
+        created_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Stored timestamps are naive UTC; query parameters may carry an offset
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def set_page_headers(response: Response, next_key: Optional[PageKey], total: int) -> None:
+    response.headers["X-Total-Count"] = str(total)
+    if next_key is not None:
+        response.headers["X-Next-Cursor"] = encode_cursor(next_key)
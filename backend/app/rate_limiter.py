@@ -0,0 +1,127 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .env import env_float, env_int
+
+# Requests per second, burst size and max concurrent requests per Exa endpoint
+DEFAULT_BUDGETS = {
+    "search": {"rps": 10.0, "burst": 10, "concurrency": 10},
+    "contents": {"rps": 5.0, "burst": 5, "concurrency": 5},
+    "answer": {"rps": 2.0, "burst": 2, "concurrency": 3}
+}
+
+class TokenBucket:
+    """Token-bucket rate limiter whose waiters are served in arrival order"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        # asyncio.Lock wakes waiters FIFO, so holding it while sleeping for
+        # the next token queues callers fairly
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+class EndpointBudget:
+    """Rate and concurrency budget for one Exa endpoint, with queue metrics"""
+
+    def __init__(self, name: str, rps: float, burst: int, concurrency: int):
+        self.name = name
+        self.bucket = TokenBucket(rps, burst)
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.waiting = 0
+        self.in_flight = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        queued_at = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                await self.bucket.acquire()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - queued_at
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rps": self.bucket.rate,
+            "burst": self.bucket.capacity,
+            "concurrency": self.concurrency,
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "acquired": self.acquired,
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 2) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2)
+        }
+
+class ExaRateLimiter:
+    """Process-wide governor shared by every ExaClient.
+
+    Each endpoint has its own token bucket (requests per second) and
+    semaphore (requests in flight), so a burst of searches from
+    /companies/activity cannot starve /answer calls and vice versa.
+    """
+
+    def __init__(self, budgets: Optional[Dict[str, Dict[str, float]]] = None):
+        budgets = budgets or DEFAULT_BUDGETS
+        self.budgets = {
+            name: EndpointBudget(name, float(b["rps"]), int(b["burst"]), int(b["concurrency"]))
+            for name, b in budgets.items()
+        }
+
+    @classmethod
+    def from_env(cls) -> "ExaRateLimiter":
+        budgets = {}
+        for name, defaults in DEFAULT_BUDGETS.items():
+            prefix = f"EXA_{name.upper()}"
+            budgets[name] = {
+                "rps": env_float(f"{prefix}_RPS", defaults["rps"]),
+                "burst": env_int(f"{prefix}_BURST", defaults["burst"]),
+                "concurrency": env_int(f"{prefix}_CONCURRENCY", defaults["concurrency"])
+            }
+        return cls(budgets)
+
+    def slot(self, endpoint: str):
+        """Async context manager that holds a rate and concurrency slot for one call"""
+        return self.budgets[endpoint].slot()
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: budget.stats() for name, budget in self.budgets.items()}
+
+rate_limiter = ExaRateLimiter.from_env()
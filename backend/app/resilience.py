@@ -0,0 +1,145 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from .env import env_float, env_int
+
+# Upstream statuses worth another attempt; everything else is returned as-is
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Exa while the circuit breaker is open"""
+
+    def __init__(self, retry_in: float):
+        self.retry_in = retry_in
+        super().__init__(f"Exa circuit breaker is open, retrying in {retry_in:.1f}s")
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RetryPolicy:
+    """Exponential backoff with full jitter that honours Retry-After"""
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_retry_after: float = 30.0
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retries = 0
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            max_retries=env_int("EXA_MAX_RETRIES", 2),
+            base_delay=env_float("EXA_RETRY_BASE_DELAY", 0.5),
+            max_delay=env_float("EXA_RETRY_MAX_DELAY", 8.0),
+            max_retry_after=env_float("EXA_MAX_RETRY_AFTER", 30.0)
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        return self.max_retries + 1
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retrying after the given zero-based attempt"""
+        self.retries += 1
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for the Exa API.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast with CircuitOpenError for ``reset_timeout`` seconds.
+    Then a single probe is let through (half-open): success closes the
+    circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._probe_started_at = 0.0
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=env_int("EXA_BREAKER_FAILURE_THRESHOLD", 5),
+            reset_timeout=env_float("EXA_BREAKER_RESET_TIMEOUT", 30.0)
+        )
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go upstream right now"""
+        if self.state == self.OPEN:
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+            if retry_in > 0:
+                self.rejected += 1
+                raise CircuitOpenError(retry_in)
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) stops blocking after reset_timeout
+            now = time.monotonic()
+            if self._probe_in_flight and now - self._probe_started_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(0.0)
+            self._probe_in_flight = True
+            self._probe_started_at = now
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout": self.reset_timeout,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+retry_policy = RetryPolicy.from_env()
+circuit_breaker = CircuitBreaker.from_env()
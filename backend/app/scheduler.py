@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .database import db
+from .env import env_flag, env_int
+from .models import ScheduledCrawl, VendorWatch
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+# Shortest first, so min() over these picks the more frequent cadence
+FREQUENCIES = ["daily", "weekly", "monthly"]
+DEFAULT_SCHEDULE = {"enabled": True, "frequency": "weekly", "day": "monday", "time": "09:00"}
+
+def parse_time(value: Any) -> Tuple[int, int]:
+    """Parse "HH:MM" into (hour, minute), falling back to 09:00"""
+    try:
+        hour, minute = (int(part) for part in str(value).split(":")[:2])
+    except ValueError:
+        return 9, 0
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return 9, 0
+    return hour, minute
+
+def next_slot(after: datetime, frequency: str, day: str = "monday", time_of_day: str = "09:00") -> datetime:
+    """First scheduled slot strictly after ``after`` (naive UTC).
+
+    Daily runs at ``time_of_day``, weekly on ``day`` at ``time_of_day`` and
+    monthly on the first ``day`` of each month.
+    """
+    hour, minute = parse_time(time_of_day)
+    weekday = WEEKDAYS.index(day.lower()) if str(day).lower() in WEEKDAYS else 0
+    if frequency == "daily":
+        slot = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return slot if slot > after else slot + timedelta(days=1)
+    if frequency == "monthly":
+        year, month = after.year, after.month
+        while True:
+            first = datetime(year, month, 1, hour, minute)
+            slot = first + timedelta(days=(weekday - first.weekday()) % 7)
+            if slot > after:
+                return slot
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    slot = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    slot += timedelta(days=(weekday - after.weekday()) % 7)
+    return slot if slot > after else slot + timedelta(days=7)
+
+def jitter_offset(watch_id: int, window_seconds: int) -> timedelta:
+    # Stable per watch, so restarts keep the same spread instead of reshuffling
+    if window_seconds <= 0:
+        return timedelta(0)
+    digest = hashlib.sha256(str(watch_id).encode()).hexdigest()
+    return timedelta(seconds=int(digest, 16) % window_seconds)
+
+class CrawlScheduler:
+    """Runs due vendor watches from a heap ordered by next run time.
+
+    Each watch's slot comes from the settings schedule (day and time, UTC)
+    at the more frequent of the watch's own ``schedule`` and the settings
+    frequency, shifted by a stable per-watch jitter so watches sharing a
+    slot do not all start at once. Due watches are dispatched in batches
+    of ``max_batch`` and the next batch only starts once the previous one
+    has finished. Next run times are persisted on the watch; the heap uses
+    lazy deletion, so entries whose time no longer matches the watch are
+    skipped.
+    """
+
+    def __init__(self, enabled: bool = True, jitter_seconds: int = 900, max_batch: int = 20, poll_seconds: int = 60):
+        self.enabled = enabled
+        self.jitter_seconds = jitter_seconds
+        self.max_batch = max_batch
+        self.poll_seconds = poll_seconds
+        self._heap: List[Tuple[datetime, int]] = []
+        self._settings_version = -1
+        self._watch_count = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dispatch: Optional[Callable[[List[VendorWatch]], Awaitable[None]]] = None
+        self.runs = 0
+
+    @classmethod
+    def from_env(cls) -> "CrawlScheduler":
+        return cls(
+            enabled=env_flag("SCHEDULER_ENABLED", True),
+            jitter_seconds=env_int("SCHEDULER_JITTER_SECONDS", 900),
+            max_batch=env_int("SCHEDULER_MAX_BATCH", 20),
+            poll_seconds=env_int("SCHEDULER_POLL_SECONDS", 60)
+        )
+
+    @staticmethod
+    def settings_schedule() -> Dict[str, Any]:
+        settings = db.get_latest_settings_configuration()
+        return {**DEFAULT_SCHEDULE, **(settings.schedule if settings else {})}
+
+    def compute_next_run(self, watch: VendorWatch, schedule: Dict[str, Any], now: datetime) -> datetime:
+        cadences = [f for f in (watch.schedule, schedule.get("frequency")) if f in FREQUENCIES]
+        frequency = min(cadences, key=FREQUENCIES.index) if cadences else "weekly"
+        slot = next_slot(watch.last_run_at or now, frequency, schedule.get("day", "monday"), schedule.get("time", "09:00"))
+        # A slot missed while the process was down runs soon, still spread by the jitter
+        return max(slot, now) + jitter_offset(watch.id, self.jitter_seconds)
+
+    def sync(self, now: Optional[datetime] = None) -> None:
+        """Rebuild the heap after settings or the set of watches changed"""
+        now = now or datetime.utcnow()
+        schedule = self.settings_schedule()
+        settings_changed = db.settings_version != self._settings_version
+        self._settings_version = db.settings_version
+        self._watch_count = len(db.vendor_watches)
+        self._heap = []
+        if not schedule.get("enabled", True):
+            return
+        for watch in db.list_vendor_watches():
+            if watch.next_run_at is None or settings_changed:
+                watch.next_run_at = self.compute_next_run(watch, schedule, now)
+            self._heap.append((watch.next_run_at, watch.id))
+        heapq.heapify(self._heap)
+
+    def _stale(self) -> bool:
+        return db.settings_version != self._settings_version or len(db.vendor_watches) != self._watch_count
+
+    def pop_due(self, now: datetime) -> List[VendorWatch]:
+        """Pop up to max_batch due watches and push their next runs"""
+        schedule = self.settings_schedule()
+        due = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.max_batch:
+            run_at, watch_id = heapq.heappop(self._heap)
+            watch = db.vendor_watches.get(watch_id)
+            if watch is None or watch.next_run_at != run_at:
+                continue
+            due.append(watch)
+            # Schedule from the slot just taken, not from last_run_at, which the crawl itself advances
+            watch.next_run_at = self.compute_next_run(watch.model_copy(update={"last_run_at": now}), schedule, now)
+            heapq.heappush(self._heap, (watch.next_run_at, watch.id))
+        return due
+
+    def upcoming(self, limit: int = 50) -> List[ScheduledCrawl]:
+        if self._stale():
+            self.sync()
+        entries = []
+        for run_at, watch_id in heapq.nsmallest(limit, self._heap):
+            watch = db.vendor_watches.get(watch_id)
+            if watch is None or watch.next_run_at != run_at:
+                continue
+            company = db.get_company(watch.company_id)
+            entries.append(ScheduledCrawl(
+                watch_id=watch.id,
+                company_id=watch.company_id,
+                company=company.name if company else "",
+                schedule=watch.schedule,
+                next_run_at=run_at,
+                last_run_at=watch.last_run_at
+            ))
+        return entries
+
+    def wake(self) -> None:
+        """Re-check the heap now, e.g. after settings or watches changed"""
+        if self._wake is not None:
+            self._wake.set()
+
+    def start(self, dispatch: Callable[[List[VendorWatch]], Awaitable[None]]) -> None:
+        """Run the loop; ``dispatch`` crawls one batch of due watches and returns when it is done"""
+        if not self.enabled or self._task is not None:
+            return
+        self._dispatch = dispatch
+        self._wake = asyncio.Event()
+        self.sync()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            if self._stale():
+                self.sync()
+            now = datetime.utcnow()
+            due = self.pop_due(now)
+            if due:
+                self.runs += 1
+                logger.info("Scheduler dispatching %s due watches", len(due))
+                try:
+                    await self._dispatch(due)
+                except Exception:
+                    logger.exception("Scheduled crawl dispatch failed")
+                continue
+
+            delay = self.poll_seconds
+            if self._heap:
+                delay = min(delay, max(0.0, (self._heap[0][0] - now).total_seconds()))
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "scheduled": len(self._heap),
+            "next_run_at": self._heap[0][0].isoformat() if self._heap else None,
+            "runs": self.runs
+        }
+
+scheduler = CrawlScheduler.from_env()
@@ -1,8 +1,25 @@
+import bisect
 import hashlib
 import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
 
+from .models import EventType
+
+# Radar field -> (cached search it scores, event type used for weighting,
+# stored signal types counted as extra events; None counts every signal)
+RADAR_DIMENSIONS = {
+    "product_innovation": ("product", EventType.PRODUCT, {"product_update"}),
+    "growth_rate": ("growth", EventType.FUNDING, None),
+    "brand_recognition": ("brand", EventType.PRESS, None),
+    "pricing_strategy": ("pricing", EventType.PRODUCT, {"pricing_change"}),
+    "customer_satisfaction": ("customer", EventType.PRESS, None),
+    "market_share": ("market", EventType.FUNDING, None)
+}
+
+# Weighted activity that maps to ~63/100 on the radar; scores saturate towards 100
+RADAR_SCALE = 2.5
+
 class AdvancedScoringEngine:
     def __init__(self, config):
         self.config = config
@@ -80,13 +97,16 @@ class AdvancedScoringEngine:
     def calculate_event_score(self, event: Dict[str, Any], event_type, now: datetime) -> float:
         """Calculate final event score with all factors"""
         try:
-            published_date = event.get("publishedDate", now.isoformat())
+            published_date = event.get("publishedDate") or now.isoformat()
             if isinstance(published_date, str):
                 event_time = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
             else:
                 event_time = published_date
-            age_days = (now - event_time).days
-        except:
+            if event_time.tzinfo is not None:
+                # Exa dates are UTC with an offset; compare them as naive UTC like the rest of the app
+                event_time = event_time.astimezone(timezone.utc).replace(tzinfo=None)
+            age_days = max(0, (now - event_time).days)
+        except (TypeError, ValueError):
             age_days = 0
         
         url = event.get("url", "")
@@ -152,14 +172,8 @@ class AdvancedScoringEngine:
             return []
         
         sorted_scores = sorted(scores)
-        percentiles = []
-        
-        for score in scores:
-            rank = sum(1 for s in sorted_scores if s <= score)
-            percentile = (rank / len(sorted_scores)) * 100
-            percentiles.append(percentile)
-        
-        return percentiles
+        # rank = number of scores <= score, found by bisection instead of a scan per score
+        return [(bisect.bisect_right(sorted_scores, score) / len(sorted_scores)) * 100 for score in scores]
     
     def assign_quadrant(self, activity_percentile: float, impact_score: float) -> str:
         """Assign quadrant based on activity percentile and impact score"""
@@ -173,3 +187,46 @@ class AdvancedScoringEngine:
             return "Sleeping Giant"
         else:
             return "Niche/Watch"
+
+    def radar_raw_scores(self, company: Dict[str, Any], now: datetime) -> Dict[str, float]:
+        """Weighted activity per radar dimension for one company.
+
+        ``company`` is ``{"searches": {name: [result, ...]}, "signals":
+        [(signal_type, created_at), ...]}``. Search results become events
+        weighted by source credibility, event type, recency and impact;
+        stored signals count as extra events with recency decay.
+        """
+        raw = {}
+        for field, (search, event_type, signal_types) in RADAR_DIMENSIONS.items():
+            # Copy results so deduplication does not annotate cached data
+            events = self.deduplicate_events([dict(r) for r in company["searches"].get(search, [])])
+            total = sum(self.calculate_event_score(event, event_type, now) for event in events)
+            total += sum(
+                self.recency_decay(max(0, (now - created_at).days))
+                for signal_type, created_at in company["signals"]
+                if signal_types is None or signal_type in signal_types
+            )
+            raw[field] = total
+        return raw
+
+    def radar_rows(self, raw_scores: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """Turn per-company raw activity into 0-100 radar scores plus batch percentiles"""
+        columns = {field: [raw[field] for raw in raw_scores] for field in RADAR_DIMENSIONS}
+        percentiles = {field: self.calculate_percentiles(column) for field, column in columns.items()}
+        rows = []
+        for i in range(len(raw_scores)):
+            row: Dict[str, Any] = {
+                field: round(100 * (1 - math.exp(-column[i] / RADAR_SCALE)))
+                for field, column in columns.items()
+            }
+            row["percentiles"] = {field: round(percentiles[field][i], 1) for field in columns}
+            rows.append(row)
+        return rows
+
+    def score_radar_batch(self, companies: List[Dict[str, Any]], now: datetime) -> List[Dict[str, Any]]:
+        """Score the six radar dimensions for every company in one pass.
+
+        Scores are pure functions of the inputs and ``now``, so callers
+        that pass a day-truncated ``now`` get stable, cacheable output.
+        """
+        return self.radar_rows([self.radar_raw_scores(company, now) for company in companies])
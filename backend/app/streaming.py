@@ -0,0 +1,71 @@
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from .jobs import format_sse
+
+logger = logging.getLogger(__name__)
+
+# Accept header media type -> stream format; anything else gets the plain JSON response
+STREAM_MEDIA_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "text/event-stream": "sse"
+}
+
+Emit = Callable[[str, Any], None]
+
+def stream_mode(request: Request) -> Optional[str]:
+    """"ndjson" or "sse" when the client opted into streaming, else None"""
+    accept = request.headers.get("accept", "")
+    for media_range in accept.split(","):
+        mode = STREAM_MEDIA_TYPES.get(media_range.split(";")[0].strip().lower())
+        if mode is not None:
+            return mode
+    return None
+
+def format_ndjson(event: str, data: Any) -> str:
+    return json.dumps({"event": event, "data": data}, default=str) + "\n"
+
+async def stream_events(produce: Callable[[Emit], Awaitable[Any]], final_event: str) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield (event, data) as ``produce`` emits them, then ``final_event`` with its result.
+
+    ``produce`` runs as its own task so it keeps going between reads; it is
+    cancelled if the client goes away before it finishes.
+    """
+    queue: "asyncio.Queue[Optional[Tuple[str, Any]]]" = asyncio.Queue()
+    task = asyncio.ensure_future(produce(lambda event, data: queue.put_nowait((event, data))))
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            yield item
+        yield final_event, task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+
+async def encode(events: AsyncIterator[Tuple[str, Any]], mode: str) -> AsyncIterator[str]:
+    # Errors after the first byte cannot change the status code, so they become an event
+    format_event = format_sse if mode == "sse" else format_ndjson
+    try:
+        async for event, data in events:
+            yield format_event(event, jsonable_encoder(data))
+    except HTTPException as e:
+        yield format_event("error", {"status_code": e.status_code, "detail": e.detail})
+    except Exception as e:
+        logger.exception("Streaming response failed")
+        yield format_event("error", {"status_code": 500, "detail": str(e)})
+
+def streaming_response(events: AsyncIterator[Tuple[str, Any]], mode: str, headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    return StreamingResponse(
+        encode(events, mode),
+        media_type="text/event-stream" if mode == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", **(headers or {})}
+    )
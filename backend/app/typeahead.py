@@ -0,0 +1,223 @@
+import bisect
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .models import CompanySearchResult
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def index_terms(name: str, domains: List[str]) -> Set[str]:
+    """Searchable terms for a company: its name, each host and each host's first label"""
+    terms = {normalize_query(name)}
+    for domain in domains:
+        host = domain.lower().strip()
+        if host.startswith("www."):
+            host = host[4:]
+        terms.update((host, host.split(".")[0]))
+    terms.discard("")
+    return terms
+
+class TypeaheadCache:
+    """LRU cache of company search hits that also answers prefixes of cached queries.
+
+    Keys are normalized queries kept in a sorted list, so every cached
+    query starting with a given prefix is a contiguous run found by
+    bisection. Backspacing from "stripe" to "stri" is then served from the
+    "stripe" hits instead of going back to Exa. Entries expire after
+    ``ttl`` seconds.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # query -> (stored_at, hits, limit the search ran with)
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]], int]]" = OrderedDict()
+        self._keys: List[str] = []
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remove(self, key: str) -> None:
+        del self._entries[key]
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def get(self, query: str, max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """Hits for ``query`` from an exact or longer cached query, else None.
+
+        An exact entry answers if it was searched with at least
+        ``max_results``; a longer query only if it holds that many hits.
+        """
+        prefix = normalize_query(query)
+        now = time.time()
+        index = bisect.bisect_left(self._keys, prefix)
+        expired = []
+        found = None
+        while index < len(self._keys) and self._keys[index].startswith(prefix):
+            key = self._keys[index]
+            index += 1
+            stored_at, hits, limit = self._entries[key]
+            if now - stored_at >= self.ttl:
+                expired.append(key)
+                continue
+            if len(hits) >= max_results or (key == prefix and limit >= max_results):
+                found = key
+                break
+        for key in expired:
+            self._remove(key)
+
+        if found is None:
+            self.misses += 1
+            return None
+        if found == prefix:
+            self.hits += 1
+        else:
+            self.prefix_hits += 1
+        self._entries.move_to_end(found)
+        return self._entries[found][1][:max_results]
+
+    def set(self, query: str, hits: List[Dict[str, Any]], limit: int) -> None:
+        key = normalize_query(query)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.time(), hits, limit)
+        bisect.insort(self._keys, key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> int:
+        removed = len(self._entries)
+        self._entries.clear()
+        self._keys = []
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "prefix_hits": self.prefix_hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+class CompanyNameIndex:
+    """In-memory name and domain index for instant company search.
+
+    Holds watchlist companies and earlier company search results, one
+    entry per primary domain. Search results must be indexed under a name
+    taken from the result itself, never from the query that found it.
+    Terms are kept in a sorted list for prefix lookups by bisection and in
+    trigram posting lists for fuzzy matches, so a typo like "strpie" still
+    finds "stripe". Watchlist entries always replace and outrank search
+    results for the same domain.
+    """
+
+    def __init__(self, max_entries: int = 10000, min_similarity: float = 0.4):
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        # domain key -> (is watchlist company, result)
+        self._entries: Dict[str, Tuple[bool, CompanySearchResult]] = {}
+        self._entry_terms: Dict[str, Set[str]] = {}
+        self._terms: List[Tuple[str, str]] = []
+        self._postings: Dict[str, Set[Tuple[str, str]]] = {}
+        self._gram_counts: Dict[str, int] = {}
+        # watchlist company id -> key of its entry
+        self._company_keys: Dict[int, str] = {}
+        self.lookups = 0
+        self.served = 0
+
+    @staticmethod
+    def entry_key(result: CompanySearchResult) -> str:
+        return result.domains[0].lower() if result.domains else normalize_query(result.name)
+
+    def add(self, result: CompanySearchResult, watchlist: bool = False) -> bool:
+        """Index ``result``; returns False if an entry it may not replace exists or the index is full"""
+        key = self.entry_key(result)
+        existing = self._entries.get(key)
+        if existing is not None:
+            if existing[0] or not watchlist:
+                return False
+            self._remove(key)
+        elif not watchlist and len(self._entries) >= self.max_entries:
+            return False
+
+        self._entries[key] = (watchlist, result)
+        terms = index_terms(result.name, result.domains)
+        self._entry_terms[key] = terms
+        for term in terms:
+            bisect.insort(self._terms, (term, key))
+            grams = trigrams(term)
+            self._gram_counts[term] = len(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add((term, key))
+        return True
+
+    def index_company(self, company_id: int, result: CompanySearchResult) -> None:
+        """Add or refresh a watchlist company, dropping its old entry if its name or domains changed"""
+        old_key = self._company_keys.get(company_id)
+        if old_key is not None and old_key in self._entries:
+            if self._entries[old_key][1] == result:
+                return
+            self._remove(old_key)
+        self._company_keys.pop(company_id, None)
+        if self.add(result, watchlist=True):
+            self._company_keys[company_id] = self.entry_key(result)
+
+    def _remove(self, key: str) -> None:
+        del self._entries[key]
+        for term in self._entry_terms.pop(key):
+            index = bisect.bisect_left(self._terms, (term, key))
+            del self._terms[index]
+            for gram in trigrams(term):
+                self._postings[gram].discard((term, key))
+
+    def search(self, query: str, limit: int) -> List[CompanySearchResult]:
+        """Up to ``limit`` entries: prefix matches, then fuzzy matches, watchlist first"""
+        self.lookups += 1
+        prefix = normalize_query(query)
+        if not prefix or limit <= 0:
+            return []
+
+        # key -> (fuzzy?, search result?, -similarity); lower sorts first
+        ranked: Dict[str, Tuple[int, int, float]] = {}
+        index = bisect.bisect_left(self._terms, (prefix, ""))
+        while index < len(self._terms) and self._terms[index][0].startswith(prefix):
+            key = self._terms[index][1]
+            ranked[key] = (0, 0 if self._entries[key][0] else 1, 0.0)
+            index += 1
+
+        query_grams = trigrams(prefix)
+        shared = Counter(match for gram in query_grams for match in self._postings.get(gram, ()))
+        for (term, key), count in shared.items():
+            similarity = 2 * count / (len(query_grams) + self._gram_counts[term])
+            if similarity < self.min_similarity:
+                continue
+            rank = (1, 0 if self._entries[key][0] else 1, -similarity)
+            if rank < ranked.get(key, (2, 0, 0.0)):
+                ranked[key] = rank
+
+        keys = sorted(ranked, key=lambda key: (ranked[key], len(self._entries[key][1].name), key))
+        results = [self._entries[key][1] for key in keys[:limit]]
+        if len(results) >= limit:
+            self.served += 1
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "watchlist": sum(1 for watchlist, _ in self._entries.values() if watchlist),
+            "terms": len(self._terms),
+            "lookups": self.lookups,
+            "served_locally": self.served
+        }
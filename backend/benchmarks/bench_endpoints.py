@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark every Exa-backed endpoint in app/main.py offline against the
+fake Exa server (app/fake_exa.py).
+
+Reports wall-clock latency and upstream Exa calls per request. Use --save to
+write a baseline and --compare to fail when an endpoint regresses:
+
+    cd backend && python benchmarks/bench_endpoints.py --profile fast --save baseline.json
+    cd backend && python benchmarks/bench_endpoints.py --profile fast --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_fake_exa(port: int):
+    import uvicorn
+    from app.fake_exa import create_app, FakeExaProfile
+    from app.fixtures import FixtureStore
+
+    fixtures = FixtureStore(os.environ["FAKE_EXA_FIXTURES"]) if os.getenv("FAKE_EXA_FIXTURES") else None
+    fake = create_app(fixtures, FakeExaProfile.from_env())
+    server = uvicorn.Server(uvicorn.Config(fake, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+def seed_companies(db, count: int):
+    from app.models import Company, VendorWatch
+    ids = []
+    for i in range(count):
+        company = db.create_company(Company(name=f"Benchco{i}", domains=[f"benchco{i}.example"]))
+        db.create_vendor_watch(VendorWatch(company_id=company.id, include_paths=["/pricing", "/changelog", "/security"]))
+        ids.append(company.id)
+    return ids
+
+async def run(args):
+    import httpx
+    from app.main import app, executives_cache, signals_cache
+    from app.database import db
+
+    company_ids = seed_companies(db, args.companies)
+    first = company_ids[0]
+    scenarios = {
+        "POST /companies/search": ("POST", "/companies/search", {"query": "benchco", "max_results": 10}),
+        "POST /run/watchlist": ("POST", "/run/watchlist", {"company_ids": [first]}),
+        "GET /tearsheet/{id}": ("GET", f"/tearsheet/{first}", None),
+        "POST /signals/detect": ("POST", "/signals/detect", {"company_id": first}),
+        "GET /companies/activity": ("GET", "/companies/activity", None),
+        "GET /companies/{id}/executives": ("GET", f"/companies/{first}/executives", None)
+    }
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://backend", timeout=None) as client, \
+            httpx.AsyncClient(base_url=os.environ["EXA_BASE_URL"]) as fake:
+        for name, (method, path, body) in scenarios.items():
+            if args.only and args.only not in name:
+                continue
+            timings = []
+            upstream = 0
+            for _ in range(args.iterations):
+                # Drop stored tear-sheets and cached results so every iteration measures a cold generation
+                db.tearsheets.clear()
+                executives_cache.invalidate()
+                signals_cache.invalidate()
+                db.competitive_positioning_cache.clear()
+                await fake.post("/_reset")
+                start = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                response.raise_for_status()
+                if path == "/run/watchlist":
+                    # The crawl runs in the background; its event stream ends once the job has finished
+                    job_id = response.json()["id"]
+                    await client.get(f"/run/watchlist/jobs/{job_id}/events")
+                    job = (await client.get(f"/run/watchlist/jobs/{job_id}")).json()
+                    if job["status"] != "completed":
+                        raise RuntimeError(f"watchlist job {job_id} ended {job['status']}: {job['error']}")
+                timings.append((time.perf_counter() - start) * 1000)
+                stats = (await fake.get("/_stats")).json()
+                upstream += sum(s["requests"] for s in stats.values())
+            results[name] = {
+                "mean_ms": round(statistics.mean(timings), 1),
+                "p50_ms": round(statistics.median(timings), 1),
+                "max_ms": round(max(timings), 1),
+                "exa_calls": round(upstream / args.iterations, 1)
+            }
+            print(f"{name:<34} mean={results[name]['mean_ms']:9.1f}ms  p50={results[name]['p50_ms']:9.1f}ms  "
+                  f"exa_calls={results[name]['exa_calls']:6.1f}")
+    return results
+
+def compare(results, baseline, tolerance: float) -> bool:
+    ok = True
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        limit = previous["p50_ms"] * (1 + tolerance)
+        if current["p50_ms"] > limit or current["exa_calls"] > previous["exa_calls"]:
+            print(f"REGRESSION {name}: p50 {previous['p50_ms']}ms -> {current['p50_ms']}ms, "
+                  f"exa_calls {previous['exa_calls']} -> {current['exa_calls']}")
+            ok = False
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", default="fast", help="fake Exa profile (instant, fast, realistic, flaky, throttled)")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--companies", type=int, default=5)
+    parser.add_argument("--only", help="run only scenarios whose name contains this string")
+    parser.add_argument("--with-cache", action="store_true", help="keep the Exa response cache enabled")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare against a JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown for --compare")
+    args = parser.parse_args()
+
+    port = free_port()
+    os.environ["FAKE_EXA_PROFILE"] = args.profile
+    os.environ.setdefault("FAKE_EXA_SEED", "7")
+    os.environ["EXA_BASE_URL"] = f"http://127.0.0.1:{port}"
+    os.environ["EXA_API_KEY"] = "fake-exa-key"
+    os.environ["EXA_CACHE_ENABLED"] = "true" if args.with_cache else "false"
+    # The fake server shapes throughput itself; keep the client-side limiter out of the way
+    for endpoint in ("SEARCH", "CONTENTS", "ANSWER"):
+        os.environ.setdefault(f"EXA_{endpoint}_RPS", "0")
+        os.environ.setdefault(f"EXA_{endpoint}_CONCURRENCY", "64")
+
+    start_fake_exa(port)
+    results = asyncio.run(run(args))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if not compare(results, json.load(f), args.tolerance):
+                sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call Exa latency with a fresh httpx client per call vs the
+shared ExaHTTPPool, measured against a local stub server.
+
+The stub can add an artificial delay to every new connection to stand in for
+the TCP+TLS handshake that a real api.exa.ai call pays.
+
+    cd backend && python benchmarks/bench_http_pool.py --calls 200 --handshake-ms 40
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.exa_cache import ExaResponseCache  # noqa: E402
+from app.exa_client import ExaClient, ExaHTTPPool  # noqa: E402
+from app.rate_limiter import DEFAULT_BUDGETS, ExaRateLimiter  # noqa: E402
+
+STUB_BODY = json.dumps({"results": [{"url": "https://example.com", "title": "Example"}]}).encode()
+
+async def handle_connection(reader, writer, handshake_delay: float):
+    # Simulated handshake: paid once per connection, not once per request
+    await asyncio.sleep(handshake_delay)
+    try:
+        while True:
+            headers = b""
+            while b"\r\n\r\n" not in headers:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                headers += chunk
+            head, _, body = headers.partition(b"\r\n\r\n")
+            content_length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    content_length = int(value.strip())
+            while len(body) < content_length:
+                body += await reader.read(content_length - len(body))
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"content-type: application/json\r\n"
+                b"content-length: " + str(len(STUB_BODY)).encode() + b"\r\n"
+                b"connection: keep-alive\r\n\r\n" + STUB_BODY
+            )
+            await writer.drain()
+    except (ConnectionResetError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def time_calls(search, calls: int):
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        await search(f"benchmark query {i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def report(label: str, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<28} mean={statistics.mean(latencies):7.2f}ms  "
+          f"p50={statistics.median(latencies):7.2f}ms  p95={p95:7.2f}ms")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--handshake-ms", type=float, default=40.0,
+                        help="artificial delay added to every new connection")
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(r, w, args.handshake_ms / 1000),
+        "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def fresh_client_search(query: str):
+        # Old behaviour: one AsyncClient (and connection) per call
+        async with httpx.AsyncClient() as client:
+            response = await client.post(f"{base_url}/search", json={"query": query}, timeout=30.0)
+            response.raise_for_status()
+            return response.json()
+
+    pool = ExaHTTPPool()
+    # Measure only the transport: no rate limiting and no cached responses
+    unthrottled = ExaRateLimiter({name: {"rps": 0, "burst": 1, "concurrency": 64} for name in DEFAULT_BUDGETS})
+    pooled = ExaClient(
+        "benchmark-key",
+        base_url=base_url,
+        pool=pool,
+        cache=ExaResponseCache(enabled=False),
+        limiter=unthrottled
+    )
+
+    async with server:
+        fresh = await time_calls(fresh_client_search, args.calls)
+        shared = await time_calls(pooled.search, args.calls)
+        await pool.close()
+
+    print(f"{args.calls} sequential /search calls, {args.handshake_ms:.0f}ms simulated handshake")
+    report("fresh client per call", fresh)
+    report("shared ExaHTTPPool", shared)
+    saved = statistics.mean(fresh) - statistics.mean(shared)
+    print(f"saved per call: {saved:.2f}ms ({saved / statistics.mean(fresh) * 100:.0f}%)")
+
+if __name__ == "__main__":
+    asyncio.run(main())
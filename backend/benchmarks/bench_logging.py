@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of the old print-based DEBUG tracing vs the leveled, lazy
+logger on a hot path that dumps a whole Exa search result.
+
+    cd backend && python benchmarks/bench_logging.py --results 100 --calls 200
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.log import preview  # noqa: E402
+
+def fake_search_result(n: int):
+    return {
+        "requestId": "bench",
+        "results": [
+            {
+                "url": f"https://example.com/post/{i}",
+                "title": f"Example post {i}",
+                "publishedDate": "2024-01-01T00:00:00.000Z",
+                "text": "lorem ipsum dolor sit amet " * 400
+            }
+            for i in range(n)
+        ]
+    }
+
+def timed(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=100, help="results per fake search response")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    result = fake_search_result(args.results)
+    query = "Stripe pricing changes updates plans"
+
+    logger = logging.getLogger("app.bench")
+    logger.propagate = False
+    devnull = open(os.devnull, "w")
+    logger.addHandler(logging.StreamHandler(devnull))
+
+    def old_print():
+        with contextlib.redirect_stdout(devnull):
+            print(f"DEBUG: Search result for query '{query}': {result}")
+
+    def new_logger():
+        logger.debug("Search result for query '%s': %s", query, preview(result))
+
+    old_ms = timed(old_print, args.calls)
+    logger.setLevel(logging.INFO)
+    disabled_ms = timed(new_logger, args.calls)
+    logger.setLevel(logging.DEBUG)
+    enabled_ms = timed(new_logger, args.calls)
+
+    size_kb = len(str(result)) / 1024
+    print(f"payload ~{size_kb:.0f} KB, {args.calls} calls")
+    print(f"{'print(f-string)':<30} {old_ms:9.4f} ms/call")
+    print(f"{'logger.debug, level=INFO':<30} {disabled_ms:9.4f} ms/call")
+    print(f"{'logger.debug + preview, DEBUG':<30} {enabled_ms:9.4f} ms/call")
+
+if __name__ == "__main__":
+    main()
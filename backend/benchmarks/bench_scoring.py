@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch radar scoring for /companies/activity with
+AdvancedScoringEngine.score_radar_batch on synthetic cached search results.
+
+    cd backend && python benchmarks/bench_scoring.py --companies 1000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.models import ScoringConfiguration  # noqa: E402
+from app.scoring_engine import AdvancedScoringEngine  # noqa: E402
+
+# (search name, results per company) as issued by fetch_radar_searches
+SEARCHES = [("product", 10), ("growth", 8), ("brand", 8), ("pricing", 6), ("customer", 6), ("market", 6)]
+DOMAINS = ["techcrunch.com", "company{}.com/blog/post", "news.example.com", "medium.com", "company{}.com"]
+TITLE_WORDS = ["launch", "feature", "update", "release", "interview", "pricing", "critical", "partnership"]
+
+def synthetic_companies(count: int, now: datetime, seed: int):
+    rng = random.Random(seed)
+    companies = []
+    for c in range(count):
+        searches = {}
+        for name, n in SEARCHES:
+            searches[name] = [
+                {
+                    "url": f"https://{rng.choice(DOMAINS).format(c)}/{name}/{i}",
+                    "title": f"Company{c} {rng.choice(TITLE_WORDS)} {i}",
+                    "publishedDate": (now - timedelta(days=rng.randint(0, 90))).strftime("%Y-%m-%dT00:00:00.000Z"),
+                    "score": rng.random()
+                }
+                for i in range(n)
+            ]
+        signals = [
+            (rng.choice(["product_update", "pricing_change", "security_update"]), now - timedelta(days=rng.randint(0, 90)))
+            for _ in range(rng.randint(0, 5))
+        ]
+        companies.append({"searches": searches, "signals": signals})
+    return companies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    now = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    companies = synthetic_companies(args.companies, now, args.seed)
+    engine = AdvancedScoringEngine(ScoringConfiguration())
+
+    timings = []
+    outputs = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        outputs.append(engine.score_radar_batch(companies, now))
+        timings.append((time.perf_counter() - start) * 1000)
+
+    events = sum(len(results) for company in companies for results in company["searches"].values())
+    print(f"{args.companies} companies, {events} events, {args.iterations} iterations")
+    print(f"score_radar_batch  mean={statistics.mean(timings):8.1f}ms  p50={statistics.median(timings):8.1f}ms  "
+          f"per company={statistics.median(timings) / args.companies * 1000:6.1f}us")
+    print(f"deterministic: {all(output == outputs[0] for output in outputs)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from app.change_detection import compute_diff, diff_severity
+from app.models import SignalSeverity
+
+OLD = "# Plans\nStarter $10/mo\nTeam $20/mo\n# FAQ\nBilled monthly\n"
+
+def test_identical_text_has_no_changes():
+    diff = compute_diff(OLD, OLD)
+    assert diff["sections"] == []
+    assert diff["change_ratio"] == 0
+
+def test_modified_section_lists_added_and_removed_lines():
+    diff = compute_diff(OLD, OLD.replace("Team $20/mo", "Team $25/mo"))
+    assert [s["section"] for s in diff["sections"]] == ["Plans"]
+    assert diff["sections"][0]["change"] == "modified"
+    assert diff["lines_added"] == 1
+    assert diff["lines_removed"] == 1
+
+def test_added_and_removed_sections():
+    diff = compute_diff(OLD, OLD.replace("# FAQ\nBilled monthly\n", "# Support\nEmail us\n"))
+    changes = {s["section"]: s["change"] for s in diff["sections"]}
+    assert changes == {"Support": "added", "FAQ": "removed"}
+
+def test_price_change_on_pricing_page_is_high():
+    diff = compute_diff(OLD, OLD.replace("Team $20/mo", "Team $25/mo"))
+    assert diff_severity("pricing", diff) == SignalSeverity.HIGH
+
+def test_small_edit_elsewhere_is_low():
+    old = "# Notes\n" + "".join(f"Line {i}\n" for i in range(100))
+    diff = compute_diff(old, old.replace("Line 3\n", "Line three\n"))
+    assert diff_severity("changelog", diff) == SignalSeverity.LOW
+
+def test_large_rewrite_is_high():
+    diff = compute_diff("# Notes\nOne\nTwo\n", "# Notes\nThree\nFour\n")
+    assert diff_severity("changelog", diff) == SignalSeverity.HIGH
+
+CHANGELOG = "# Changelog\n## v1.1\n### Bug fixes\nFixed login\n### Features\nAdded SSO\n"
+
+def test_repeated_headings_under_new_release_are_diffed():
+    new = CHANGELOG.replace(
+        "## v1.1",
+        "## v1.2\n### Bug fixes\nFixed export\nFixed billing page\n## v1.1"
+    )
+    diff = compute_diff(CHANGELOG, new)
+    assert diff["lines_added"] == 2
+    assert diff["lines_removed"] == 0
+    assert [(s["section"], s["change"]) for s in diff["sections"]] == [("Changelog > v1.2 > Bug fixes", "added")]
+    assert diff["sections"][0]["added"] == ["Fixed export", "Fixed billing page"]
+    assert diff_severity("changelog", diff) == SignalSeverity.HIGH
+
+def test_repeated_heading_within_one_section():
+    old = "# Notes\n### Fixes\nOne\n### Fixes\nTwo\n"
+    diff = compute_diff(old, old.replace("Two", "Three"))
+    assert diff["lines_added"] == 1
+    assert diff["lines_removed"] == 1
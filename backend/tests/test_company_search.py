@@ -0,0 +1,37 @@
+import asyncio
+
+from app import main
+from app.models import CompanySearchRequest
+
+class FakeExa:
+    def __init__(self, fail_variants=()):
+        self.fail_variants = fail_variants
+        self.calls = 0
+
+    async def search(self, query, **kwargs):
+        self.calls += 1
+        if query in self.fail_variants:
+            raise RuntimeError("Exa unavailable")
+        slug = query.split()[0]
+        return {"results": [{"url": f"https://{slug}{len(query)}.example/", "title": slug, "snippet": ""}]}
+
+def test_hits_merge_variants_in_priority_order():
+    hits, failed = asyncio.run(main.search_company_hits(FakeExa(), "quokka", 5))
+    assert not failed
+    assert [hit["domain"] for hit in hits] == ["quokka14.example", "quokka17.example", "quokka6.example"]
+
+def test_failed_variant_is_reported():
+    hits, failed = asyncio.run(main.search_company_hits(FakeExa(fail_variants=("quokka company",)), "quokka", 5))
+    assert failed
+    assert len(hits) == 2
+
+def test_search_during_outage_is_not_cached(monkeypatch):
+    down = FakeExa(fail_variants=("wombatco company", "wombatco site:*.com", "wombatco"))
+    monkeypatch.setattr(main, "get_exa_client", lambda: down)
+    request = CompanySearchRequest(query="wombatco", max_results=3)
+    assert asyncio.run(main.search_companies(request)).total_results == 0
+
+    recovered = FakeExa()
+    monkeypatch.setattr(main, "get_exa_client", lambda: recovered)
+    assert asyncio.run(main.search_companies(request)).total_results == 3
+    assert recovered.calls == 3
@@ -0,0 +1,80 @@
+import os
+import time
+
+from app.exa_cache import ExaResponseCache
+
+def disk_keys(path):
+    return sorted(name[:-len(".json")] for name in os.listdir(path) if name.endswith(".json"))
+
+def test_key_ignores_time_of_day_and_field_order():
+    first = ExaResponseCache.make_key("search", {"query": "acme", "startPublishedDate": "2026-10-01T09:00:00"})
+    second = ExaResponseCache.make_key("search", {"startPublishedDate": "2026-10-01T17:30:00", "query": "acme"})
+    assert first == second
+    assert first != ExaResponseCache.make_key("answer", {"query": "acme", "startPublishedDate": "2026-10-01"})
+    assert first != ExaResponseCache.make_key("search", {"query": "acme", "startPublishedDate": "2026-10-02"})
+
+def test_hit_returns_a_copy():
+    cache = ExaResponseCache()
+    cache.set("search", "k", {"results": [1]})
+    cache.get("search", "k")["results"].append(2)
+    assert cache.get("search", "k") == {"results": [1]}
+    assert cache.stats()["endpoints"]["search"] == {"hits": 2, "misses": 0}
+
+def test_expired_entry_misses_but_is_served_stale():
+    cache = ExaResponseCache(ttls={"search": 0})
+    cache.set("search", "k", {"v": 1})
+    time.sleep(0.001)
+    assert cache.get("search", "k") is None
+    assert cache.get_stale("search", "k") == {"v": 1}
+
+def test_lru_evicts_least_recently_used():
+    cache = ExaResponseCache(max_entries=2)
+    cache.set("search", "a", {})
+    cache.set("search", "b", {})
+    cache.get("search", "a")
+    cache.set("search", "c", {})
+    assert cache.get("search", "b") is None
+    assert cache.get("search", "a") == {}
+
+def test_disabled_cache_stores_nothing():
+    cache = ExaResponseCache(enabled=False)
+    cache.set("search", "k", {"v": 1})
+    assert cache.get("search", "k") is None
+    assert cache.get_stale("search", "k") is None
+
+def test_invalidate_and_clear_remove_both_tiers(tmp_path):
+    cache = ExaResponseCache(disk_dir=str(tmp_path))
+    cache.set("search", "a", {})
+    cache.set("search", "b", {})
+    cache.invalidate("a")
+    assert disk_keys(tmp_path) == ["b"]
+    assert cache.clear() == 1
+    assert disk_keys(tmp_path) == []
+    assert cache.get("search", "b") is None
+
+def test_eviction_removes_disk_file(tmp_path):
+    cache = ExaResponseCache(max_entries=2, disk_dir=str(tmp_path))
+    for key in ("a", "b", "c"):
+        cache.set("search", key, {"key": key})
+    assert disk_keys(tmp_path) == ["b", "c"]
+    assert cache.evictions == 1
+
+def test_restart_loads_newest_files_and_deletes_the_rest(tmp_path):
+    cache = ExaResponseCache(max_entries=3, disk_dir=str(tmp_path))
+    for i, key in enumerate(("a", "b", "c")):
+        cache.set("search", key, {"key": key})
+        os.utime(tmp_path / f"{key}.json", (1000 + i, 1000 + i))
+    (tmp_path / "d.json.tmp").write_text("partial")
+    (tmp_path / "e.json").write_text("not json")
+
+    restarted = ExaResponseCache(max_entries=2, disk_dir=str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ["b.json", "c.json"]
+    assert restarted.get("search", "c") == {"key": "c"}
+    assert restarted.stats()["entries"] == 2
+
+def test_disk_tier_stays_bounded_after_restart(tmp_path):
+    ExaResponseCache(max_entries=2, disk_dir=str(tmp_path)).set("search", "old", {})
+    cache = ExaResponseCache(max_entries=2, disk_dir=str(tmp_path))
+    for key in ("a", "b", "c"):
+        cache.set("search", key, {})
+    assert disk_keys(tmp_path) == ["b", "c"]
@@ -0,0 +1,40 @@
+import asyncio
+
+from app.hedging import HedgedExecutor
+
+def attempt(result, delay=0.0, error=None):
+    async def run():
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+    return run
+
+def run(attempts, stagger=0.01):
+    executor = HedgedExecutor("test", stagger=stagger)
+    return asyncio.run(executor.first_success(attempts)), executor
+
+def test_higher_priority_success_beats_faster_fallback():
+    (index, result), _ = run([attempt("primary", delay=0.05), attempt("fallback")])
+    assert (index, result) == (0, "primary")
+
+def test_fallback_wins_once_primary_fails():
+    (index, result), _ = run([attempt(None, delay=0.02), attempt("fallback", delay=0.03)])
+    assert (index, result) == (1, "fallback")
+
+def test_exceptions_count_as_failures():
+    (index, result), _ = run([attempt(None, error=RuntimeError("down")), attempt([]), attempt(["hit"])])
+    assert (index, result) == (2, ["hit"])
+
+def test_no_success_returns_none():
+    assert run([attempt(None), attempt([])])[0] == (None, None)
+
+def test_fallback_not_launched_when_primary_wins_quickly():
+    (index, _), executor = run([attempt("primary"), attempt("fallback")], stagger=1.0)
+    assert index == 0
+    assert executor.launched == 1
+
+def test_slower_attempts_cancelled_after_win():
+    (index, _), executor = run([attempt("primary", delay=0.02), attempt("fallback", delay=1.0)])
+    assert index == 0
+    assert executor.cancelled == 1
@@ -0,0 +1,40 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.database import InMemoryDatabase, db
+from app.jobs import JobManager
+from app.models import JobStatus, WatchlistJob
+
+def test_prune_keeps_most_recently_finished_and_running_jobs():
+    database = InMemoryDatabase()
+    now = datetime(2026, 10, 1)
+    for i in range(4):
+        job = database.create_watchlist_job(WatchlistJob(id=f"job{i}", company_ids=[]))
+        job.finished_at = now + timedelta(minutes=i)
+        database.save_watchlist_job_results(job.id, [{"answer_content": "x"}])
+    database.create_watchlist_job(WatchlistJob(id="running", company_ids=[]))
+
+    assert database.prune_watchlist_jobs(2) == 2
+    assert sorted(database.watchlist_jobs) == ["job2", "job3", "running"]
+    assert sorted(database.watchlist_job_results) == ["job2", "job3"]
+
+def test_manager_drops_old_jobs_when_one_finishes():
+    manager = JobManager(max_finished_jobs=2)
+
+    async def run_jobs():
+        jobs = []
+        for _ in range(3):
+            job = manager.create([])
+            jobs.append(job)
+
+            async def run(job):
+                return [{"job": job.id}]
+            manager.start(job, run)
+            await manager.wait(job.id)
+        return jobs
+
+    first, second, third = asyncio.run(run_jobs())
+    assert third.status == JobStatus.COMPLETED
+    assert db.get_watchlist_job(first.id) is None
+    assert db.get_watchlist_job_results(first.id) is None
+    assert db.get_watchlist_job_results(third.id) == [{"job": third.id}]
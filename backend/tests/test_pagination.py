@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.database import KeysetIndex
+from app.models import Signal, SignalSeverity, SignalType
+from app.pagination import decode_cursor, encode_cursor, naive_utc
+
+BASE = datetime(2026, 1, 1, 12, 0)
+
+def make_signals(count=6):
+    """Signals one hour apart, alternating company and severity"""
+    table, index = {}, KeysetIndex(("company_id", "type", "severity"))
+    for i in range(count):
+        signal = Signal(
+            id=i + 1,
+            company_id=1 + i % 2,
+            type=SignalType.PRICING_CHANGE if i < 3 else SignalType.PRODUCT_UPDATE,
+            title=f"Signal {i + 1}",
+            summary="",
+            severity=SignalSeverity.HIGH if i % 3 == 0 else SignalSeverity.LOW,
+            confidence=0.9,
+            urls=[],
+            created_at=BASE + timedelta(hours=i)
+        )
+        table[signal.id] = signal
+        index.add(signal)
+    return table, index
+
+def ids(records):
+    return [record.id for record in records]
+
+def test_pages_walk_newest_first_without_gaps():
+    table, index = make_signals()
+    seen, after_key = [], None
+    while True:
+        records, after_key, total = index.page(table, limit=4, after_key=after_key)
+        seen.extend(ids(records))
+        assert total == 6
+        if after_key is None:
+            break
+    assert seen == [6, 5, 4, 3, 2, 1]
+
+def test_no_cursor_when_page_ends_exactly_at_last_match():
+    table, index = make_signals()
+    records, next_key, _ = index.page(table, limit=3)
+    assert next_key == (table[4].created_at, 4)
+    records, next_key, _ = index.page(table, limit=3, after_key=next_key)
+    assert ids(records) == [3, 2, 1]
+    assert next_key is None
+
+def test_cursor_continues_within_same_timestamp():
+    table, index = make_signals(0)
+    for record_id in (1, 2, 3):
+        signal = Signal(id=record_id, company_id=1, type=SignalType.HIRING, title="", summary="",
+                        severity=SignalSeverity.LOW, confidence=1.0, urls=[], created_at=BASE)
+        table[record_id] = signal
+        index.add(signal)
+    records, next_key, _ = index.page(table, limit=2)
+    assert ids(records) == [3, 2]
+    records, next_key, _ = index.page(table, limit=2, after_key=next_key)
+    assert ids(records) == [1]
+    assert next_key is None
+
+def test_created_after_is_inclusive_and_created_before_exclusive():
+    table, index = make_signals()
+    records, _, total = index.page(
+        table,
+        created_after=BASE + timedelta(hours=1),
+        created_before=BASE + timedelta(hours=4)
+    )
+    assert ids(records) == [4, 3, 2]
+    assert total == 3
+
+def test_multiple_filters_count_only_full_matches():
+    table, index = make_signals()
+    records, _, total = index.page(table, {"company_id": 2, "severity": SignalSeverity.LOW})
+    assert ids(records) == [6, 2]
+    assert total == 2
+
+def test_single_filter_total_and_none_filters_ignored():
+    table, index = make_signals()
+    records, _, total = index.page(table, {"company_id": 2, "type": None}, limit=2)
+    assert ids(records) == [6, 4]
+    assert total == 3
+
+def test_removed_records_are_skipped_and_not_counted():
+    table, index = make_signals()
+    del table[5]
+    records, next_key, total = index.page(table, limit=4)
+    assert ids(records) == [6, 4, 3, 2]
+    assert total == 5
+    records, next_key, _ = index.page(table, limit=4, after_key=next_key)
+    assert ids(records) == [1]
+    assert next_key is None
+
+def test_cursor_round_trip():
+    key = (BASE, 42)
+    assert decode_cursor(encode_cursor(key)) == key
+    assert decode_cursor(None) is None
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor("not-a-cursor")
+    assert excinfo.value.status_code == 400
+
+def test_naive_utc_converts_offsets():
+    aware = datetime.fromisoformat("2026-01-01T14:00:00+02:00")
+    assert naive_utc(aware) == BASE
+    assert naive_utc(BASE) == BASE
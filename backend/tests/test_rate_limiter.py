@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from app.rate_limiter import EndpointBudget, ExaRateLimiter, TokenBucket
+
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=50, burst=3)
+
+    async def main():
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst_done = time.monotonic() - started
+        for _ in range(2):
+            await bucket.acquire()
+        return burst_done, time.monotonic() - started
+
+    burst_done, total = asyncio.run(main())
+    assert burst_done < 0.01
+    # Two more tokens at 50/s take about 40ms
+    assert 0.03 <= total < 0.2
+
+def test_zero_rate_is_unthrottled():
+    bucket = TokenBucket(rate=0, burst=1)
+
+    async def main():
+        for _ in range(100):
+            await bucket.acquire()
+
+    started = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - started < 0.05
+
+def test_budget_caps_concurrency():
+    budget = EndpointBudget("search", rps=0, burst=1, concurrency=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with budget.slot():
+            peak = max(peak, budget.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*[call() for _ in range(6)])
+
+    asyncio.run(main())
+    assert peak == 2
+    stats = budget.stats()
+    assert stats["acquired"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait_ms"] > 0
+
+def test_cancelled_waiter_releases_its_concurrency_slot():
+    budget = EndpointBudget("answer", rps=1, burst=1, concurrency=1)
+
+    async def main():
+        async with budget.slot():
+            pass
+        # The bucket is now empty, so the next caller holds the semaphore while waiting for a token
+        waiter = asyncio.ensure_future(budget.slot().__aenter__())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        return budget._semaphore.locked()
+
+    assert asyncio.run(main()) is False
+
+def test_limiter_keeps_endpoints_independent():
+    limiter = ExaRateLimiter({
+        "search": {"rps": 0, "burst": 1, "concurrency": 1},
+        "answer": {"rps": 0, "burst": 1, "concurrency": 1}
+    })
+
+    async def answer():
+        async with limiter.slot("answer"):
+            return limiter.stats()["answer"]["in_flight"]
+
+    async def main():
+        async with limiter.slot("search"):
+            # A busy search endpoint must not block an answer call
+            return await asyncio.wait_for(answer(), timeout=0.1)
+
+    assert asyncio.run(main()) == 1
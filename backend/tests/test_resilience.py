@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.exa_cache import ExaResponseCache
+from app.exa_client import ExaClient, ExaHTTPPool
+from app.rate_limiter import ExaRateLimiter
+from app.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+def test_parse_retry_after_seconds_and_dates():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(in_a_minute) <= 60
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+def test_backoff_is_jittered_within_exponential_cap():
+    policy = RetryPolicy(max_retries=3, base_delay=0.5, max_delay=2.0)
+    assert policy.max_attempts == 4
+    for attempt, cap in ((0, 0.5), (1, 1.0), (2, 2.0), (5, 2.0)):
+        assert all(0 <= policy.backoff(attempt) <= cap for _ in range(50))
+
+def test_backoff_honours_capped_retry_after():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.1, max_retry_after=5.0)
+    assert 3.0 <= policy.backoff(0, retry_after=3.0) <= 3.1
+    assert policy.backoff(0, retry_after=60.0) == 5.0
+
+def open_breaker(monkeypatch, clock):
+    monkeypatch.setattr("app.resilience.time.monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+def test_breaker_opens_after_consecutive_failures(monkeypatch):
+    clock = [100.0]
+    breaker = open_breaker(monkeypatch, clock)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call()
+    assert excinfo.value.retry_in == pytest.approx(10.0)
+    assert breaker.stats()["rejected"] == 1
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_lets_one_probe_through(monkeypatch):
+    clock = [100.0]
+    breaker = open_breaker(monkeypatch, clock)
+    clock[0] = 111.0
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+def test_failed_probe_reopens(monkeypatch):
+    clock = [100.0]
+    breaker = open_breaker(monkeypatch, clock)
+    clock[0] = 111.0
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+def test_abandoned_probe_stops_blocking_after_reset_timeout(monkeypatch):
+    clock = [100.0]
+    breaker = open_breaker(monkeypatch, clock)
+    clock[0] = 111.0
+    breaker.before_call()
+    clock[0] = 122.0
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def exa_client(handler, breaker=None, cache=None):
+    pool = ExaHTTPPool()
+    pool._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ExaClient(
+        "test-key",
+        base_url="http://exa.test",
+        pool=pool,
+        cache=cache or ExaResponseCache(enabled=False),
+        limiter=ExaRateLimiter({"search": {"rps": 0, "burst": 1, "concurrency": 4}}),
+        retry=RetryPolicy(max_retries=2, base_delay=0, max_delay=0),
+        breaker=breaker or CircuitBreaker(failure_threshold=5)
+    )
+
+def test_client_retries_transient_status_then_succeeds():
+    statuses = [503, 429, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"results": []})
+
+    breaker = CircuitBreaker(failure_threshold=5)
+    assert asyncio.run(exa_client(handler, breaker).search("acme")) == {"results": []}
+    assert statuses == []
+    assert breaker.consecutive_failures == 0
+
+def test_client_does_not_retry_client_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, json={"error": "bad request"})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(exa_client(handler).search("acme"))
+    assert len(calls) == 1
+
+def test_open_circuit_serves_stale_copy_without_calling_exa():
+    def handler(request):
+        raise AssertionError("Exa should not be called while the circuit is open")
+
+    cache = ExaResponseCache(ttls={"search": 0})
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    client = exa_client(handler, breaker, cache)
+    cache.set("search", cache.make_key("search", {"query": "acme", "type": "auto", "numResults": 10}), {"results": ["old"]})
+    assert asyncio.run(client.search("acme")) == {"results": ["old"]}
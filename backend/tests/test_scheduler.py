@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from app.scheduler import jitter_offset, next_slot
+
+# 2026-10-14 is a Wednesday
+WEDNESDAY = datetime(2026, 10, 14, 10, 30)
+
+def test_daily_later_today_or_tomorrow():
+    assert next_slot(WEDNESDAY, "daily", time_of_day="18:00") == datetime(2026, 10, 14, 18, 0)
+    assert next_slot(WEDNESDAY, "daily", time_of_day="09:00") == datetime(2026, 10, 15, 9, 0)
+
+def test_slot_is_strictly_after():
+    at_slot = datetime(2026, 10, 14, 9, 0)
+    assert next_slot(at_slot, "daily", time_of_day="09:00") == datetime(2026, 10, 15, 9, 0)
+    assert next_slot(at_slot, "weekly", "wednesday", "09:00") == datetime(2026, 10, 21, 9, 0)
+
+def test_weekly_same_day_before_and_after_time():
+    assert next_slot(WEDNESDAY, "weekly", "wednesday", "12:00") == datetime(2026, 10, 14, 12, 0)
+    assert next_slot(WEDNESDAY, "weekly", "wednesday", "08:00") == datetime(2026, 10, 21, 8, 0)
+
+def test_weekly_other_days():
+    assert next_slot(WEDNESDAY, "weekly", "friday", "09:00") == datetime(2026, 10, 16, 9, 0)
+    assert next_slot(WEDNESDAY, "weekly", "monday", "09:00") == datetime(2026, 10, 19, 9, 0)
+
+def test_weekly_unknown_day_falls_back_to_monday():
+    assert next_slot(WEDNESDAY, "weekly", "someday", "09:00") == datetime(2026, 10, 19, 9, 0)
+
+def test_monthly_first_weekday_of_month():
+    # First Monday of November 2026 is the 2nd
+    assert next_slot(WEDNESDAY, "monthly", "monday", "09:00") == datetime(2026, 11, 2, 9, 0)
+    # First Thursday of October 2026 (the 1st) has passed
+    assert next_slot(WEDNESDAY, "monthly", "thursday", "09:00") == datetime(2026, 11, 5, 9, 0)
+
+def test_monthly_later_this_month():
+    assert next_slot(datetime(2026, 10, 1, 8, 0), "monthly", "monday", "09:00") == datetime(2026, 10, 5, 9, 0)
+
+def test_monthly_rolls_over_year():
+    # First Friday of January 2027 is the 1st
+    assert next_slot(datetime(2026, 12, 20), "monthly", "friday", "09:00") == datetime(2027, 1, 1, 9, 0)
+
+def test_jitter_is_stable_and_bounded():
+    assert jitter_offset(7, 600) == jitter_offset(7, 600)
+    assert timedelta(0) <= jitter_offset(7, 600) < timedelta(seconds=600)
+    assert jitter_offset(7, 0) == timedelta(0)
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"calls": calls}
+
+    async def main():
+        return await asyncio.gather(*[flight.do("k", work) for _ in range(5)])
+
+    results = asyncio.run(main())
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"calls": 1, "collapsed": 4, "in_flight": 0}
+
+def test_different_keys_and_later_calls_run_again():
+    flight = SingleFlight("test")
+
+    async def work():
+        await asyncio.sleep(0)
+        return 1
+
+    async def main():
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+        await flight.do("a", work)
+
+    asyncio.run(main())
+    assert flight.calls == 3
+    assert flight.collapsed == 0
+
+def test_error_reaches_every_waiter_and_is_not_kept():
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+        assert not flight.in_flight("k")
+        return results
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+def test_cancelled_caller_does_not_cancel_shared_work():
+    flight = SingleFlight("test")
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,57 @@
+from app.models import CompanySearchResult
+from app.typeahead import CompanyNameIndex, TypeaheadCache
+
+def company(name, domain, tags=()):
+    return CompanySearchResult(name=name, domains=[domain], description="", tags=list(tags))
+
+def test_typeahead_serves_prefix_of_cached_query():
+    cache = TypeaheadCache("test", ttl=60)
+    cache.set("Stripe", [{"domain": "stripe.com"}, {"domain": "stripe.dev"}], limit=2)
+    assert cache.get("  stri ", 2) == [{"domain": "stripe.com"}, {"domain": "stripe.dev"}]
+    assert cache.prefix_hits == 1
+
+def test_typeahead_prefix_needs_enough_hits():
+    cache = TypeaheadCache("test", ttl=60)
+    cache.set("stripe", [{"domain": "stripe.com"}], limit=5)
+    assert cache.get("stri", 5) is None
+    assert cache.get("stripe", 5) == [{"domain": "stripe.com"}]
+
+def test_typeahead_expires_and_evicts():
+    cache = TypeaheadCache("test", ttl=0)
+    cache.set("stripe", [{"domain": "stripe.com"}], limit=1)
+    assert cache.get("stripe", 1) is None
+    cache = TypeaheadCache("test", ttl=60, max_entries=1)
+    cache.set("stripe", [], limit=1)
+    cache.set("slack", [], limit=1)
+    assert cache.evictions == 1
+    assert cache.stats()["entries"] == 1
+
+def test_index_prefix_and_fuzzy_matches():
+    index = CompanyNameIndex()
+    index.add(company("Stripe", "stripe.com"))
+    index.add(company("Slack", "slack.com"))
+    assert [r.name for r in index.search("str", 5)] == ["Stripe"]
+    assert [r.name for r in index.search("strpie", 5)] == ["Stripe"]
+
+def test_watchlist_entry_replaces_and_outranks_search_result():
+    index = CompanyNameIndex()
+    index.add(company("Stripe", "stripe.com", ["search-result"]))
+    index.add(company("Stripe Docs", "stripe.dev", ["search-result"]))
+    assert index.add(company("Stripe", "stripe.com", ["watchlist"]), watchlist=True)
+    assert not index.add(company("Other", "stripe.com"))
+    results = index.search("stripe", 5)
+    assert [r.tags for r in results] == [["watchlist"], ["search-result"]]
+
+def test_index_company_replaces_renamed_entry():
+    index = CompanyNameIndex()
+    index.index_company(1, company("Acme", "acme.io"))
+    index.index_company(1, company("Zenith", "zenith.dev"))
+    assert index.search("acme", 5) == []
+    assert [r.name for r in index.search("zen", 5)] == ["Zenith"]
+    assert index.stats()["entries"] == 1
+
+def test_full_index_keeps_watchlist_entries():
+    index = CompanyNameIndex(max_entries=1)
+    assert index.add(company("Stripe", "stripe.com"))
+    assert not index.add(company("Slack", "slack.com"))
+    assert index.add(company("Slack", "slack.com"), watchlist=True)
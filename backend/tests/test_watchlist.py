@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime
+
+from app.main import WatchlistLimits, crawl_vendor_watch
+from app.models import Company, VendorWatch
+
+WATERMARK = datetime(2026, 10, 1, 9, 0)
+
+class FakeExa:
+    """Exa stand-in whose searches return ``urls``; failing calls raise"""
+
+    def __init__(self, urls=(), fail_search=False, fail_answer=False, fail_pages=False, fail_queries=()):
+        self.urls = list(urls)
+        self.fail_search = fail_search
+        self.fail_pages = fail_pages
+        self.fail_answer = fail_answer
+        self.fail_queries = fail_queries
+        self.search_dates = []
+        self.answered = []
+
+    async def search(self, query, start_published_date=None, **kwargs):
+        self.search_dates.append(start_published_date)
+        if self.fail_search or any(part in query for part in self.fail_queries):
+            raise RuntimeError("Exa unavailable")
+        return {"results": [{"url": url} for url in self.urls]}
+
+    async def answer(self, query, urls, **kwargs):
+        if self.fail_answer:
+            raise RuntimeError("Exa unavailable")
+        self.answered.append(list(urls))
+        return {"answer": "Launched a feature", "citations": [{"url": urls[0], "snippet": "New"}]}
+
+    async def get_contents(self, ids, **kwargs):
+        if self.fail_search or self.fail_pages:
+            raise RuntimeError("Exa unavailable")
+        return {"results": []}
+
+def crawl(exa, watch, incremental=True):
+    company = Company(id=9001, name="Acme", domains=["acme.example"])
+    limits = WatchlistLimits(asyncio.Semaphore(4), 2)
+    return asyncio.run(crawl_vendor_watch(exa, company, watch, limits, incremental))
+
+def make_watch(**kwargs):
+    kwargs.setdefault("include_paths", [])
+    return VendorWatch(id=1, company_id=9001, last_run_at=WATERMARK, **kwargs)
+
+def test_success_advances_watermark_and_records_urls():
+    watch = make_watch()
+    exa = FakeExa(urls=["https://acme.example/a", "https://acme.example/b"])
+    result = crawl(exa, watch)
+    assert result["error"] is None
+    assert set(exa.search_dates) == {WATERMARK.isoformat()}
+    assert watch.last_run_at > WATERMARK
+    assert sorted(watch.processed_urls) == ["https://acme.example/a", "https://acme.example/b"]
+
+def test_processed_urls_skip_the_answer():
+    watch = make_watch(processed_urls=["https://acme.example/a"])
+    exa = FakeExa(urls=["https://acme.example/a"])
+    result = crawl(exa, watch)
+    assert result["answer_skipped"]
+    assert exa.answered == []
+    assert watch.last_run_at > WATERMARK
+
+def test_all_searches_failing_keeps_watermark():
+    watch = make_watch(processed_urls=["https://acme.example/a"])
+    result = crawl(FakeExa(fail_search=True), watch)
+    assert result["urls_found"] == 0
+    assert result["error"] == "5 of 5 searches failed"
+    assert watch.last_run_at == WATERMARK
+    assert watch.processed_urls == ["https://acme.example/a"]
+
+def test_one_failed_search_keeps_watermark():
+    watch = make_watch()
+    exa = FakeExa(urls=["https://acme.example/a"], fail_queries=("pricing",))
+    result = crawl(exa, watch)
+    assert result["error"] == "1 of 5 searches failed"
+    assert watch.last_run_at == WATERMARK
+    assert watch.processed_urls == []
+
+def test_failed_answer_keeps_watermark():
+    watch = make_watch()
+    result = crawl(FakeExa(urls=["https://acme.example/a"], fail_answer=True), watch)
+    assert result["error"] == "Answer step failed"
+    assert watch.last_run_at == WATERMARK
+    assert watch.processed_urls == []
+
+def test_full_crawl_ignores_watermark():
+    watch = make_watch(processed_urls=["https://acme.example/a"])
+    exa = FakeExa(urls=["https://acme.example/a"])
+    crawl(exa, watch, incremental=False)
+    assert set(exa.search_dates) == {None}
+    assert exa.answered == [["https://acme.example/a"]]
+
+def test_failed_page_check_keeps_watermark():
+    watch = make_watch(include_paths=["/pricing"])
+    result = crawl(FakeExa(urls=["https://acme.example/a"], fail_pages=True), watch)
+    assert result["error"] == "Watched page check failed"
+    assert watch.last_run_at == WATERMARK
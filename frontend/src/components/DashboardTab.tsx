@@ -19,19 +19,6 @@ interface DashboardStats {
   lastUpdate: string
 }
 
-interface Signal {
-  id: number
-  company_id: number
-  type: string
-  title: string
-  summary: string
-  severity: string
-  confidence: number
-  urls: string[]
-  citations?: string[]
-  created_at: string
-}
-
 
 const DashboardTab = () => {
   const [stats, setStats] = useState<DashboardStats>({
@@ -50,9 +37,13 @@ const DashboardTab = () => {
 
   const fetchDashboardStats = async () => {
     try {
-      const [vendorsResponse, signalsResponse] = await Promise.all([
+      // Signals only need counting, so ask for one row and read X-Total-Count
+      const sevenDaysAgo = new Date()
+      sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7)
+      const [vendorsResponse, signalsResponse, recentResponse] = await Promise.all([
         fetch(`${API_BASE}/vendors`),
-        fetch(`${API_BASE}/signals`)
+        fetch(`${API_BASE}/signals?limit=1`),
+        fetch(`${API_BASE}/signals?limit=1&created_after=${encodeURIComponent(sevenDaysAgo.toISOString())}`)
       ])
 
       if (vendorsResponse.ok) {
@@ -64,21 +55,11 @@ const DashboardTab = () => {
         }))
       }
 
-      if (signalsResponse.ok) {
-        const signalsData = await signalsResponse.json()
-        
-        // Calculate recent alerts (signals from last 7 days)
-        const sevenDaysAgo = new Date()
-        sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7)
-        
-        const recentSignals = signalsData.filter((signal: Signal) => 
-          new Date(signal.created_at) > sevenDaysAgo
-        )
-        
+      if (signalsResponse.ok && recentResponse.ok) {
         setStats(prev => ({
           ...prev,
-          totalSignals: signalsData.length,
-          recentAlerts: recentSignals.length
+          totalSignals: Number(signalsResponse.headers.get('X-Total-Count') ?? 0),
+          recentAlerts: Number(recentResponse.headers.get('X-Total-Count') ?? 0)
         }))
       }
     } catch (error) {
@@ -235,6 +235,54 @@ const WatchlistTab = () => {
     }
   }
 
+  // Resolves with the finished job; follows the job's event stream and falls back to polling
+  const waitForWatchlistJob = (jobId: string): Promise<any> => new Promise((resolve, reject) => {
+    const isFinished = (job: any) => job && (job.status === 'completed' || job.status === 'failed')
+    let settled = false
+    const settle = (job: any) => {
+      if (!settled) {
+        settled = true
+        resolve(job)
+      }
+    }
+
+    const poll = async () => {
+      try {
+        const response = await fetch(`${API_BASE}/run/watchlist/jobs/${jobId}`)
+        if (!response.ok) {
+          throw new Error(`Failed to fetch watchlist job ${jobId}`)
+        }
+        const job = await response.json()
+        if (isFinished(job)) {
+          settle(job)
+        } else {
+          setTimeout(poll, 2000)
+        }
+      } catch (error) {
+        settled = true
+        reject(error)
+      }
+    }
+
+    const source = new EventSource(`${API_BASE}/run/watchlist/jobs/${jobId}/events`)
+    const onEvent = (event: MessageEvent) => {
+      const { job } = JSON.parse(event.data)
+      if (isFinished(job)) {
+        source.close()
+        settle(job)
+      }
+    }
+    for (const name of ['snapshot', 'completed', 'failed']) {
+      source.addEventListener(name, onEvent as EventListener)
+    }
+    source.onerror = () => {
+      source.close()
+      if (!settled) {
+        poll()
+      }
+    }
+  })
+
   const runCompanyWatchlist = async (companyId: number) => {
     console.log(`DEBUG: Starting runCompanyWatchlist for company ID: ${companyId}`)
     setCompanyLoading(prev => ({...prev, [companyId]: true}))
@@ -256,7 +304,19 @@ const WatchlistTab = () => {
       })
 
       if (response.ok) {
-        const result = await response.json()
+        // The crawl runs as a background job; wait for it, then fetch its stored results
+        const job = await response.json()
+        const finishedJob = await waitForWatchlistJob(job.id)
+        if (finishedJob.status === 'failed') {
+          alert(`Watchlist run failed: ${finishedJob.error || 'Unknown error'}`)
+          return
+        }
+
+        const resultsResponse = await fetch(`${API_BASE}/run/watchlist/jobs/${job.id}/results`)
+        if (!resultsResponse.ok) {
+          throw new Error(`Failed to fetch results for watchlist job ${job.id}`)
+        }
+        const result = await resultsResponse.json()
         console.log('Company watchlist run result:', result)
         
         // Extract the actual results from the response